@@ -1,5 +1,5 @@
 """Configuration management for Canvas-Outlook sync."""
 
-from .settings import Settings, load_settings
+from .settings import Settings, get_settings, load_settings
 
-__all__ = ["Settings", "load_settings"]
+__all__ = ["Settings", "get_settings", "load_settings"]
@@ -8,6 +8,7 @@ Never log or expose tokens in any output.
 import os
 import logging
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -19,7 +20,7 @@ class ConfigurationError(Exception):
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CanvasConfig:
     """Canvas LMS configuration."""
     base_url: str
@@ -39,7 +40,7 @@ class CanvasConfig:
         return f"CanvasConfig(base_url='{self.base_url}', access_token='***REDACTED***')"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MicrosoftConfig:
     """Microsoft Graph API configuration."""
     client_id: str
@@ -62,17 +63,19 @@ class MicrosoftConfig:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SyncConfig:
     """Sync engine configuration."""
     task_list_name: str = "Canvas Assignments"
     dry_run: bool = False
     max_retries: int = 3
     retry_delay_seconds: float = 1.0
+    max_backoff_seconds: float = 60.0
     batch_size: int = 50
+    max_workers: int = 8
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StorageConfig:
     """Persistent storage configuration."""
     database_path: Path = field(default_factory=lambda: Path("data/sync_state.db"))
@@ -82,7 +85,7 @@ class StorageConfig:
         object.__setattr__(self, 'database_path', Path(self.database_path))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
     """
     Application settings container.
@@ -107,8 +110,100 @@ class Settings:
         )
 
 
+# Every environment variable read by load_settings()
+_ENV_VARS = (
+    "CANVAS_BASE_URL",
+    "CANVAS_ACCESS_TOKEN",
+    "MICROSOFT_CLIENT_ID",
+    "MICROSOFT_TENANT_ID",
+    "MICROSOFT_REDIRECT_URI",
+    "MICROSOFT_TOKEN_CACHE",
+    "SYNC_TASK_LIST_NAME",
+    "SYNC_DRY_RUN",
+    "SYNC_MAX_RETRIES",
+    "SYNC_RETRY_DELAY",
+    "SYNC_MAX_BACKOFF",
+    "SYNC_MAX_WORKERS",
+    "STORAGE_DATABASE_PATH",
+    "LOG_LEVEL",
+)
 
-def load_settings(env_file: Optional[Path] = None) -> Settings:
+# Parsed .env files keyed by path: (st_mtime_ns, values)
+_ENV_FILE_CACHE: dict[str, tuple[int, dict[str, str]]] = {}
+
+
+def _parse_env_file(path: Path) -> dict[str, str]:
+    """
+    Parse a .env file into a dictionary.
+    
+    Supports ``KEY=value`` lines, an optional ``export`` prefix,
+    single/double quoted values, blank lines and ``#`` comments.
+    
+    Args:
+        path: Path to .env file
+        
+    Returns:
+        Mapping of variable names to values
+    """
+    values: dict[str, str] = {}
+    
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        
+        if line.startswith("export "):
+            line = line[len("export "):].lstrip()
+        
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        
+        key = key.strip()
+        value = value.strip()
+        
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in ("'", '"'):
+            value = value[1:-1]
+        elif " #" in value:
+            # Strip inline comments from unquoted values
+            value = value.split(" #", 1)[0].rstrip()
+        
+        if key:
+            values[key] = value
+    
+    return values
+
+
+def _load_env_file(path: Path) -> None:
+    """
+    Load variables from a .env file into os.environ.
+    
+    Existing environment variables take precedence and are never
+    overwritten. A missing file is silently ignored. Parsed contents
+    are cached and reused until the file's mtime changes.
+    
+    Args:
+        path: Path to .env file
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return
+    
+    cache_key = str(path)
+    cached = _ENV_FILE_CACHE.get(cache_key)
+    
+    if cached is not None and cached[0] == mtime_ns:
+        values = cached[1]
+    else:
+        values = _parse_env_file(path)
+        _ENV_FILE_CACHE[cache_key] = (mtime_ns, values)
+    
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+
+def _load_settings_uncached(env_file: Optional[Path] = None) -> Settings:
     """
     Load settings from environment variables.
     
@@ -123,41 +218,44 @@ def load_settings(env_file: Optional[Path] = None) -> Settings:
     Raises:
         ConfigurationError: If required configuration is missing
     """
-    # Load .env file using python-dotenv
-    from dotenv import load_dotenv
+    env_path = env_file or Path(".env")
     
-    if env_file:
-        logger.debug(f"Loading environment from {env_file}")
-        load_dotenv(env_file)
+    if all(name in os.environ for name in _ENV_VARS):
+        logger.debug("All settings present in environment, skipping .env file")
     else:
-        logger.debug("Loading environment from .env")
-        load_dotenv()
+        logger.debug("Loading environment from %s", env_path)
+        _load_env_file(env_path)
+    
+    # Snapshot the environment once; plain dict lookups are cheaper than os.getenv
+    env = dict(os.environ)
     
     try:
         canvas = CanvasConfig(
-            base_url=os.getenv("CANVAS_BASE_URL", "").rstrip("/"),
-            access_token=os.getenv("CANVAS_ACCESS_TOKEN", ""),
+            base_url=env.get("CANVAS_BASE_URL", "").rstrip("/"),
+            access_token=env.get("CANVAS_ACCESS_TOKEN", ""),
         )
         
         microsoft = MicrosoftConfig(
-            client_id=os.getenv("MICROSOFT_CLIENT_ID", ""),
-            tenant_id=os.getenv("MICROSOFT_TENANT_ID", ""),
-            redirect_uri=os.getenv("MICROSOFT_REDIRECT_URI", "http://localhost:8400"),
-            token_cache_path=Path(os.getenv("MICROSOFT_TOKEN_CACHE", "data/token_cache.json")),
+            client_id=env.get("MICROSOFT_CLIENT_ID", ""),
+            tenant_id=env.get("MICROSOFT_TENANT_ID", ""),
+            redirect_uri=env.get("MICROSOFT_REDIRECT_URI", "http://localhost:8400"),
+            token_cache_path=Path(env.get("MICROSOFT_TOKEN_CACHE", "data/token_cache.json")),
         )
         
         sync = SyncConfig(
-            task_list_name=os.getenv("SYNC_TASK_LIST_NAME", "Canvas Assignments"),
-            dry_run=os.getenv("SYNC_DRY_RUN", "false").lower() == "true",
-            max_retries=int(os.getenv("SYNC_MAX_RETRIES", "3")),
-            retry_delay_seconds=float(os.getenv("SYNC_RETRY_DELAY", "1.0")),
+            task_list_name=env.get("SYNC_TASK_LIST_NAME", "Canvas Assignments"),
+            dry_run=env.get("SYNC_DRY_RUN", "false").lower() == "true",
+            max_retries=int(env.get("SYNC_MAX_RETRIES", "3")),
+            retry_delay_seconds=float(env.get("SYNC_RETRY_DELAY", "1.0")),
+            max_backoff_seconds=float(env.get("SYNC_MAX_BACKOFF", "60.0")),
+            max_workers=int(env.get("SYNC_MAX_WORKERS", "8")),
         )
         
         storage = StorageConfig(
-            database_path=Path(os.getenv("STORAGE_DATABASE_PATH", "data/sync_state.db")),
+            database_path=Path(env.get("STORAGE_DATABASE_PATH", "data/sync_state.db")),
         )
         
-        log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+        log_level = env.get("LOG_LEVEL", "INFO").upper()
         
         settings = Settings(
             canvas=canvas,
@@ -168,7 +266,7 @@ def load_settings(env_file: Optional[Path] = None) -> Settings:
         )
         
         logger.info("Configuration loaded successfully")
-        logger.debug(f"Settings: {settings}")
+        logger.debug("Settings: %s", settings)
         
         return settings
         
@@ -176,3 +274,27 @@ def load_settings(env_file: Optional[Path] = None) -> Settings:
         raise
     except Exception as e:
         raise ConfigurationError(f"Failed to load configuration: {e}") from e
+
+
+@lru_cache(maxsize=None)
+def get_settings(env_file: Optional[Path] = None) -> Settings:
+    """
+    Load settings once per env file and reuse them for the process lifetime.
+    
+    Repeated calls return the same Settings instance without re-reading
+    the .env file or the environment. Call ``get_settings.cache_clear()``
+    to force a reload (e.g. in tests that modify environment variables).
+    
+    Args:
+        env_file: Optional path to .env file
+        
+    Returns:
+        Configured Settings instance
+        
+    Raises:
+        ConfigurationError: If required configuration is missing
+    """
+    return _load_settings_uncached(env_file)
+
+
+load_settings = get_settings
@@ -5,27 +5,64 @@ Handles authentication, pagination, and error handling for Canvas API.
 All tokens are passed via configuration and never logged.
 """
 
+import json
 import logging
+import re
 import time
-from typing import Iterator, Optional
-from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, Mapping, Optional
 
-import requests
-from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+import urllib3
 from urllib3.util.retry import Retry
 
-from .models import Assignment, Course, Submission
+from ..http_utils import parse_retry_after
+from .models import Assignment, Course, CourseAssignments, Submission
 
 logger = logging.getLogger(__name__)
 
+# Extracts the URL of the rel="next" entry from a Link header
+_NEXT_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="next"')
+
+
+def _course_etag(course: Course, etag: Optional[str]) -> Optional[str]:
+    """
+    Tie an assignments ETag to the course name it was fetched under.
+    
+    Assignment titles include the course name, which the assignments
+    ETag does not cover; a renamed course must be fetched in full.
+    """
+    return json.dumps([course.name, etag]) if etag else None
+
+
+def _etag_for_course(course: Course, stored: Optional[str]) -> Optional[str]:
+    """Return the ETag inside a _course_etag value, or None if the course was renamed."""
+    if not stored:
+        return None
+    try:
+        name, etag = json.loads(stored)
+    except (ValueError, TypeError):
+        return None
+    return etag if name == course.name else None
+
 
 class CanvasAPIError(Exception):
     """Raised when Canvas API returns an error."""
     
-    def __init__(self, message: str, status_code: Optional[int] = None, response: Optional[dict] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        response: Optional[dict] = None,
+        retry_after: Optional[float] = None,
+    ):
         super().__init__(message)
         self.status_code = status_code
         self.response = response
+        # Seconds the server asked us to wait (Retry-After), if any
+        self.retry_after = retry_after
 
 
 class CanvasClient:
@@ -50,6 +87,26 @@ class CanvasClient:
     COURSES_ENDPOINT = "/api/v1/courses"
     ASSIGNMENTS_ENDPOINT = "/api/v1/courses/{course_id}/assignments"
     SUBMISSION_ENDPOINT = "/api/v1/courses/{course_id}/assignments/{assignment_id}/submissions/self"
+    SUBMISSIONS_ENDPOINT = "/api/v1/courses/{course_id}/students/submissions"
+    
+    # Assignment IDs per bulk submissions request (keeps query strings short)
+    SUBMISSIONS_BATCH_SIZE = 100
+    
+    # Default wait when rate limited without a Retry-After hint
+    RATE_LIMIT_WAIT_SECONDS = 10.0
+    
+    # Canvas' request-cost bucket (X-Rate-Limit-Remaining) refills over
+    # time. Below this many units, concurrent course fetches pause before
+    # each request, longer the emptier it is, instead of running it dry.
+    RATE_LIMIT_LOW_WATER = 100.0
+    RATE_LIMIT_PAUSE_SECONDS = 1.0
+    
+    # Headers shared by every client; only Authorization varies
+    _STATIC_HEADERS = {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+        "Accept-Encoding": "gzip, deflate",
+    }
     
     def __init__(
         self,
@@ -57,6 +114,8 @@ class CanvasClient:
         access_token: str,
         timeout: float = 30.0,
         max_retries: int = 3,
+        max_workers: int = 8,
+        courses_cache_ttl_seconds: float = 300.0,
     ):
         """
         Initialize Canvas client.
@@ -66,38 +125,119 @@ class CanvasClient:
             access_token: Personal Access Token (never logged)
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for transient failures
+            max_workers: Maximum courses fetched concurrently
+            courses_cache_ttl_seconds: How long get_active_courses() results
+                are reused (0 disables caching)
         """
         self.base_url = base_url.rstrip("/")
         self._access_token = access_token  # Private, never logged
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_workers = max(1, max_workers)
+        
+        # Per-course assignment endpoints, built once per course
+        self._assignments_endpoints: dict[int, str] = {}
+        
+        # Last X-Rate-Limit-Remaining seen; shared by all worker threads
+        self._rate_limit_remaining: Optional[float] = None
         
-        # Configure session with retry logic
-        self._session = requests.Session()
+        # (monotonic fetch time, courses) from the last get_active_courses()
+        self.courses_cache_ttl_seconds = courses_cache_ttl_seconds
+        self._courses_cache: Optional[tuple[float, list[Course]]] = None
         
         retry_strategy = Retry(
             total=max_retries,
-            backoff_factor=1,
+            backoff_factor=0.5,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET"],
+            # Hand back the last response so it is reported like any other error
+            raise_on_status=False,
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self._session.mount("https://", adapter)
-        self._session.mount("http://", adapter)
+        # Headers never vary per request, so talk to urllib3 directly instead
+        # of paying for requests' per-call header/cookie merging. The pool is
+        # sized so concurrent course fetches reuse connections.
+        headers = dict(self._STATIC_HEADERS)
+        headers["Authorization"] = f"Bearer {self._access_token}"
+        pool_kwargs = {
+            "num_pools": 4,
+            "maxsize": self.max_workers,
+            "retries": retry_strategy,
+            "headers": headers,
+        }
         
-        # Set default headers
-        self._session.headers.update({
-            "Authorization": f"Bearer {self._access_token}",
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        })
+        # Keep honoring HTTPS_PROXY and NO_PROXY like requests did
+        proxy_url = getproxies().get("https")
+        if proxy_url and not proxy_bypass(urlsplit(self.base_url).netloc):
+            self._pool = urllib3.ProxyManager(proxy_url, **pool_kwargs)
+        else:
+            self._pool = urllib3.PoolManager(**pool_kwargs)
         
-        logger.info(f"Canvas client initialized for {self.base_url}")
+        logger.info("Canvas client initialized for %s", self.base_url)
     
     def __repr__(self) -> str:
         """Never expose token in repr."""
         return f"CanvasClient(base_url='{self.base_url}')"
     
+    def _url(self, endpoint: str) -> str:
+        """
+        Build an absolute URL for an API endpoint.
+        
+        base_url is already stripped of trailing slashes and endpoints
+        always start with "/", so plain concatenation is sufficient.
+        """
+        return self.base_url + endpoint
+    
+    def _assignments_endpoint(self, course_id: int) -> str:
+        """Return the (cached) assignments endpoint for a course."""
+        endpoint = self._assignments_endpoints.get(course_id)
+        if endpoint is None:
+            endpoint = self.ASSIGNMENTS_ENDPOINT.format(course_id=course_id)
+            self._assignments_endpoints[course_id] = endpoint
+        return endpoint
+    
+    def _get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> urllib3.response.HTTPResponse:
+        """
+        Issue a GET request through the connection pool.
+        
+        Pauses first while the last seen rate-limit budget is low.
+        
+        Args:
+            url: Absolute URL
+            params: Query parameters (list values are repeated)
+            headers: Extra headers, added to the pool's default headers
+            
+        Returns:
+            Response with its body already read
+        """
+        if params:
+            separator = "&" if "?" in url else "?"
+            url = f"{url}{separator}{urlencode(params, doseq=True)}"
+        if headers:
+            # Per-request headers replace the pool's rather than extend them
+            headers = {**self._pool.headers, **headers}
+        
+        remaining = self._rate_limit_remaining
+        if remaining is not None and remaining < self.RATE_LIMIT_LOW_WATER:
+            pause = self.RATE_LIMIT_PAUSE_SECONDS * (1 - remaining / self.RATE_LIMIT_LOW_WATER)
+            logger.debug("Canvas rate limit low (%.0f left), pausing %.2fs", remaining, pause)
+            time.sleep(pause)
+        
+        response = self._pool.request("GET", url, headers=headers, timeout=self.timeout)
+        
+        header = response.headers.get("X-Rate-Limit-Remaining")
+        if header:
+            try:
+                self._rate_limit_remaining = float(header)
+            except ValueError:
+                pass
+        return response
+    
     def _make_request(
         self,
         endpoint: str,
@@ -118,103 +258,208 @@ class CanvasClient:
         Raises:
             CanvasAPIError: If request fails
         """
-        url = urljoin(self.base_url, endpoint)
+        url = self._url(endpoint)
         
         try:
-            response = self._session.get(
-                url,
-                params=params,
-                timeout=self.timeout,
-            )
-            
-            # Handle rate limiting
-            if response.status_code == 403:
-                rate_limit_remaining = response.headers.get("X-Rate-Limit-Remaining")
-                if rate_limit_remaining and float(rate_limit_remaining) < 1:
-                    logger.warning("Rate limited, waiting before retry...")
-                    time.sleep(10)
-                    return self._make_request(endpoint, params)
-            
-            response.raise_for_status()
-            return response.json()
+            attempt = 0
+            while True:
+                response = self._get(url, params)
+                
+                # Handle rate limiting with a bounded loop rather than recursion
+                delay = self._rate_limit_delay(response)
+                if delay is None or attempt >= self.max_retries:
+                    break
+                
+                attempt += 1
+                logger.warning("Rate limited, waiting %.1fs before retry...", delay)
+                time.sleep(delay)
+                # The bucket refilled while waiting; don't pause again
+                self._rate_limit_remaining = None
             
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"Canvas API error: {e}"
-            try:
-                error_body = e.response.json()
-                if "errors" in error_body:
-                    error_msg = f"Canvas API error: {error_body['errors']}"
-            except (ValueError, AttributeError):
-                pass
+            # Branch on status instead of raise_for_status() so error
+            # responses don't pay for raising and catching HTTPError
+            if response.status >= 400:
+                raise self._error_from_response(response)
             
-            logger.error(error_msg)
-            raise CanvasAPIError(
-                error_msg,
-                status_code=e.response.status_code if e.response else None,
-            ) from e
+            return json.loads(response.data)
             
-        except requests.exceptions.RequestException as e:
+        except (urllib3.exceptions.HTTPError, ValueError) as e:
             error_msg = f"Canvas request failed: {e}"
             logger.error(error_msg)
             raise CanvasAPIError(error_msg) from e
     
-    def _paginate(
+    def _rate_limit_delay(self, response: urllib3.response.HTTPResponse) -> Optional[float]:
+        """
+        Determine whether a response signals Canvas rate limiting.
+        
+        Canvas reports throttling as 403 with X-Rate-Limit-Remaining
+        exhausted. Honors Retry-After when present.
+        
+        Args:
+            response: Response to inspect
+            
+        Returns:
+            Seconds to wait before retrying, or None if not rate limited
+        """
+        if response.status != 403:
+            return None
+        
+        remaining = response.headers.get("X-Rate-Limit-Remaining")
+        if not remaining or float(remaining) >= 1:
+            return None
+        
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return max(0.1, retry_after)
+        
+        return self.RATE_LIMIT_WAIT_SECONDS
+    
+    def _error_from_response(self, response: urllib3.response.HTTPResponse) -> CanvasAPIError:
+        """
+        Build a CanvasAPIError from an unsuccessful response.
+        
+        Uses the "errors" field of the response body when present.
+        
+        Args:
+            response: Response with a 4xx/5xx status code
+            
+        Returns:
+            CanvasAPIError carrying the status code and error body
+        """
+        error_msg = f"Canvas API error: {response.status} {response.reason}"
+        error_body = None
+        
+        # A revoked token or lost enrollment may mean the cached course list
+        # is no longer valid; other 4xx (a missing submission, a rejected
+        # parameter) say nothing about it
+        if response.status in (401, 403):
+            self.invalidate_courses_cache()
+        
+        try:
+            error_body = json.loads(response.data)
+            if isinstance(error_body, dict) and "errors" in error_body:
+                error_msg = f"Canvas API error: {error_body['errors']}"
+        except ValueError:
+            pass
+        
+        logger.error(error_msg)
+        return CanvasAPIError(
+            error_msg,
+            status_code=response.status,
+            response=error_body if isinstance(error_body, dict) else None,
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+        )
+    
+    def _iter_pages(
         self,
         endpoint: str,
         params: Optional[dict] = None,
-    ) -> Iterator[dict]:
+        headers: Optional[dict] = None,
+    ) -> Iterator[tuple[int, Mapping[str, str], Any]]:
         """
-        Handle Canvas API pagination.
+        Fetch the pages of a paginated endpoint.
         
         Canvas uses Link headers for pagination.
         
         Args:
             endpoint: API endpoint
             params: Query parameters
+            headers: Extra headers for the first request only
             
         Yields:
-            Individual items from paginated response
+            (status, response headers, parsed body) per page. A 304 Not
+            Modified first page is yielded with a None body and ends
+            the iteration.
+            
+        Raises:
+            CanvasAPIError: If a page request fails
         """
         params = params or {}
         params.setdefault("per_page", 100)  # Max allowed
         
-        url = urljoin(self.base_url, endpoint)
+        url = self._url(endpoint)
+        # Only the first request carries params; next links already include them
+        is_first = True
         
         while url:
             try:
-                response = self._session.get(
-                    url,
-                    params=params if url == urljoin(self.base_url, endpoint) else None,
-                    timeout=self.timeout,
-                )
-                response.raise_for_status()
+                if is_first:
+                    response = self._get(url, params, headers)
+                    is_first = False
+                else:
+                    response = self._get(url)
                 
-                data = response.json()
+                if response.status == 304:
+                    yield response.status, response.headers, None
+                    return
                 
-                if isinstance(data, list):
-                    yield from data
-                else:
-                    yield data
+                if response.status >= 400:
+                    raise self._error_from_response(response)
+                
+                data = json.loads(response.data)
                 
-                # Get next page from Link header
-                url = None
-                link_header = response.headers.get("Link", "")
-                for link in link_header.split(","):
-                    if 'rel="next"' in link:
-                        url = link.split(";")[0].strip(" <>")
-                        break
-                        
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Pagination request failed: {e}")
+                # Get next page from Link header, then drop the raw body so it
+                # isn't kept alive alongside the parsed page while yielding
+                status, response_headers = response.status, response.headers
+                match = _NEXT_LINK_RE.search(response_headers.get("Link", ""))
+                url = match.group(1) if match else None
+                response.close()
+                del response
+                
+            except (urllib3.exceptions.HTTPError, ValueError) as e:
+                logger.error("Pagination request failed: %s", e)
                 raise CanvasAPIError(f"Pagination failed: {e}") from e
+            
+            yield status, response_headers, data
+    
+    def _paginate(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+    ) -> Iterator[dict]:
+        """
+        Handle Canvas API pagination.
+        
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            
+        Yields:
+            Individual items from paginated response
+        """
+        is_list: Optional[bool] = None
+        
+        for _, _, data in self._iter_pages(endpoint, params):
+            # Every page of an endpoint has the same shape, so check it once
+            if is_list is None:
+                is_list = isinstance(data, list)
+            
+            if is_list:
+                yield from data
+            else:
+                yield data
+    
+    def invalidate_courses_cache(self) -> None:
+        """Forget the cached get_active_courses() result."""
+        self._courses_cache = None
     
     def get_active_courses(self) -> list[Course]:
         """
         Fetch all active courses for the current user.
         
+        Results are reused for courses_cache_ttl_seconds, so health
+        checks, course listing and sync share one fetch per run.
+        
         Returns:
             List of active Course objects
         """
+        cached = self._courses_cache
+        if cached is not None:
+            fetched_at, courses = cached
+            if time.monotonic() - fetched_at < self.courses_cache_ttl_seconds:
+                logger.debug("Using cached course list (%d courses)", len(courses))
+                return list(courses)
+        
         logger.info("Fetching active courses...")
         
         courses = []
@@ -225,12 +470,15 @@ class CanvasClient:
             try:
                 course = Course.from_api_response(course_data)
                 courses.append(course)
-                logger.debug(f"Found course: {course.name} (ID: {course.id})")
+                logger.debug("Found course: %s (ID: %s)", course.name, course.id)
             except (KeyError, ValueError) as e:
-                logger.warning(f"Skipping malformed course data: {e}")
+                logger.warning("Skipping malformed course data: %s", e)
                 continue
         
-        logger.info(f"Found {len(courses)} active courses")
+        logger.info("Found %d active courses", len(courses))
+        
+        if self.courses_cache_ttl_seconds > 0:
+            self._courses_cache = (time.monotonic(), list(courses))
         return courses
     
     def get_assignments(self, course: Course) -> list[Assignment]:
@@ -243,19 +491,81 @@ class CanvasClient:
         Returns:
             List of Assignment objects with submission status
         """
-        logger.info(f"Fetching assignments for course: {course.name}")
+        logger.info("Fetching assignments for course: %s", course.name)
+        
+        return self._parse_assignments(
+            course,
+            self._paginate(
+                self._assignments_endpoint(course.id),
+                params={"include[]": "submission"},
+            ),
+        )
+    
+    def get_assignments_if_changed(
+        self,
+        course: Course,
+        etag: Optional[str] = None,
+    ) -> CourseAssignments:
+        """
+        Fetch a course's assignments unless they match a previous ETag.
         
-        endpoint = self.ASSIGNMENTS_ENDPOINT.format(course_id=course.id)
+        The ETag is sent as If-None-Match, so an unchanged course costs
+        a 304 without a body. Only a single-page response gets an ETag
+        to reuse: the first page's ETag says nothing about later pages.
+        The returned ETag also records the course name, so a renamed
+        course is fetched in full and its task titles are updated.
         
-        assignments = []
-        for assignment_data in self._paginate(
-            endpoint,
+        Args:
+            course: Course to fetch assignments for
+            etag: ETag from a previous CourseAssignments, if any
+            
+        Returns:
+            CourseAssignments; its assignments are None if unchanged
+        """
+        logger.info("Fetching assignments for course: %s", course.name)
+        
+        items: list[dict] = []
+        new_etag = None
+        if_none_match = _etag_for_course(course, etag)
+        
+        for page, (status, headers, data) in enumerate(self._iter_pages(
+            self._assignments_endpoint(course.id),
             params={"include[]": "submission"},
-        ):
+            headers={"If-None-Match": if_none_match} if if_none_match else None,
+        )):
+            if status == 304:
+                logger.info("Assignments unchanged for course: %s", course.name)
+                return CourseAssignments(course, None, etag)
+            
+            new_etag = headers.get("ETag") if page == 0 else None
+            if isinstance(data, list):
+                items.extend(data)
+            else:
+                items.append(data)
+        
+        return CourseAssignments(
+            course,
+            self._parse_assignments(course, items),
+            _course_etag(course, new_etag),
+        )
+    
+    def _parse_assignments(self, course: Course, items: Iterable[dict]) -> list[Assignment]:
+        """
+        Build Assignments from raw assignment data, skipping unusable items.
+        
+        Args:
+            course: Course the assignments belong to
+            items: Assignment objects from the assignments endpoint
+            
+        Returns:
+            Published, well-formed assignments with submission status
+        """
+        assignments = []
+        for assignment_data in items:
             try:
                 # Skip unpublished assignments
                 if not assignment_data.get("published", True):
-                    logger.debug(f"Skipping unpublished assignment: {assignment_data.get('name')}")
+                    logger.debug("Skipping unpublished assignment: %s", assignment_data.get("name"))
                     continue
                 
                 # Extract submission if included
@@ -272,17 +582,16 @@ class CanvasClient:
                 assignments.append(assignment)
                 
                 logger.debug(
-                    f"Found assignment: {assignment.name} "
-                    f"(submitted: {assignment.is_submitted})"
+                    "Found assignment: %s (submitted: %s)",
+                    assignment.name,
+                    assignment.is_submitted,
                 )
                 
             except (KeyError, ValueError) as e:
-                logger.warning(
-                    f"Skipping malformed assignment data: {e}"
-                )
+                logger.warning("Skipping malformed assignment data: %s", e)
                 continue
         
-        logger.info(f"Found {len(assignments)} assignments in {course.name}")
+        logger.info("Found %d assignments in %s", len(assignments), course.name)
         return assignments
     
     def get_submission(self, course_id: int, assignment_id: int) -> Optional[Submission]:
@@ -298,7 +607,9 @@ class CanvasClient:
         Returns:
             Submission object, or None if no submission exists
         """
-        logger.debug(f"Fetching submission for assignment {assignment_id} in course {course_id}")
+        logger.debug(
+            "Fetching submission for assignment %s in course %s", assignment_id, course_id
+        )
         
         endpoint = self.SUBMISSION_ENDPOINT.format(
             course_id=course_id,
@@ -313,6 +624,50 @@ class CanvasClient:
                 return None
             raise
     
+    def get_submissions_bulk(
+        self,
+        keys: Iterable[tuple[int, int]],
+    ) -> dict[tuple[int, int], Submission]:
+        """
+        Fetch submission status for many assignments at once.
+        
+        Uses Canvas' "list submissions for multiple assignments" endpoint,
+        so N assignments in a course cost one (paginated) request instead
+        of N calls to get_submission().
+        
+        Args:
+            keys: (course_id, assignment_id) pairs
+            
+        Returns:
+            Mapping of (course_id, assignment_id) to Submission. Assignments
+            without a submission are omitted.
+        """
+        by_course: dict[int, list[int]] = {}
+        for course_id, assignment_id in keys:
+            by_course.setdefault(course_id, []).append(assignment_id)
+        
+        submissions: dict[tuple[int, int], Submission] = {}
+        
+        for course_id, assignment_ids in by_course.items():
+            endpoint = self.SUBMISSIONS_ENDPOINT.format(course_id=course_id)
+            
+            for start in range(0, len(assignment_ids), self.SUBMISSIONS_BATCH_SIZE):
+                batch = assignment_ids[start:start + self.SUBMISSIONS_BATCH_SIZE]
+                logger.debug("Fetching %d submissions in course %s", len(batch), course_id)
+                
+                for data in self._paginate(
+                    endpoint,
+                    params={"student_ids[]": "self", "assignment_ids[]": batch},
+                ):
+                    try:
+                        submission = Submission.from_api_response(data)
+                    except (KeyError, ValueError) as e:
+                        logger.warning("Skipping malformed submission data: %s", e)
+                        continue
+                    submissions[(course_id, submission.assignment_id)] = submission
+        
+        return submissions
+    
     def get_all_assignments(self) -> list[Assignment]:
         """
         Fetch all assignments from all active courses.
@@ -323,19 +678,48 @@ class CanvasClient:
             List of all Assignment objects with submission status
         """
         all_assignments = []
+        for result in self.get_all_course_assignments():
+            all_assignments.extend(result.assignments)
         
+        logger.info("Total assignments across all courses: %d", len(all_assignments))
+        return all_assignments
+    
+    def get_all_course_assignments(
+        self,
+        etags: Optional[Mapping[int, str]] = None,
+    ) -> list[CourseAssignments]:
+        """
+        Fetch the assignments of every active course, skipping unchanged ones.
+        
+        Courses are fetched concurrently (up to max_workers at a time)
+        since each fetch is dominated by network latency. Results keep
+        the order of the course list.
+        
+        Args:
+            etags: Course ID to ETag from earlier results; courses whose
+                ETag still matches come back with assignments None
+                
+        Returns:
+            One CourseAssignments per active course
+        """
+        etags = etags or {}
         courses = self.get_active_courses()
-        for course in courses:
-            assignments = self.get_assignments(course)
-            all_assignments.extend(assignments)
         
-        logger.info(f"Total assignments across all courses: {len(all_assignments)}")
-        return all_assignments
+        def fetch(course: Course) -> CourseAssignments:
+            return self.get_assignments_if_changed(course, etags.get(course.id))
+        
+        if self.max_workers > 1 and len(courses) > 1:
+            workers = min(self.max_workers, len(courses))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(fetch, courses))
+        
+        return [fetch(course) for course in courses]
     
     def close(self) -> None:
-        """Close the HTTP session."""
-        self._session.close()
-        logger.debug("Canvas client session closed")
+        """Close all pooled HTTP connections."""
+        self.invalidate_courses_cache()
+        self._pool.clear()
+        logger.debug("Canvas client connection pool closed")
     
     def __enter__(self) -> "CanvasClient":
         return self
@@ -5,12 +5,27 @@ These models represent the core entities fetched from Canvas API.
 All IDs are integers from Canvas and form the primary identity.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass(frozen=True)
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts the trailing "Z" Canvas uses from 3.11 onwards
+    _parse_datetime = datetime.fromisoformat
+else:
+    def _parse_datetime(value: str) -> datetime:
+        """Parse a Canvas ISO 8601 timestamp."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _date_iso(value: Optional[datetime]) -> Optional[str]:
+    """Return the date part of a timestamp as YYYY-MM-DD, or None."""
+    return value.date().isoformat() if value else None
+
+
+@dataclass(frozen=True, slots=True)
 class Course:
     """
     Represents a Canvas course.
@@ -41,7 +56,7 @@ class Course:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Submission:
     """
     Represents a user's submission for an assignment.
@@ -77,9 +92,7 @@ class Submission:
         """Create Submission from Canvas API response."""
         submitted_at = None
         if data.get("submitted_at"):
-            submitted_at = datetime.fromisoformat(
-                data["submitted_at"].replace("Z", "+00:00")
-            )
+            submitted_at = _parse_datetime(data["submitted_at"])
         
         return cls(
             assignment_id=int(data["assignment_id"]),
@@ -90,7 +103,7 @@ class Submission:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Assignment:
     """
     Represents a Canvas assignment.
@@ -109,6 +122,8 @@ class Assignment:
         points_possible: Maximum points for assignment
         submission: User's submission status, None if not fetched
         published: Whether assignment is published
+        display_title: Formatted title for the Outlook task (derived)
+        due_date_iso: Due date as YYYY-MM-DD, None if no due date (derived)
     """
     id: int
     course_id: int
@@ -120,23 +135,24 @@ class Assignment:
     points_possible: Optional[float]
     submission: Optional[Submission] = None
     published: bool = True
+    # Derived once at construction, since every sync compares them
+    display_title: str = field(init=False, repr=False, compare=False)
+    due_date_iso: Optional[str] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not isinstance(self.id, int) or self.id <= 0:
             raise ValueError(f"Assignment ID must be a positive integer, got {self.id}")
         if not isinstance(self.course_id, int) or self.course_id <= 0:
             raise ValueError(f"Course ID must be a positive integer, got {self.course_id}")
+        
+        object.__setattr__(self, "display_title", f"[{self.course_name}] {self.name}")
+        object.__setattr__(self, "due_date_iso", _date_iso(self.due_at))
     
     @property
     def unique_key(self) -> tuple[int, int]:
         """Return the unique identifier for this assignment."""
         return (self.course_id, self.id)
     
-    @property
-    def display_title(self) -> str:
-        """Return formatted title for Outlook task."""
-        return f"[{self.course_name}] {self.name}"
-    
     @property
     def is_submitted(self) -> bool:
         """Check if this assignment has been submitted."""
@@ -155,9 +171,7 @@ class Assignment:
         """Create Assignment from Canvas API response."""
         due_at = None
         if data.get("due_at"):
-            due_at = datetime.fromisoformat(
-                data["due_at"].replace("Z", "+00:00")
-            )
+            due_at = _parse_datetime(data["due_at"])
         
         return cls(
             id=int(data["id"]),
@@ -171,3 +185,25 @@ class Assignment:
             submission=submission,
             published=data.get("published", True),
         )
+
+
+@dataclass(frozen=True, slots=True)
+class CourseAssignments:
+    """
+    Assignments fetched for one course, with the ETag that identifies them.
+    
+    Attributes:
+        course: The course the assignments belong to
+        assignments: Current assignments, or None if Canvas answered
+            304 Not Modified to the ETag sent with the request
+        etag: Opaque validator to pass back next time (the ETag plus the
+            course name), None if the response was paginated or carried none
+    """
+    course: Course
+    assignments: Optional[list[Assignment]]
+    etag: Optional[str] = None
+    
+    @property
+    def not_modified(self) -> bool:
+        """Check if the course is unchanged since the ETag was issued."""
+        return self.assignments is None
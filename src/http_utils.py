@@ -0,0 +1,30 @@
+"""
+HTTP helpers shared by the Canvas and Microsoft Graph clients.
+"""
+
+import math
+from typing import Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds.
+    
+    HTTP dates and non-finite values are ignored, so callers fall back to
+    their own backoff.
+    
+    Args:
+        value: Raw header value, if any
+        
+    Returns:
+        Seconds to wait, or None if the header is missing or unusable
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(seconds):
+        return None
+    return max(0.0, seconds)
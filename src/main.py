@@ -4,7 +4,8 @@ Canvas to Outlook Task Sync - Main Entry Point
 
 Synchronizes Canvas LMS assignment completion status to Microsoft Outlook Tasks.
 
-Usage:
+Usage (from the project root; after `pip install -e .` the same options
+are available as the `lmssync` command):
     python -m src.main              # Full sync
     python -m src.main --dry-run    # Preview changes without applying
     python -m src.main --verbose    # Enable debug logging
@@ -19,26 +20,32 @@ See .env.example for all configuration options.
 """
 
 import argparse
+import functools
 import logging
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-
-# Add project root to path for imports
-PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
-
-from config.settings import load_settings, ConfigurationError
-from src.canvas.client import CanvasClient, CanvasAPIError
-from src.outlook.client import OutlookClient, AuthenticationError, GraphAPIError
-from src.storage.state_store import StateStore
-from src.sync.engine import SyncEngine
+from typing import TYPE_CHECKING, Optional
 
 import json as json_module
 
+# API clients, the state store and the sync engine pull in msal, requests
+# and sqlite3; they are imported where needed so --version and --status
+# stay fast.
+if TYPE_CHECKING:
+    from config.settings import Settings
+    from src.canvas.client import CanvasClient
+    from src.outlook.client import OutlookClient
+    from src.storage.state_store import StateStore
+
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging output."""
     
+    # Bound once instead of looked up on the module for every record
+    _dumps = staticmethod(json_module.dumps)
+    
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
             "timestamp": self.formatTime(record),
@@ -47,8 +54,56 @@ class JSONFormatter(logging.Formatter):
             "message": record.getMessage(),
         }
         if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
-        return json_module.dumps(log_data)
+            # Cache on the record like logging.Formatter does, so several
+            # handlers don't each re-render the traceback
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data["exception"] = record.exc_text
+        return self._dumps(log_data)
+
+
+class RedactSecretsFilter(logging.Filter):
+    """
+    Mask bearer tokens in log messages.
+    
+    Config and client reprs already hide secrets; this catches tokens
+    that reach a log message some other way (e.g. request headers
+    echoed in debug output).
+    """
+    
+    _BEARER_RE = re.compile(r"(Bearer\s+)[^\s'\",]+", re.IGNORECASE)
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        redacted = self._BEARER_RE.sub(r"\1***REDACTED***", message)
+        if redacted != message:
+            record.msg = redacted
+            record.args = None
+        return True
+
+
+RULE = "=" * 50
+
+
+def banner(title: str, *lines: str) -> str:
+    """
+    Build a ruled, multi-line report block.
+    
+    Reports are emitted as one log record rather than a call per line,
+    so each costs a single handler lock and formatter pass.
+    
+    Args:
+        title: Heading shown between the top rules
+        *lines: Body lines (the closing rule is omitted when empty)
+        
+    Returns:
+        Block text joined with newlines
+    """
+    parts = [RULE, title, RULE]
+    if lines:
+        parts.extend(lines)
+        parts.append(RULE)
+    return "\n".join(parts)
 
 
 def setup_logging(verbose: bool = False, json_logs: bool = False) -> None:
@@ -74,6 +129,10 @@ def setup_logging(verbose: bool = False, json_logs: bool = False) -> None:
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(formatter)
     
+    # Debug output is the only place request details are logged
+    if verbose:
+        handler.addFilter(RedactSecretsFilter())
+    
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
@@ -87,8 +146,16 @@ def setup_logging(verbose: bool = False, json_logs: bool = False) -> None:
 
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command line parser once per process.
+    
+    argparse is kept over a hand-rolled parser: it costs a few
+    milliseconds at startup but provides --help, validation and error
+    messages for free. Caching means repeated parse_args() calls (tests,
+    a long-running wrapper) don't rebuild it.
+    """
     parser = argparse.ArgumentParser(
         description="Sync Canvas LMS assignments to Microsoft Outlook Tasks",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -159,10 +226,29 @@ For setup instructions, see README.md
         help="Output logs in JSON format for machine parsing",
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        "--no-parallel-init",
+        action="store_true",
+        help="Initialize clients and run health checks one at a time (debugging)",
+    )
+    
+    return parser
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Args:
+        argv: Arguments to parse (defaults to sys.argv[1:])
+        
+    Returns:
+        Parsed arguments
+    """
+    return _build_parser().parse_args(argv)
 
 
-def show_status(state_store: StateStore) -> None:
+def show_status(state_store: "StateStore") -> None:
     """
     Display current sync status.
     
@@ -171,26 +257,16 @@ def show_status(state_store: StateStore) -> None:
     """
     logger = logging.getLogger(__name__)
     
-    total = state_store.count(include_archived=True)
-    active = state_store.count(include_archived=False)
-    archived = total - active
-    
-    logger.info("=" * 50)
-    logger.info("Sync Status")
-    logger.info("=" * 50)
-    logger.info(f"Total tracked assignments: {total}")
-    logger.info(f"Active assignments:        {active}")
-    logger.info(f"Archived assignments:      {archived}")
+    summary = state_store.status_summary()
     
-    # Show recent activity
-    states = state_store.get_all(include_archived=False)
-    
-    submitted_count = sum(1 for s in states if s.was_submitted)
-    pending_count = active - submitted_count
-    
-    logger.info(f"Submitted (completed):     {submitted_count}")
-    logger.info(f"Pending (not completed):   {pending_count}")
-    logger.info("=" * 50)
+    logger.info("%s", banner(
+        "Sync Status",
+        f"Total tracked assignments: {summary.total}",
+        f"Active assignments:        {summary.active}",
+        f"Archived assignments:      {summary.archived}",
+        f"Submitted (completed):     {summary.submitted}",
+        f"Pending (not completed):   {summary.pending}",
+    ))
 
 
 def show_version() -> None:
@@ -203,47 +279,82 @@ def show_version() -> None:
     print("Repository: https://github.com/kushwahaamar-dev/lmssync")
 
 
-def health_check(canvas_client: "CanvasClient", outlook_client: "OutlookClient") -> bool:
+def health_check(
+    canvas_client: "CanvasClient",
+    outlook_client: "OutlookClient",
+    parallel: bool = True,
+) -> bool:
     """
     Check API connectivity for Canvas and Microsoft Graph.
     
+    Both checks are independent network calls, so by default they run
+    concurrently and the check takes as long as the slower API.
+    
     Args:
         canvas_client: Configured Canvas client
         outlook_client: Configured Outlook client
+        parallel: If True, run the checks concurrently
         
     Returns:
         True if all checks pass, False otherwise
     """
+    from src.outlook.client import GraphAPIError
+    
     logger = logging.getLogger(__name__)
     all_passed = True
     
-    logger.info("=" * 50)
-    logger.info("Health Check")
-    logger.info("=" * 50)
-    
-    # Check Canvas API
-    logger.info("Checking Canvas API connectivity...")
-    try:
-        courses = canvas_client.get_active_courses()
-        logger.info(f"  ✓ Canvas API: OK ({len(courses)} active courses)")
-    except Exception as e:
-        logger.error(f"  ✗ Canvas API: FAILED - {e}")
-        all_passed = False
+    logger.info("%s", banner("Health Check"))
     
-    # Check Microsoft Graph API
-    logger.info("Checking Microsoft Graph API connectivity...")
-    try:
-        task_lists = outlook_client.get_task_lists()
-        logger.info(f"  ✓ Microsoft Graph: OK ({len(task_lists)} task lists)")
-    except Exception as e:
-        logger.error(f"  ✗ Microsoft Graph: FAILED - {e}")
-        all_passed = False
+    def get_task_lists() -> list[dict]:
+        # Go through $batch so the check also covers the batch endpoint
+        # used by the sync
+        [response] = outlook_client.batch(
+            [{"method": "GET", "url": outlook_client.TASK_LISTS_ENDPOINT}]
+        )
+        if response["status"] >= 400:
+            error = (response.get("body") or {}).get("error", {})
+            raise GraphAPIError(
+                f"Graph API error: {error.get('message', response['status'])}",
+                status_code=response["status"],
+                error_code=error.get("code"),
+            )
+        return response["body"].get("value", [])
+    
+    # name -> (check, description of the counted items)
+    checks = {
+        "Canvas API": (canvas_client.get_active_courses, "active courses"),
+        "Microsoft Graph": (get_task_lists, "task lists"),
+    }
+    
+    def report(name: str, fetch) -> bool:
+        label = checks[name][1]
+        try:
+            items = fetch()
+            logger.info("  ✓ %s: OK (%d %s)", name, len(items), label)
+            return True
+        except Exception as e:
+            logger.error("  ✗ %s: FAILED - %s", name, e)
+            return False
+    
+    logger.info("Checking Canvas API and Microsoft Graph API connectivity...")
+    if parallel:
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = {
+                executor.submit(check): name
+                for name, (check, _) in checks.items()
+            }
+            for future in as_completed(futures):
+                if not report(futures[future], future.result):
+                    all_passed = False
+    else:
+        for name, (check, _) in checks.items():
+            if not report(name, check):
+                all_passed = False
     
-    logger.info("=" * 50)
     if all_passed:
-        logger.info("All health checks passed!")
+        logger.info("%s\nAll health checks passed!", RULE)
     else:
-        logger.error("Some health checks failed.")
+        logger.error("%s\nSome health checks failed.", RULE)
     
     return all_passed
 
@@ -257,21 +368,97 @@ def list_courses(canvas_client: "CanvasClient") -> None:
     """
     logger = logging.getLogger(__name__)
     
-    logger.info("=" * 50)
-    logger.info("Enrolled Canvas Courses")
-    logger.info("=" * 50)
-    
     courses = canvas_client.get_active_courses()
     
     if not courses:
-        logger.info("No active courses found.")
+        logger.info("%s\nNo active courses found.", banner("Enrolled Canvas Courses"))
         return
     
-    for course in courses:
-        logger.info(f"  [{course.code}] {course.name} (ID: {course.id})")
+    logger.info("%s\nTotal: %d active courses", banner(
+        "Enrolled Canvas Courses",
+        *(f"  [{course.code}] {course.name} (ID: {course.id})" for course in courses),
+    ), len(courses))
+
+
+def create_clients(
+    settings: "Settings",
+    parallel: bool = True,
+) -> tuple["CanvasClient", "OutlookClient"]:
+    """
+    Create both API clients and authenticate with Microsoft Graph.
+    
+    Canvas client setup overlaps with MSAL token acquisition when
+    parallel is True.
+    
+    Args:
+        settings: Application settings
+        parallel: If True, build the Canvas client on a worker thread
+        
+    Returns:
+        Tuple of (canvas_client, outlook_client)
+        
+    Raises:
+        AuthenticationError: If Microsoft authentication fails (both
+            clients are closed before raising)
+    """
+    from src.canvas.client import CanvasClient
+    from src.outlook.client import OutlookClient
+    
+    logger = logging.getLogger(__name__)
+    
+    def create_canvas_client() -> CanvasClient:
+        logger.info("Initializing Canvas client...")
+        return CanvasClient(
+            base_url=settings.canvas.base_url,
+            access_token=settings.canvas.access_token,
+            max_retries=settings.sync.max_retries,
+            max_workers=settings.sync.max_workers,
+        )
     
-    logger.info("=" * 50)
-    logger.info(f"Total: {len(courses)} active courses")
+    def create_outlook_client() -> OutlookClient:
+        logger.info("Initializing Outlook client...")
+        client = OutlookClient(
+            client_id=settings.microsoft.client_id,
+            tenant_id=settings.microsoft.tenant_id,
+            redirect_uri=settings.microsoft.redirect_uri,
+            scopes=settings.microsoft.scopes,
+            token_cache_path=settings.microsoft.token_cache_path,
+            max_retries=settings.sync.max_retries,
+            max_workers=settings.sync.max_workers,
+        )
+        
+        logger.info("Authenticating with Microsoft Graph...")
+        try:
+            client.authenticate()
+        except Exception:
+            client.close()
+            raise
+        return client
+    
+    if not parallel:
+        canvas_client = create_canvas_client()
+        try:
+            return canvas_client, create_outlook_client()
+        except Exception:
+            canvas_client.close()
+            raise
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        canvas_future = executor.submit(create_canvas_client)
+        try:
+            outlook_client = create_outlook_client()
+        except Exception:
+            # Wait for the Canvas client so it can be closed, not leaked
+            if canvas_future.exception() is None:
+                canvas_future.result().close()
+            raise
+        try:
+            canvas_client = canvas_future.result()
+        except Exception:
+            outlook_client.close()
+            raise
+    
+    return canvas_client, outlook_client
 
 
 def main() -> int:
@@ -292,8 +479,9 @@ def main() -> int:
     
     logger = logging.getLogger(__name__)
     
-    logger.info("Canvas to Outlook Task Sync")
-    logger.info("=" * 50)
+    logger.info("Canvas to Outlook Task Sync\n%s", RULE)
+    
+    from config.settings import ConfigurationError, load_settings
     
     # Load configuration
     try:
@@ -303,17 +491,21 @@ def main() -> int:
             logger.info("DRY RUN MODE - No changes will be made")
         
     except ConfigurationError as e:
-        logger.error(f"Configuration error: {e}")
-        logger.error("Please check your .env file or environment variables")
-        logger.error("See .env.example for required configuration")
+        logger.error(
+            "Configuration error: %s\n"
+            "Please check your .env file or environment variables\n"
+            "See .env.example for required configuration",
+            e,
+        )
         return 1
     
     # Handle reset-auth flag
     if args.reset_auth and settings.microsoft.token_cache_path:
         token_path = settings.microsoft.token_cache_path
-        if token_path.exists():
-            logger.info(f"Clearing token cache: {token_path}")
-            token_path.unlink()
+        logger.info("Clearing token cache: %s", token_path)
+        token_path.unlink(missing_ok=True)
+    
+    from src.storage.state_store import StateStore
     
     # Initialize state store
     state_store = StateStore(settings.storage.database_path)
@@ -321,39 +513,28 @@ def main() -> int:
     # Handle status-only mode
     if args.status:
         show_status(state_store)
+        state_store.close()
         return 0
     
+    from src.canvas.client import CanvasAPIError
+    from src.outlook.client import AuthenticationError, GraphAPIError
+    
     # Initialize clients
     canvas_client = None
     outlook_client = None
     
+    parallel = not args.no_parallel_init
+    
     try:
-        # Canvas client
-        logger.info("Initializing Canvas client...")
-        canvas_client = CanvasClient(
-            base_url=settings.canvas.base_url,
-            access_token=settings.canvas.access_token,
-            max_retries=settings.sync.max_retries,
-        )
-        
-        # Outlook client
-        logger.info("Initializing Outlook client...")
-        outlook_client = OutlookClient(
-            client_id=settings.microsoft.client_id,
-            tenant_id=settings.microsoft.tenant_id,
-            redirect_uri=settings.microsoft.redirect_uri,
-            scopes=settings.microsoft.scopes,
-            token_cache_path=settings.microsoft.token_cache_path,
-            max_retries=settings.sync.max_retries,
-        )
-        
-        # Authenticate with Microsoft
-        logger.info("Authenticating with Microsoft Graph...")
+        # Create clients and authenticate with Microsoft
         try:
-            outlook_client.authenticate()
+            canvas_client, outlook_client = create_clients(settings, parallel)
         except AuthenticationError as e:
-            logger.error(f"Microsoft authentication failed: {e}")
-            logger.error("Try running with --reset-auth to clear cached tokens")
+            logger.error(
+                "Microsoft authentication failed: %s\n"
+                "Try running with --reset-auth to clear cached tokens",
+                e,
+            )
             return 1
         
         # Handle --courses flag
@@ -363,9 +544,11 @@ def main() -> int:
         
         # Handle --health flag
         if args.health:
-            success = health_check(canvas_client, outlook_client)
+            success = health_check(canvas_client, outlook_client, parallel)
             return 0 if success else 1
         
+        from src.sync.engine import SyncEngine
+        
         # Create sync engine
         engine = SyncEngine(
             canvas_client=canvas_client,
@@ -375,6 +558,8 @@ def main() -> int:
             dry_run=args.dry_run or settings.sync.dry_run,
             max_retries=settings.sync.max_retries,
             retry_delay=settings.sync.retry_delay_seconds,
+            max_workers=settings.sync.max_workers,
+            max_backoff=settings.sync.max_backoff_seconds,
         )
         
         # Execute sync
@@ -382,18 +567,18 @@ def main() -> int:
         stats = engine.sync()
         
         # Report results
-        logger.info("=" * 50)
-        logger.info("Sync Summary")
-        logger.info("=" * 50)
-        logger.info(f"Assignments processed: {stats.total_assignments}")
-        logger.info(f"Tasks created:         {stats.created}")
-        logger.info(f"Tasks updated:         {stats.updated}")
-        logger.info(f"Marked complete:       {stats.completed}")
-        logger.info(f"Reopened:              {stats.reopened}")
-        logger.info(f"Archived:              {stats.archived}")
-        logger.info(f"Skipped (no change):   {stats.skipped}")
-        logger.info(f"Errors:                {stats.errors}")
-        logger.info("=" * 50)
+        logger.info("%s", banner(
+            "Sync Summary",
+            f"Assignments fetched:   {stats.total_assignments}",
+            f"Courses unchanged:     {stats.unchanged_courses}",
+            f"Tasks created:         {stats.created}",
+            f"Tasks updated:         {stats.updated}",
+            f"Marked complete:       {stats.completed}",
+            f"Reopened:              {stats.reopened}",
+            f"Archived:              {stats.archived}",
+            f"Skipped (no change):   {stats.skipped}",
+            f"Errors:                {stats.errors}",
+        ))
         
         if stats.errors > 0:
             logger.warning("Some errors occurred during sync. Check logs above.")
@@ -403,16 +588,16 @@ def main() -> int:
         return 0
         
     except CanvasAPIError as e:
-        logger.error(f"Canvas API error: {e}")
+        logger.error("Canvas API error: %s", e)
         return 1
     except GraphAPIError as e:
-        logger.error(f"Microsoft Graph API error: {e}")
+        logger.error("Microsoft Graph API error: %s", e)
         return 1
     except KeyboardInterrupt:
         logger.info("Sync interrupted by user")
         return 130
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
+        logger.error("Unexpected error: %s", e, exc_info=True)
         return 1
     finally:
         # Clean up
@@ -420,6 +605,7 @@ def main() -> int:
             canvas_client.close()
         if outlook_client:
             outlook_client.close()
+        state_store.close()
 
 
 if __name__ == "__main__":
@@ -7,19 +7,58 @@ Provides operations for task lists and tasks.
 
 import json
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+from urllib.parse import urlencode, urlsplit
+from urllib.request import getproxies, proxy_bypass
 
 import msal
 import requests
+import urllib3
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from ..http_utils import parse_retry_after
 from .models import OutlookTask, TaskList, TaskStatus
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Compact JSON for request bodies; Graph doesn't need the default spacing
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+# MSAL token caches shared by every client in the process, keyed by cache
+# file, so the file is read and deserialized only once
+_TOKEN_CACHES: dict[Optional[Path], msal.SerializableTokenCache] = {}
+_TOKEN_CACHES_LOCK = threading.Lock()
+
+
+def _get_token_cache(path: Optional[Path]) -> msal.SerializableTokenCache:
+    """
+    Return the process-wide MSAL token cache for a cache file.
+    
+    Args:
+        path: Token cache file, or None for an in-memory cache
+        
+    Returns:
+        Token cache, loaded from disk on first use
+    """
+    key = path.resolve() if path else None
+    with _TOKEN_CACHES_LOCK:
+        cache = _TOKEN_CACHES.get(key)
+        if cache is None:
+            cache = msal.SerializableTokenCache()
+            if path and path.exists():
+                logger.debug(f"Loading token cache from {path}")
+                cache.deserialize(path.read_text())
+            _TOKEN_CACHES[key] = cache
+        return cache
+
 
 class GraphAPIError(Exception):
     """Raised when Microsoft Graph API returns an error."""
@@ -29,10 +68,13 @@ class GraphAPIError(Exception):
         message: str, 
         status_code: Optional[int] = None, 
         error_code: Optional[str] = None,
+        retry_after: Optional[float] = None,
     ):
         super().__init__(message)
         self.status_code = status_code
         self.error_code = error_code
+        # Seconds the server asked us to wait (Retry-After), if any
+        self.retry_after = retry_after
 
 
 class AuthenticationError(GraphAPIError):
@@ -72,6 +114,31 @@ class OutlookClient:
     TASK_LISTS_ENDPOINT = "/me/todo/lists"
     TASKS_ENDPOINT = "/me/todo/lists/{list_id}/tasks"
     TASK_ENDPOINT = "/me/todo/lists/{list_id}/tasks/{task_id}"
+    BATCH_ENDPOINT = "/$batch"
+    
+    # Graph rejects JSON batches with more than 20 subrequests
+    BATCH_MAX_REQUESTS = 20
+    # Longest Retry-After wait honored for throttled batch subrequests
+    BATCH_MAX_RETRY_AFTER = 60.0
+    
+    # Page size for task listing ($top)
+    TASKS_PAGE_SIZE = 100
+    # Graph caps $top server-side and pages the rest via @odata.nextLink
+    TASKS_MAX_PAGE_SIZE = 999
+    # Fields read by OutlookTask.from_api_response
+    TASK_SELECT_FIELDS = (
+        "id,title,status,importance,dueDateTime,body,categories,"
+        "createdDateTime,lastModifiedDateTime,completedDateTime"
+    )
+    
+    # Refresh the access token this long before MSAL says it expires
+    TOKEN_REFRESH_MARGIN_SECONDS = 60
+    
+    # Minimum time between token cache writes (close() always writes)
+    TOKEN_CACHE_SAVE_INTERVAL_SECONDS = 30
+    
+    # Maximum pooled connections to Graph
+    POOL_MAXSIZE = 32
     
     def __init__(
         self,
@@ -82,6 +149,7 @@ class OutlookClient:
         token_cache_path: Optional[Path] = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        max_workers: int = 8,
     ):
         """
         Initialize Outlook client.
@@ -94,6 +162,7 @@ class OutlookClient:
             token_cache_path: Path to token cache file
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
+            max_workers: Maximum Graph requests in flight at once
         """
         self.client_id = client_id
         self.tenant_id = tenant_id
@@ -101,12 +170,20 @@ class OutlookClient:
         self.scopes = list(scopes)
         self.token_cache_path = token_cache_path
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_workers = max(1, max_workers)
         
-        # Initialize MSAL token cache
-        self._token_cache = msal.SerializableTokenCache()
-        if self.token_cache_path and self.token_cache_path.exists():
-            logger.debug(f"Loading token cache from {self.token_cache_path}")
-            self._token_cache.deserialize(self.token_cache_path.read_text())
+        # Initialize MSAL token cache (shared per cache file in-process)
+        self._token_cache = _get_token_cache(self.token_cache_path)
+        self._token_cache_saved_at: Optional[float] = None
+        
+        # Pooled session for MSAL, so tenant discovery at construction and
+        # every later token refresh reuse one connection to the login host
+        self._msal_session = requests.Session()
+        self._msal_session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=2, pool_maxsize=16, pool_block=False),
+        )
         
         # Initialize MSAL public client
         authority = f"https://login.microsoftonline.com/{tenant_id}"
@@ -114,45 +191,126 @@ class OutlookClient:
             client_id,
             authority=authority,
             token_cache=self._token_cache,
+            http_client=self._msal_session,
         )
         
         self._access_token: Optional[str] = None
+        # Monotonic deadline for proactive refresh, and the request headers
+        # built once per token rather than per request
+        self._token_expiry = 0.0
+        self._headers: dict[str, str] = {}
+        self._auth_lock = threading.Lock()
         
-        # Configure HTTP session with retry logic
-        self._session = requests.Session()
+        # "/me/todo/lists/{list_id}/tasks" per list, built once
+        self._tasks_endpoints: dict[str, str] = {}
         
         retry_strategy = Retry(
             total=max_retries,
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PATCH", "DELETE"],
+            # Throttled (429/503) responses wait for Retry-After
+            respect_retry_after_header=True,
+            # POST creates tasks and carries $batch requests, so a 5xx or a
+            # read timeout may already have taken effect; only connection
+            # failures, which never reach Graph, are retried for it
+            allowed_methods=frozenset(["GET", "PATCH", "DELETE"]),
+            # Hand back the last response so it is reported like any other error
+            raise_on_status=False,
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self._session.mount("https://", adapter)
+        # Every call goes to one host, so talk to urllib3 directly rather
+        # than paying for requests' per-call session machinery. The pool is
+        # sized for concurrent task calls so workers don't block waiting
+        # for a free connection.
+        pool_kwargs = {
+            "num_pools": 1,
+            "maxsize": self.POOL_MAXSIZE,
+            "block": False,
+            "retries": retry_strategy,
+            "timeout": timeout,
+        }
+        
+        # Graph calls are I/O bound and independent; urllib3 pools are
+        # thread-safe, so fan them out over a small worker pool
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="graph",
+        )
+        
+        # Keep honoring HTTPS_PROXY and NO_PROXY like requests did
+        proxy_url = getproxies().get("https")
+        if proxy_url and not proxy_bypass(urlsplit(self.GRAPH_BASE_URL).netloc):
+            self._pool = urllib3.ProxyManager(proxy_url, **pool_kwargs)
+        else:
+            self._pool = urllib3.PoolManager(**pool_kwargs)
         
         logger.info(f"Outlook client initialized for tenant {tenant_id}")
     
     def __repr__(self) -> str:
         return f"OutlookClient(client_id='{self.client_id[:8]}...', tenant_id='{self.tenant_id}')"
     
-    def _save_token_cache(self) -> None:
-        """Persist token cache to disk."""
-        if self.token_cache_path and self._token_cache.has_state_changed:
-            self.token_cache_path.parent.mkdir(parents=True, exist_ok=True)
-            self.token_cache_path.write_text(self._token_cache.serialize())
-            logger.debug("Token cache saved")
+    def _save_token_cache(self, force: bool = False) -> None:
+        """
+        Persist token cache to disk if it changed.
+        
+        Writes are debounced to one per TOKEN_CACHE_SAVE_INTERVAL_SECONDS
+        unless force is set.
+        
+        Args:
+            force: Write even if the last write was recent
+        """
+        if not (self.token_cache_path and self._token_cache.has_state_changed):
+            return
+        
+        now = time.monotonic()
+        if (
+            not force
+            and self._token_cache_saved_at is not None
+            and now - self._token_cache_saved_at < self.TOKEN_CACHE_SAVE_INTERVAL_SECONDS
+        ):
+            return
+        
+        self._token_cache_saved_at = now
+        self.token_cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.token_cache_path.write_text(self._token_cache.serialize())
+        logger.debug("Token cache saved")
     
-    def authenticate(self) -> None:
+    def _set_token(self, result: dict) -> None:
+        """Store an MSAL token result and the headers that carry it."""
+        self._access_token = result["access_token"]
+        expires_in = float(result.get("expires_in", 3600))
+        self._token_expiry = (
+            time.monotonic() + expires_in - self.TOKEN_REFRESH_MARGIN_SECONDS
+        )
+        self._headers = {
+            "Authorization": f"Bearer {self._access_token}",
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+        }
+    
+    def authenticate(self, force_refresh: bool = False) -> None:
         """
         Authenticate with Microsoft Graph API.
         
         Attempts silent authentication first using cached tokens.
         Falls back to interactive authentication if needed.
         
+        Args:
+            force_refresh: Get a new token even if the current one has not
+                expired, bypassing MSAL's cached access token
+        
         Raises:
             AuthenticationError: If authentication fails
         """
+        # A token that is still valid needs no MSAL call at all
+        if (
+            not force_refresh
+            and self._access_token
+            and time.monotonic() < self._token_expiry
+        ):
+            logger.debug("Access token still valid, skipping authentication")
+            return
+        
         logger.info("Authenticating with Microsoft Graph...")
         
         # Try silent authentication first
@@ -162,10 +320,11 @@ class OutlookClient:
             result = self._msal_app.acquire_token_silent(
                 self.scopes,
                 account=accounts[0],
+                force_refresh=force_refresh,
             )
             
             if result and "access_token" in result:
-                self._access_token = result["access_token"]
+                self._set_token(result)
                 self._save_token_cache()
                 logger.info("Silent authentication successful")
                 return
@@ -182,7 +341,7 @@ class OutlookClient:
         )
         
         if "access_token" in result:
-            self._access_token = result["access_token"]
+            self._set_token(result)
             self._save_token_cache()
             logger.info("Interactive authentication successful")
         else:
@@ -191,17 +350,62 @@ class OutlookClient:
             raise AuthenticationError(f"Authentication failed: {error_msg}")
     
     def _ensure_authenticated(self) -> None:
-        """Ensure we have a valid access token."""
+        """
+        Ensure we have a valid access token.
+        
+        Refreshes the token (silently when MSAL can) shortly before it
+        expires, so requests don't have to fail with 401 first.
+        """
         if not self._access_token:
             raise AuthenticationError("Not authenticated. Call authenticate() first.")
+        
+        if time.monotonic() >= self._token_expiry:
+            with self._auth_lock:
+                # Another worker may have refreshed while we waited
+                if time.monotonic() >= self._token_expiry:
+                    logger.info("Access token about to expire, refreshing...")
+                    self.authenticate()
     
     def _get_headers(self) -> dict[str, str]:
         """Get request headers with authorization."""
         self._ensure_authenticated()
-        return {
-            "Authorization": f"Bearer {self._access_token}",
-            "Content-Type": "application/json",
-        }
+        return self._headers
+    
+    def _refresh_rejected_token(self, rejected_headers: dict[str, str]) -> None:
+        """
+        Replace a token that Graph rejected with 401.
+        
+        Only one thread refreshes; threads whose request carried the same
+        token find it already replaced and reuse the new one. The current
+        token stays in place until its replacement is set.
+        
+        Args:
+            rejected_headers: Headers the rejected request was sent with
+        """
+        with self._auth_lock:
+            if self._headers is rejected_headers:
+                logger.info("Access token rejected, refreshing...")
+                self.authenticate(force_refresh=True)
+    
+    def _urlopen(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes],
+        headers: dict[str, str],
+    ) -> urllib3.response.HTTPResponse:
+        """
+        Send one request through the connection pool.
+        
+        Raises:
+            GraphAPIError: If the request fails without a response
+        """
+        try:
+            return self._pool.urlopen(method, url, body=body, headers=headers)
+        except urllib3.exceptions.HTTPError as e:
+            error_msg = f"Graph request failed: {e}"
+            logger.error(error_msg)
+            raise GraphAPIError(error_msg) from e
     
     def _make_request(
         self,
@@ -215,7 +419,7 @@ class OutlookClient:
         
         Args:
             method: HTTP method (GET, POST, PATCH, DELETE)
-            endpoint: API endpoint
+            endpoint: API endpoint, or an absolute Graph URL
             data: Request body (for POST/PATCH)
             params: Query parameters
             
@@ -225,63 +429,207 @@ class OutlookClient:
         Raises:
             GraphAPIError: If request fails
         """
-        url = f"{self.GRAPH_BASE_URL}{endpoint}"
+        # Absolute URLs (e.g. @odata.nextLink) are used as-is
+        if endpoint.startswith("https://"):
+            url = endpoint
+        else:
+            url = f"{self.GRAPH_BASE_URL}{endpoint}"
+        
+        if params:
+            separator = "&" if "?" in url else "?"
+            url = f"{url}{separator}{urlencode(params, doseq=True)}"
+        
+        body = _JSON_ENCODER.encode(data).encode() if data is not None else None
+        
+        # Only network failures raise here; HTTP statuses are branched on below
+        headers = self._get_headers()
+        response = self._urlopen(method, url, body, headers)
+        
+        # A rejected token is refreshed and the request sent once more;
+        # a second 401 is reported like any other error
+        if response.status == 401:
+            self._refresh_rejected_token(headers)
+            response = self._urlopen(method, url, body, self._get_headers())
+        
+        status = response.status
+        
+        if status >= 400:
+            raise self._error_from_response(response)
+        
+        # Handle 204 No Content
+        if status == 204 or not response.data:
+            return None
         
         try:
-            response = self._session.request(
-                method=method,
-                url=url,
-                headers=self._get_headers(),
-                json=data,
-                params=params,
-                timeout=self.timeout,
-            )
-            
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = int(response.headers.get("Retry-After", 60))
-                logger.warning(f"Rate limited. Waiting {retry_after} seconds...")
-                time.sleep(retry_after)
-                return self._make_request(method, endpoint, data, params)
-            
-            # Handle token refresh needed
-            if response.status_code == 401:
-                logger.info("Token expired, refreshing...")
-                self._access_token = None
-                self.authenticate()
-                return self._make_request(method, endpoint, data, params)
-            
-            response.raise_for_status()
+            return json.loads(response.data)
+        except ValueError as e:
+            error_msg = f"Graph returned invalid JSON: {e}"
+            logger.error(error_msg)
+            raise GraphAPIError(error_msg, status_code=status) from e
+    
+    def _error_from_response(self, response: urllib3.response.HTTPResponse) -> GraphAPIError:
+        """
+        Build a GraphAPIError from an unsuccessful response.
+        
+        Uses the "error" object of the response body when present. Bodies
+        that are not JSON objects (empty, or HTML from a gateway) are not
+        parsed.
+        
+        Args:
+            response: Response with a 4xx/5xx status code
             
-            # Handle 204 No Content
-            if response.status_code == 204:
-                return None
+        Returns:
+            GraphAPIError carrying the status, Graph error code and any
+            Retry-After hint
+        """
+        error_msg = f"Graph API error: {response.status} {response.reason}"
+        error_code = None
+        
+        data = response.data
+        if data[:1] == b"{":
+            try:
+                error = json.loads(data).get("error")
+            except ValueError:
+                error = None
+            if isinstance(error, dict):
+                error_msg = f"Graph API error: {error.get('message', error_msg)}"
+                error_code = error.get("code")
+        
+        logger.error(error_msg)
+        return GraphAPIError(
+            error_msg,
+            status_code=response.status,
+            error_code=error_code,
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+        )
+    
+    def batch(self, subrequests: list[dict]) -> list[dict]:
+        """
+        Send requests through the Graph JSON batch endpoint.
+        
+        Requests are sent 20 per round-trip. Identical GET subrequests are
+        sent once and share a response; other methods are always sent
+        individually, since each call has its own effect. Subrequests throttled
+        with 429 (or 503 with Retry-After) are resent after their Retry-After
+        delay, capped at BATCH_MAX_RETRY_AFTER, up to max_retries times. A
+        subrequest missing from Graph's reply gets a 502 response.
+        
+        Args:
+            subrequests: Requests with "method", "url" (relative to the
+                Graph version root, e.g. "/me/todo/lists") and optional
+                "body" and "headers"
             
-            return response.json()
+        Returns:
+            One response per request, in input order, each with "id",
+            "status", "headers" and "body"
             
-        except requests.exceptions.HTTPError as e:
-            error_msg = f"Graph API error: {e}"
-            error_code = None
+        Raises:
+            GraphAPIError: If a batch request itself fails or its reply
+                has no responses
+        """
+        # Dedupe identical reads; slot i of the result maps to unique[i]
+        unique: list[dict] = []
+        seen: dict[str, int] = {}
+        slots: list[int] = []
+        
+        for request in subrequests:
+            fingerprint = None
+            index = None
+            if request["method"].upper() == "GET":
+                fingerprint = json.dumps(
+                    [request["url"], request.get("headers")],
+                    sort_keys=True,
+                )
+                index = seen.get(fingerprint)
+            if index is None:
+                index = len(unique)
+                if fingerprint is not None:
+                    seen[fingerprint] = index
+                entry = {
+                    "id": str(index),
+                    "method": request["method"],
+                    "url": request["url"],
+                }
+                if request.get("body") is not None:
+                    entry["body"] = request["body"]
+                    entry["headers"] = {
+                        "Content-Type": "application/json",
+                        **request.get("headers", {}),
+                    }
+                elif request.get("headers"):
+                    entry["headers"] = request["headers"]
+                unique.append(entry)
+            slots.append(index)
+        
+        logger.debug(
+            f"Sending {len(unique)} batch subrequests "
+            f"({len(subrequests) - len(unique)} duplicates dropped)"
+        )
+        
+        responses: dict[str, dict] = {}
+        pending = unique
+        attempt = 0
+        
+        while pending:
+            throttled = []
+            retry_after = 0.0
             
-            try:
-                error_body = e.response.json()
-                if "error" in error_body:
-                    error_msg = f"Graph API error: {error_body['error'].get('message', str(e))}"
-                    error_code = error_body["error"].get("code")
-            except (ValueError, AttributeError):
-                pass
+            for start in range(0, len(pending), self.BATCH_MAX_REQUESTS):
+                chunk = pending[start:start + self.BATCH_MAX_REQUESTS]
+                result = self._make_request(
+                    "POST",
+                    self.BATCH_ENDPOINT,
+                    data={"requests": chunk},
+                )
+                if not isinstance(result, dict) or not isinstance(
+                    result.get("responses"), list
+                ):
+                    error_msg = "Graph batch reply has no responses"
+                    logger.error(error_msg)
+                    raise GraphAPIError(error_msg)
+                
+                by_id = {sub["id"]: sub for sub in chunk}
+                
+                for response in result["responses"]:
+                    request = by_id.pop(response.get("id"), None)
+                    if request is None:
+                        continue
+                    responses[response["id"]] = response
+                    headers = response.get("headers") or {}
+                    delay = parse_retry_after(headers.get("Retry-After"))
+                    status = response.get("status")
+                    if status == 429 or (status == 503 and delay is not None):
+                        throttled.append(request)
+                        retry_after = max(
+                            retry_after, 1.0 if delay is None else delay
+                        )
+                
+                # Whatever is left in by_id got no response at all
+                for request_id in by_id:
+                    logger.error(f"Graph batch reply is missing subrequest {request_id}")
+                    responses[request_id] = {
+                        "id": request_id,
+                        "status": 502,
+                        "headers": {},
+                        "body": {"error": {
+                            "code": "MissingBatchResponse",
+                            "message": "No response for this subrequest in the batch reply",
+                        }},
+                    }
             
-            logger.error(error_msg)
-            raise GraphAPIError(
-                error_msg,
-                status_code=e.response.status_code if e.response else None,
-                error_code=error_code,
-            ) from e
+            if not throttled or attempt >= self.max_retries:
+                break
             
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Graph request failed: {e}"
-            logger.error(error_msg)
-            raise GraphAPIError(error_msg) from e
+            attempt += 1
+            retry_after = min(retry_after, self.BATCH_MAX_RETRY_AFTER)
+            logger.warning(
+                f"{len(throttled)} batch subrequests throttled. "
+                f"Waiting {retry_after} seconds..."
+            )
+            time.sleep(retry_after)
+            pending = throttled
+        
+        return [responses[str(index)] for index in slots]
     
     # ============================================================
     # Task List Operations
@@ -325,6 +673,30 @@ class OutlookClient:
         
         return TaskList.from_api_response(response)
     
+    def find_task_list_by_name(self, name: str) -> Optional[TaskList]:
+        """
+        Look up a task list by display name.
+        
+        The match is done server-side with $filter, so only the matching
+        list is returned instead of every list the user has.
+        
+        Args:
+            name: Task list name
+            
+        Returns:
+            Matching TaskList, or None if there is none
+        """
+        # OData string literals escape single quotes by doubling them
+        escaped = name.replace("'", "''")
+        response = self._make_request(
+            "GET",
+            self.TASK_LISTS_ENDPOINT,
+            params={"$filter": f"displayName eq '{escaped}'", "$top": 1},
+        )
+        
+        items = response.get("value", [])
+        return TaskList.from_api_response(items[0]) if items else None
+    
     def get_or_create_task_list(self, name: str) -> TaskList:
         """
         Get existing task list by name, or create if not exists.
@@ -339,12 +711,10 @@ class OutlookClient:
         """
         logger.debug(f"Looking for task list: {name}")
         
-        task_lists = self.get_task_lists()
-        
-        for task_list in task_lists:
-            if task_list.display_name == name:
-                logger.debug(f"Found existing task list: {task_list.id}")
-                return task_list
+        task_list = self.find_task_list_by_name(name)
+        if task_list is not None:
+            logger.debug(f"Found existing task list: {task_list.id}")
+            return task_list
         
         # Create new list
         return self.create_task_list(name)
@@ -353,6 +723,54 @@ class OutlookClient:
     # Task Operations
     # ============================================================
     
+    def _tasks_endpoint(self, list_id: str) -> str:
+        """Return the tasks collection endpoint for a list."""
+        endpoint = self._tasks_endpoints.get(list_id)
+        if endpoint is None:
+            endpoint = self._tasks_endpoints[list_id] = self.TASKS_ENDPOINT.format(
+                list_id=list_id
+            )
+        return endpoint
+    
+    def _task_endpoint(self, list_id: str, task_id: str) -> str:
+        """Return the endpoint of a single task."""
+        return self._tasks_endpoint(list_id) + "/" + task_id
+    
+    def iter_tasks(self, list_id: str) -> Iterator[OutlookTask]:
+        """
+        Iterate over all tasks in a task list, page by page.
+        
+        While the tasks of one page are being consumed, the next page
+        is already being fetched on the client's executor.
+        
+        Args:
+            list_id: Task list ID
+            
+        Yields:
+            OutlookTask objects in Graph order
+        """
+        logger.debug(f"Fetching tasks for list {list_id}")
+        
+        response = self._make_request(
+            "GET",
+            self._tasks_endpoint(list_id),
+            params={"$top": self.TASKS_MAX_PAGE_SIZE, "$select": self.TASK_SELECT_FIELDS},
+        )
+        
+        while response is not None:
+            # nextLink is a full URL that already carries $top/$select
+            next_link = response.get("@odata.nextLink")
+            next_page = (
+                self._executor.submit(self._make_request, "GET", next_link)
+                if next_link
+                else None
+            )
+            
+            for item in response.get("value", []):
+                yield OutlookTask.from_api_response(item)
+            
+            response = next_page.result() if next_page is not None else None
+    
     def get_tasks(self, list_id: str) -> list[OutlookTask]:
         """
         Fetch all tasks in a task list.
@@ -363,32 +781,97 @@ class OutlookClient:
         Returns:
             List of OutlookTask objects
         """
-        logger.debug(f"Fetching tasks for list {list_id}")
+        all_tasks = list(self.iter_tasks(list_id))
         
-        endpoint = self.TASKS_ENDPOINT.format(list_id=list_id)
+        logger.debug(f"Found {len(all_tasks)} tasks")
+        return all_tasks
+    
+    def get_tasks_parallel(self, list_id: str) -> list[OutlookTask]:
+        """
+        Fetch all tasks in a task list, requesting pages concurrently.
         
-        all_tasks = []
-        next_link = endpoint
+        The first page asks Graph for the total count ($count); the
+        remaining pages are then fetched in parallel by offset ($skip).
+        Falls back to following @odata.nextLink when no count is given.
         
-        while next_link:
-            if next_link.startswith("http"):
-                # Full URL from @odata.nextLink
-                response = self._session.get(
-                    next_link,
-                    headers=self._get_headers(),
-                    timeout=self.timeout,
-                ).json()
-            else:
-                response = self._make_request("GET", next_link)
+        Args:
+            list_id: Task list ID
             
-            for item in response.get("value", []):
-                all_tasks.append(OutlookTask.from_api_response(item))
+        Returns:
+            List of OutlookTask objects
+        """
+        logger.debug(f"Fetching tasks for list {list_id} in parallel")
+        
+        endpoint = self._tasks_endpoint(list_id)
+        page_size = self.TASKS_PAGE_SIZE
+        
+        first = self._make_request(
+            "GET",
+            endpoint,
+            params={
+                "$count": "true",
+                "$top": page_size,
+                "$select": self.TASK_SELECT_FIELDS,
+            },
+        )
+        pages = [first.get("value", [])]
+        total = first.get("@odata.count")
+        
+        if total is None:
+            next_link = first.get("@odata.nextLink")
+            while next_link:
+                response = self._make_request("GET", next_link)
+                pages.append(response.get("value", []))
+                next_link = response.get("@odata.nextLink")
+        elif total > page_size:
+            def fetch_page(skip: int) -> list[dict]:
+                response = self._make_request(
+                    "GET",
+                    endpoint,
+                    params={
+                        "$top": page_size,
+                        "$skip": skip,
+                        "$select": self.TASK_SELECT_FIELDS,
+                    },
+                )
+                return response.get("value", [])
             
-            next_link = response.get("@odata.nextLink")
+            pages.extend(self._executor.map(fetch_page, range(page_size, total, page_size)))
+        
+        all_tasks = [
+            OutlookTask.from_api_response(item)
+            for page in pages
+            for item in page
+        ]
         
         logger.debug(f"Found {len(all_tasks)} tasks")
         return all_tasks
     
+    def map_tasks(
+        self,
+        list_id: str,
+        items: Iterable[T],
+        fn: Callable[[str, T], R],
+    ) -> list[R]:
+        """
+        Apply a per-task operation concurrently.
+        
+        Example:
+            client.map_tasks(list_id, task_ids, client.complete_task)
+        
+        Args:
+            list_id: Task list ID passed to every call
+            items: Per-call second argument (task, task ID, ...)
+            fn: Operation called as fn(list_id, item)
+            
+        Returns:
+            Results in input order
+            
+        Raises:
+            The first exception raised by fn, once earlier results are in
+        """
+        return list(self._executor.map(lambda item: fn(list_id, item), items))
+    
     def get_task(self, list_id: str, task_id: str) -> Optional[OutlookTask]:
         """
         Fetch a specific task.
@@ -400,7 +883,7 @@ class OutlookClient:
         Returns:
             OutlookTask object, or None if not found
         """
-        endpoint = self.TASK_ENDPOINT.format(list_id=list_id, task_id=task_id)
+        endpoint = self._task_endpoint(list_id, task_id)
         
         try:
             response = self._make_request("GET", endpoint)
@@ -410,6 +893,11 @@ class OutlookClient:
                 return None
             raise
     
+    @staticmethod
+    def _build_create_payload(task: OutlookTask) -> dict:
+        """Build the POST body for creating a task."""
+        return task.to_api_payload()
+    
     def create_task(self, list_id: str, task: OutlookTask) -> OutlookTask:
         """
         Create a new task.
@@ -423,12 +911,12 @@ class OutlookClient:
         """
         logger.info(f"Creating task: {task.title}")
         
-        endpoint = self.TASKS_ENDPOINT.format(list_id=list_id)
+        endpoint = self._tasks_endpoint(list_id)
         
         response = self._make_request(
             "POST",
             endpoint,
-            data=task.to_api_payload(),
+            data=self._build_create_payload(task),
         )
         
         return OutlookTask.from_api_response(response)
@@ -454,36 +942,9 @@ class OutlookClient:
         """
         logger.info(f"Updating task {task_id}: {list(updates.keys())}")
         
-        endpoint = self.TASK_ENDPOINT.format(list_id=list_id, task_id=task_id)
-        
-        # Build minimal payload
-        payload = {}
-        
-        if "title" in updates:
-            payload["title"] = updates["title"]
-        
-        if "status" in updates:
-            status = updates["status"]
-            if isinstance(status, TaskStatus):
-                payload["status"] = status.value
-            else:
-                payload["status"] = status
-        
-        if "due_date" in updates:
-            due = updates["due_date"]
-            if due:
-                payload["dueDateTime"] = {
-                    "dateTime": f"{due.isoformat()}T00:00:00",
-                    "timeZone": "UTC",
-                }
-            else:
-                payload["dueDateTime"] = None
+        endpoint = self._task_endpoint(list_id, task_id)
         
-        if "body_content" in updates:
-            payload["body"] = {
-                "content": updates["body_content"],
-                "contentType": "text",
-            }
+        payload = OutlookTask.to_update_payload(updates)
         
         response = self._make_request("PATCH", endpoint, data=payload)
         
@@ -529,13 +990,123 @@ class OutlookClient:
         """
         logger.info(f"Deleting task {task_id}")
         
-        endpoint = self.TASK_ENDPOINT.format(list_id=list_id, task_id=task_id)
+        endpoint = self._task_endpoint(list_id, task_id)
         self._make_request("DELETE", endpoint)
     
+    # ============================================================
+    # Bulk Task Operations (via $batch)
+    # ============================================================
+    
+    def _batch_error(self, response: dict) -> GraphAPIError:
+        """Build a GraphAPIError from a failed batch sub-response."""
+        error = (response.get("body") or {}).get("error") or {}
+        error_msg = f"Graph API error: {error.get('message', response['status'])}"
+        headers = response.get("headers") or {}
+        logger.error(error_msg)
+        return GraphAPIError(
+            error_msg,
+            status_code=response["status"],
+            error_code=error.get("code"),
+            retry_after=parse_retry_after(headers.get("Retry-After")),
+        )
+    
+    def _batch_tasks(self, subrequests: list[dict]) -> list[OutlookTask | GraphAPIError]:
+        """Run task subrequests and parse each sub-response into a task."""
+        results: list[OutlookTask | GraphAPIError] = []
+        for response in self.batch(subrequests):
+            if response["status"] >= 400:
+                results.append(self._batch_error(response))
+            else:
+                results.append(OutlookTask.from_api_response(response["body"]))
+        return results
+    
+    def create_tasks(
+        self,
+        list_id: str,
+        tasks: list[OutlookTask],
+    ) -> list[OutlookTask | GraphAPIError]:
+        """
+        Create several tasks in as few round-trips as possible.
+        
+        Args:
+            list_id: Task list ID
+            tasks: Tasks to create
+            
+        Returns:
+            Per input task, the created task or the GraphAPIError that
+            prevented it
+        """
+        logger.info(f"Creating {len(tasks)} tasks")
+        
+        endpoint = self._tasks_endpoint(list_id)
+        return self._batch_tasks([
+            {"method": "POST", "url": endpoint, "body": self._build_create_payload(task)}
+            for task in tasks
+        ])
+    
+    def update_tasks(
+        self,
+        list_id: str,
+        updates: list[tuple[str, dict]],
+    ) -> list[OutlookTask | GraphAPIError]:
+        """
+        Update several tasks in as few round-trips as possible.
+        
+        Args:
+            list_id: Task list ID
+            updates: (task_id, field changes) pairs, as for update_task()
+            
+        Returns:
+            Per input pair, the updated task or the GraphAPIError that
+            prevented it
+        """
+        logger.info(f"Updating {len(updates)} tasks")
+        
+        return self._batch_tasks([
+            {
+                "method": "PATCH",
+                "url": self._task_endpoint(list_id, task_id),
+                "body": OutlookTask.to_update_payload(changes),
+            }
+            for task_id, changes in updates
+        ])
+    
+    def delete_tasks(
+        self,
+        list_id: str,
+        task_ids: list[str],
+    ) -> list[Optional[GraphAPIError]]:
+        """
+        Delete several tasks in as few round-trips as possible.
+        
+        Args:
+            list_id: Task list ID
+            task_ids: IDs of tasks to delete
+            
+        Returns:
+            Per input ID, None on success or the GraphAPIError that
+            prevented the deletion
+        """
+        logger.info(f"Deleting {len(task_ids)} tasks")
+        
+        responses = self.batch([
+            {
+                "method": "DELETE",
+                "url": self._task_endpoint(list_id, task_id),
+            }
+            for task_id in task_ids
+        ])
+        return [
+            self._batch_error(response) if response["status"] >= 400 else None
+            for response in responses
+        ]
+    
     def close(self) -> None:
-        """Close the HTTP session and save token cache."""
-        self._save_token_cache()
-        self._session.close()
+        """Close the worker and connection pools and save token cache."""
+        self._save_token_cache(force=True)
+        self._executor.shutdown(wait=True)
+        self._pool.clear()
+        self._msal_session.close()
         logger.debug("Outlook client session closed")
     
     def __enter__(self) -> "OutlookClient":
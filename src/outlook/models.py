@@ -4,12 +4,19 @@ Microsoft Graph / Outlook Tasks data models.
 These models represent Outlook Tasks and Task Lists.
 """
 
+import re
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Optional
 from enum import Enum
 
 
+# One "Label: value" metadata line in a task body
+_METADATA_LINE_RE = re.compile(r"^(Course ID|Assignment ID|URL):(.*)$", re.MULTILINE)
+
+
 class TaskStatus(Enum):
     """Outlook task status values."""
     NOT_STARTED = "notStarted"
@@ -26,7 +33,54 @@ class TaskImportance(Enum):
     HIGH = "high"
 
 
-@dataclass(frozen=True)
+# Enum member -> wire value, looked up instead of going through .value
+_STATUS_VALUES = {status: status.value for status in TaskStatus}
+_IMPORTANCE_VALUES = {importance: importance.value for importance in TaskImportance}
+
+
+if sys.version_info >= (3, 11):
+    # Accepts Graph's trailing "Z" and 7-digit fractions directly
+    _parse_datetime = datetime.fromisoformat
+else:
+    def _parse_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _graph_datetime(value) -> Optional[datetime]:
+    """
+    Parse a Graph timestamp.
+    
+    Args:
+        value: ISO 8601 string, a dateTimeTimeZone object, or None
+        
+    Returns:
+        Parsed datetime, or None when the value is missing
+    """
+    if isinstance(value, dict):
+        value = value.get("dateTime")
+    return _parse_datetime(value) if value else None
+
+
+@lru_cache(maxsize=1024)
+def _due_date_time(due: date) -> str:
+    """Format a due date as the Graph dateTime string (midnight UTC)."""
+    return f"{due.isoformat()}T00:00:00"
+
+
+# Update field name -> (Graph property, wire value), for to_update_payload
+_UPDATE_FIELDS = {
+    "title": lambda title: ("title", title),
+    # Raw status strings are passed through unchanged
+    "status": lambda status: ("status", _STATUS_VALUES.get(status, status)),
+    "due_date": lambda due: (
+        "dueDateTime",
+        {"dateTime": _due_date_time(due), "timeZone": "UTC"} if due else None,
+    ),
+    "body_content": lambda content: ("body", {"content": content, "contentType": "text"}),
+}
+
+
+@dataclass(frozen=True, slots=True)
 class TaskList:
     """
     Represents an Outlook Task List.
@@ -53,7 +107,7 @@ class TaskList:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OutlookTask:
     """
     Represents an Outlook Task (Microsoft To Do).
@@ -92,8 +146,8 @@ class OutlookTask:
         """
         payload = {
             "title": self.title,
-            "status": self.status.value,
-            "importance": self.importance.value,
+            "status": _STATUS_VALUES[self.status],
+            "importance": _IMPORTANCE_VALUES[self.importance],
         }
         
         if self.body_content:
@@ -104,7 +158,7 @@ class OutlookTask:
         
         if self.due_date:
             payload["dueDateTime"] = {
-                "dateTime": f"{self.due_date.isoformat()}T00:00:00",
+                "dateTime": _due_date_time(self.due_date),
                 "timeZone": "UTC",
             }
         
@@ -113,71 +167,29 @@ class OutlookTask:
         
         return payload
     
-    def to_update_payload(self, changes_only: dict) -> dict:
+    @staticmethod
+    def to_update_payload(changes_only: dict) -> dict:
         """
         Create minimal update payload with only changed fields.
         
         Args:
-            changes_only: Dictionary of field names to new values
+            changes_only: Dictionary of field names ("title", "status",
+                "due_date", "body_content") to new values
             
         Returns:
             Minimal API payload for PATCH request
         """
-        payload = {}
-        
-        if "title" in changes_only:
-            payload["title"] = changes_only["title"]
-        
-        if "status" in changes_only:
-            payload["status"] = changes_only["status"].value
-        
-        if "due_date" in changes_only:
-            due = changes_only["due_date"]
-            if due:
-                payload["dueDateTime"] = {
-                    "dateTime": f"{due.isoformat()}T00:00:00",
-                    "timeZone": "UTC",
-                }
-            else:
-                payload["dueDateTime"] = None
-        
-        if "body_content" in changes_only:
-            payload["body"] = {
-                "content": changes_only["body_content"],
-                "contentType": "text",
-            }
-        
-        return payload
+        return dict(
+            _UPDATE_FIELDS[name](value)
+            for name, value in changes_only.items()
+            if name in _UPDATE_FIELDS
+        )
     
     @classmethod
     def from_api_response(cls, data: dict) -> "OutlookTask":
         """Create OutlookTask from Microsoft Graph API response."""
-        due_date = None
-        if data.get("dueDateTime") and data["dueDateTime"].get("dateTime"):
-            due_str = data["dueDateTime"]["dateTime"]
-            # Handle both date and datetime formats
-            if "T" in due_str:
-                due_date = datetime.fromisoformat(due_str.replace("Z", "+00:00")).date()
-            else:
-                due_date = date.fromisoformat(due_str)
-        
-        created = None
-        if data.get("createdDateTime"):
-            created = datetime.fromisoformat(
-                data["createdDateTime"].replace("Z", "+00:00")
-            )
-        
-        modified = None
-        if data.get("lastModifiedDateTime"):
-            modified = datetime.fromisoformat(
-                data["lastModifiedDateTime"].replace("Z", "+00:00")
-            )
-        
-        completed = None
-        if data.get("completedDateTime") and data["completedDateTime"].get("dateTime"):
-            completed = datetime.fromisoformat(
-                data["completedDateTime"]["dateTime"].replace("Z", "+00:00")
-            )
+        # Date-only and full datetime strings both parse; keep the date
+        due = _graph_datetime(data.get("dueDateTime"))
         
         body_content = ""
         if data.get("body") and data["body"].get("content"):
@@ -187,17 +199,17 @@ class OutlookTask:
             id=data["id"],
             title=data.get("title", ""),
             body_content=body_content,
-            due_date=due_date,
+            due_date=due.date() if due is not None else None,
             status=TaskStatus(data.get("status", "notStarted")),
             importance=TaskImportance(data.get("importance", "normal")),
             categories=data.get("categories", []),
-            created_datetime=created,
-            last_modified_datetime=modified,
-            completed_datetime=completed,
+            created_datetime=_graph_datetime(data.get("createdDateTime")),
+            last_modified_datetime=_graph_datetime(data.get("lastModifiedDateTime")),
+            completed_datetime=_graph_datetime(data.get("completedDateTime")),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CanvasTaskMetadata:
     """
     Metadata embedded in task body to identify Canvas source.
@@ -228,30 +240,30 @@ class CanvasTaskMetadata:
         
         Returns None if metadata cannot be parsed.
         """
+        # A single C-level scan picks out the metadata lines in any order;
+        # a repeated label keeps its last value
+        fields = {
+            label: value.strip()
+            for label, value in _METADATA_LINE_RE.findall(content)
+        }
+        
         try:
-            lines = content.strip().split("\n")
-            course_id = None
-            assignment_id = None
-            url = ""
-            
-            for line in lines:
-                if line.startswith("Course ID:"):
-                    course_id = int(line.split(":", 1)[1].strip())
-                elif line.startswith("Assignment ID:"):
-                    assignment_id = int(line.split(":", 1)[1].strip())
-                elif line.startswith("URL:"):
-                    url = line.split(":", 1)[1].strip()
-                    # Handle URLs that have : in them
-                    if "://" not in url:
-                        url = "https:" + url
-            
-            if course_id and assignment_id:
-                return cls(
-                    canvas_course_id=course_id,
-                    canvas_assignment_id=assignment_id,
-                    canvas_url=url,
-                )
-            return None
-            
-        except (ValueError, IndexError):
+            course_id = int(fields["Course ID"]) if "Course ID" in fields else None
+            assignment_id = (
+                int(fields["Assignment ID"]) if "Assignment ID" in fields else None
+            )
+        except ValueError:
             return None
+        
+        url = fields.get("URL", "")
+        # Handle URLs that have : in them
+        if url and "://" not in url:
+            url = "https:" + url
+        
+        if course_id and assignment_id:
+            return cls(
+                canvas_course_id=course_id,
+                canvas_assignment_id=assignment_id,
+                canvas_url=url,
+            )
+        return None
@@ -1,6 +1,6 @@
 """Persistent state storage module."""
 
 from .state_store import StateStore
-from .models import SyncState
+from .models import StatusSummary, SyncState
 
-__all__ = ["StateStore", "SyncState"]
+__all__ = ["StateStore", "StatusSummary", "SyncState"]
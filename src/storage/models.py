@@ -4,12 +4,22 @@ Persistent state storage models.
 These models track the sync state between Canvas and Outlook.
 """
 
+import json
 from dataclasses import dataclass
-from datetime import datetime, date
+from datetime import datetime
 from typing import Optional
 
+# Bound once; called for two timestamp columns on every row read
+_from_iso = datetime.fromisoformat
 
-@dataclass
+# Compact separators; export size matters more than readability
+_json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+# Stored submission flag (0/1) -> last_seen_submission_state
+_SUBMISSION_STATES = ("not_submitted", "submitted")
+
+
+@dataclass(slots=True)
 class SyncState:
     """
     Represents the synchronized state of a Canvas assignment.
@@ -55,13 +65,6 @@ class SyncState:
         """Check if assignment was previously marked as submitted."""
         return self.last_seen_submission_state == "submitted"
     
-    @property
-    def due_date_as_date(self) -> Optional[date]:
-        """Parse the due date string to a date object."""
-        if self.last_seen_due_date:
-            return date.fromisoformat(self.last_seen_due_date)
-        return None
-    
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
         return {
@@ -79,13 +82,8 @@ class SyncState:
     @classmethod
     def from_dict(cls, data: dict) -> "SyncState":
         """Create from dictionary."""
-        last_synced = None
-        if data.get("last_synced_at"):
-            last_synced = datetime.fromisoformat(data["last_synced_at"])
-        
-        created = None
-        if data.get("created_at"):
-            created = datetime.fromisoformat(data["created_at"])
+        last_synced = data.get("last_synced_at")
+        created = data.get("created_at")
         
         return cls(
             canvas_course_id=data["canvas_course_id"],
@@ -94,14 +92,47 @@ class SyncState:
             last_seen_submission_state=data.get("last_seen_submission_state", "not_submitted"),
             last_seen_due_date=data.get("last_seen_due_date"),
             last_seen_title=data.get("last_seen_title", ""),
-            last_synced_at=last_synced,
+            last_synced_at=_from_iso(last_synced) if last_synced else None,
             is_archived=data.get("is_archived", False),
-            created_at=created,
+            created_at=_from_iso(created) if created else None,
         )
     
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize to a compact JSON array for bulk export.
+        
+        Fields are written positionally in from_row order, so no key
+        lookups or dict is built; from_json_bytes reverses it.
+        
+        Returns:
+            UTF-8 encoded JSON array
+        """
+        last_synced_at = self.last_synced_at
+        created_at = self.created_at
+        return _json_encode((
+            self.canvas_course_id,
+            self.canvas_assignment_id,
+            self.outlook_task_id,
+            1 if self.last_seen_submission_state == "submitted" else 0,
+            self.last_seen_due_date,
+            self.last_seen_title,
+            last_synced_at.isoformat() if last_synced_at else None,
+            self.is_archived,
+            created_at.isoformat() if created_at else None,
+        )).encode()
+    
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> "SyncState":
+        """Create from the output of to_json_bytes."""
+        return cls.from_row(json.loads(data))
+    
     @classmethod
     def from_row(cls, row: tuple) -> "SyncState":
-        """Create from SQLite row tuple."""
+        """
+        Create from SQLite row tuple (StateStore.SELECT_SQL column order).
+        
+        The submission state is stored as 1 (submitted) or 0.
+        """
         (
             canvas_course_id,
             canvas_assignment_id,
@@ -114,22 +145,46 @@ class SyncState:
             created_at,
         ) = row
         
-        last_synced = None
-        if last_synced_at:
-            last_synced = datetime.fromisoformat(last_synced_at)
-        
-        created = None
-        if created_at:
-            created = datetime.fromisoformat(created_at)
-        
+        # Positional arguments, in field order
         return cls(
-            canvas_course_id=canvas_course_id,
-            canvas_assignment_id=canvas_assignment_id,
-            outlook_task_id=outlook_task_id,
-            last_seen_submission_state=last_seen_submission_state or "not_submitted",
-            last_seen_due_date=last_seen_due_date,
-            last_seen_title=last_seen_title or "",
-            last_synced_at=last_synced,
-            is_archived=bool(is_archived),
-            created_at=created,
+            canvas_course_id,
+            canvas_assignment_id,
+            outlook_task_id,
+            _SUBMISSION_STATES[1 if last_seen_submission_state else 0],
+            last_seen_due_date,
+            last_seen_title or "",
+            _from_iso(last_synced_at) if last_synced_at else None,
+            bool(is_archived),
+            _from_iso(created_at) if created_at else None,
         )
+    
+    @classmethod
+    def from_rows(cls, rows: list[tuple]) -> list["SyncState"]:
+        """Create from a batch of SQLite row tuples."""
+        from_row = cls.from_row
+        return [from_row(row) for row in rows]
+
+
+@dataclass(frozen=True)
+class StatusSummary:
+    """
+    Aggregate counts over the state store, as shown by --status.
+    
+    Attributes:
+        total: All tracked assignments, including archived
+        active: Assignments that are not archived
+        submitted: Active assignments last seen as submitted
+    """
+    total: int = 0
+    active: int = 0
+    submitted: int = 0
+    
+    @property
+    def archived(self) -> int:
+        """Assignments that were archived."""
+        return self.total - self.active
+    
+    @property
+    def pending(self) -> int:
+        """Active assignments not yet submitted."""
+        return self.active - self.submitted
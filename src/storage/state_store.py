@@ -2,17 +2,21 @@
 SQLite-based persistent state store.
 
 Provides atomic, durable storage for sync state.
-All operations are idempotent and safe for concurrent access.
+All operations are idempotent and safe to call from several threads:
+every use of the shared connection is serialized, so a read never sees
+another thread's uncommitted write.
 """
 
 import logging
 import sqlite3
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Mapping, Optional
 
-from .models import SyncState
+from .models import StatusSummary, SyncState
 
 logger = logging.getLogger(__name__)
 
@@ -28,9 +32,14 @@ class StateStore:
     
     Features:
     - Atomic updates with transactions
-    - Connection pooling via context manager
+    - One long-lived connection, shared across threads
     - Automatic schema migration
-    - Safe for scheduler-based usage
+    - Safe for scheduler-based usage within one process
+    
+    get() keeps recently read rows in a per-process cache that is only
+    updated by this store's own committed writes. Writes to the same
+    database from another process are not seen through get() until the
+    row leaves the cache, so run a single writing process per database.
     
     Usage:
         store = StateStore(Path("data/sync_state.db"))
@@ -43,28 +52,174 @@ class StateStore:
         store.save(state)
     """
     
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 4
     
     CREATE_TABLE_SQL = """
         CREATE TABLE IF NOT EXISTS sync_state (
             canvas_course_id INTEGER NOT NULL,
             canvas_assignment_id INTEGER NOT NULL,
             outlook_task_id TEXT,
-            last_seen_submission_state TEXT DEFAULT 'not_submitted',
+            last_seen_submission_state INTEGER DEFAULT 0,  -- 1 if submitted
             last_seen_due_date TEXT,
             last_seen_title TEXT,
             last_synced_at TEXT,
             is_archived INTEGER DEFAULT 0,
             created_at TEXT,
             PRIMARY KEY (canvas_course_id, canvas_assignment_id)
-        )
+        ) WITHOUT ROWID
     """
     
     CREATE_INDEXES_SQL = [
-        "CREATE INDEX IF NOT EXISTS idx_outlook_task_id ON sync_state(outlook_task_id)",
-        "CREATE INDEX IF NOT EXISTS idx_is_archived ON sync_state(is_archived)",
+        # Only synced rows have a task ID
+        (
+            "CREATE INDEX IF NOT EXISTS idx_outlook_task_id ON sync_state(outlook_task_id) "
+            "WHERE outlook_task_id IS NOT NULL"
+        ),
+        # Covers status_summary() so it never touches the table itself, and
+        # serves is_archived filters through its leading column
+        (
+            "CREATE INDEX IF NOT EXISTS idx_archived_submission "
+            "ON sync_state(is_archived, last_seen_submission_state)"
+        ),
     ]
     
+    # Column order matches SyncState.from_row
+    COLUMNS = (
+        "canvas_course_id",
+        "canvas_assignment_id",
+        "outlook_task_id",
+        "last_seen_submission_state",
+        "last_seen_due_date",
+        "last_seen_title",
+        "last_synced_at",
+        "is_archived",
+        "created_at",
+    )
+    SELECT_SQL = f"SELECT {', '.join(COLUMNS)} FROM sync_state"
+    SELECT_BY_KEY_SQL = f"{SELECT_SQL} WHERE canvas_course_id = ? AND canvas_assignment_id = ?"
+    EXISTS_SQL = (
+        "SELECT 1 FROM sync_state WHERE canvas_course_id = ? AND canvas_assignment_id = ?"
+    )
+    # Formatted with one "(?, ?)" per key
+    SELECT_BY_KEYS_SQL = (
+        f"{SELECT_SQL} WHERE (canvas_course_id, canvas_assignment_id) IN (VALUES {{}})"
+    )
+    SELECT_BY_TASK_ID_SQL = f"{SELECT_SQL} WHERE outlook_task_id = ?"
+    SELECT_ALL_SQL = f"{SELECT_SQL} ORDER BY canvas_course_id, canvas_assignment_id"
+    SELECT_ACTIVE_SQL = (
+        f"{SELECT_SQL} WHERE is_archived = 0 ORDER BY canvas_course_id, canvas_assignment_id"
+    )
+    # Keyset pages for iter_all(); "+is_archived" keeps the primary key
+    # order instead of sorting every active row for each page
+    SELECT_PAGE_SQL = (
+        f"{SELECT_SQL} WHERE (canvas_course_id, canvas_assignment_id) > (?, ?) "
+        "ORDER BY canvas_course_id, canvas_assignment_id LIMIT ?"
+    )
+    SELECT_ACTIVE_PAGE_SQL = (
+        f"{SELECT_SQL} WHERE (canvas_course_id, canvas_assignment_id) > (?, ?) "
+        "AND +is_archived = 0 ORDER BY canvas_course_id, canvas_assignment_id LIMIT ?"
+    )
+    
+    FETCH_BATCH_SIZE = 1000
+    
+    # Keys per get_many() query; two variables each stays under the
+    # 999-variable limit of older SQLite builds
+    GET_MANY_CHUNK_SIZE = 499
+    
+    # Rows kept by get() for repeated lookups of the same assignment;
+    # per process, filled only from committed reads and this store's writes
+    ROW_CACHE_SIZE = 4096
+    
+    # Current Canvas values for get_changed_states(), per connection
+    CREATE_CURRENT_TABLE_SQL = """
+        CREATE TEMP TABLE IF NOT EXISTS canvas_current (
+            canvas_course_id INTEGER NOT NULL,
+            canvas_assignment_id INTEGER NOT NULL,
+            title TEXT NOT NULL,
+            due_date TEXT,
+            is_submitted INTEGER NOT NULL,
+            PRIMARY KEY (canvas_course_id, canvas_assignment_id)
+        )
+    """
+    
+    # Rows that are unsynced or differ in title, due date or submission
+    SELECT_CHANGED_SQL = (
+        "SELECT c.canvas_course_id, c.canvas_assignment_id, "
+        + ", ".join(f"s.{column}" for column in COLUMNS)
+        + """
+        FROM temp.canvas_current AS c
+        LEFT JOIN sync_state AS s
+            ON s.canvas_course_id = c.canvas_course_id
+            AND s.canvas_assignment_id = c.canvas_assignment_id
+        WHERE s.outlook_task_id IS NULL
+            OR COALESCE(s.last_seen_title, '') != c.title
+            OR s.last_seen_due_date IS NOT c.due_date
+            OR s.last_seen_submission_state != c.is_submitted
+        """
+    )
+    
+    UPSERT_SQL = """
+        INSERT INTO sync_state (
+            canvas_course_id,
+            canvas_assignment_id,
+            outlook_task_id,
+            last_seen_submission_state,
+            last_seen_due_date,
+            last_seen_title,
+            last_synced_at,
+            is_archived,
+            created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (canvas_course_id, canvas_assignment_id) DO UPDATE SET
+            outlook_task_id = excluded.outlook_task_id,
+            last_seen_submission_state = excluded.last_seen_submission_state,
+            last_seen_due_date = excluded.last_seen_due_date,
+            last_seen_title = excluded.last_seen_title,
+            last_synced_at = excluded.last_synced_at,
+            is_archived = excluded.is_archived,
+            created_at = excluded.created_at
+    """
+    
+    ARCHIVE_SQL = """
+        UPDATE sync_state
+        SET is_archived = 1, last_synced_at = ?
+        WHERE canvas_course_id = ? AND canvas_assignment_id = ?
+    """
+    
+    SELECT_SYNCED_KEYS_SQL = """
+        SELECT canvas_course_id, canvas_assignment_id
+        FROM sync_state
+        WHERE outlook_task_id IS NOT NULL AND is_archived = 0
+    """
+    
+    COUNT_ALL_SQL = "SELECT COUNT(*) FROM sync_state"
+    COUNT_ACTIVE_SQL = "SELECT COUNT(*) FROM sync_state WHERE is_archived = 0"
+    
+    SELECT_META_SQL = "SELECT value FROM _metadata WHERE key = ?"
+    UPSERT_META_SQL = "INSERT OR REPLACE INTO _metadata (key, value) VALUES (?, ?)"
+    DELETE_META_SQL = "DELETE FROM _metadata WHERE key = ?"
+    
+    STATUS_SUMMARY_SQL = """
+        SELECT
+            COUNT(*),
+            COALESCE(SUM(is_archived = 0), 0),
+            COALESCE(SUM(is_archived = 0 AND last_seen_submission_state = 1), 0)
+        FROM sync_state
+    """
+    
+    # Applied once when the connection is opened. synchronous=NORMAL is
+    # safe from corruption under WAL, but the last commits before a power
+    # loss may be rolled back; pass synchronous="FULL" to fsync every commit.
+    CONNECTION_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA busy_timeout=30000",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA foreign_keys=ON",
+    )
+    SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+    
     CREATE_METADATA_TABLE_SQL = """
         CREATE TABLE IF NOT EXISTS _metadata (
             key TEXT PRIMARY KEY,
@@ -72,51 +227,78 @@ class StateStore:
         )
     """
     
-    def __init__(self, database_path: Path):
+    # ETag of each course's last fully synced assignment list
+    CREATE_COURSE_ETAG_TABLE_SQL = """
+        CREATE TABLE IF NOT EXISTS course_etag (
+            canvas_course_id INTEGER PRIMARY KEY,
+            etag TEXT NOT NULL
+        )
+    """
+    
+    def __init__(self, database_path: Path, synchronous: str = "NORMAL"):
         """
         Initialize state store.
         
         Args:
             database_path: Path to SQLite database file
+            synchronous: SQLite synchronous mode (OFF, NORMAL, FULL, EXTRA)
+            
+        Raises:
+            ValueError: If synchronous is not a known mode
         """
+        synchronous = synchronous.upper()
+        if synchronous not in self.SYNCHRONOUS_MODES:
+            raise ValueError(f"Invalid synchronous mode: {synchronous}")
+        
         self.database_path = database_path
+        self.synchronous = synchronous
         
         # Ensure parent directory exists
         self.database_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # Opened once. Every use holds the lock, and a write transaction
+        # holds it from BEGIN to COMMIT, so reads only see committed rows.
+        self._conn = self._connect()
+        self._lock = threading.RLock()
+        
+        # (course_id, assignment_id) -> row tuple, least recently used first.
+        # Rows rather than SyncStates, since callers may mutate what get() returns.
+        self._row_cache: OrderedDict[tuple[int, int], tuple] = OrderedDict()
+        self._row_cache_lock = threading.Lock()
+        
         # Initialize database
         self._initialize_database()
         
-        logger.info(f"State store initialized at {self.database_path}")
+        logger.info("State store initialized at %s", self.database_path)
     
     def _initialize_database(self) -> None:
         """Create tables and run migrations."""
-        with self._get_connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.cursor()
             
             # Create metadata table
             cursor.execute(self.CREATE_METADATA_TABLE_SQL)
             
             # Check schema version
-            cursor.execute("SELECT value FROM _metadata WHERE key = 'schema_version'")
+            cursor.execute(self.SELECT_META_SQL, ("schema_version",))
             row = cursor.fetchone()
             current_version = int(row[0]) if row else 0
             
             if current_version < self.SCHEMA_VERSION:
-                logger.info(f"Upgrading schema from v{current_version} to v{self.SCHEMA_VERSION}")
+                logger.info(
+                    "Upgrading schema from v%d to v%d", current_version, self.SCHEMA_VERSION
+                )
                 self._run_migrations(cursor, current_version)
                 
                 cursor.execute(
-                    "INSERT OR REPLACE INTO _metadata (key, value) VALUES (?, ?)",
-                    ("schema_version", str(self.SCHEMA_VERSION)),
+                    self.UPSERT_META_SQL, ("schema_version", str(self.SCHEMA_VERSION))
                 )
             
             # Create main table and indexes
             cursor.execute(self.CREATE_TABLE_SQL)
             for index_sql in self.CREATE_INDEXES_SQL:
                 cursor.execute(index_sql)
-            
-            conn.commit()
+            cursor.execute(self.CREATE_COURSE_ETAG_TABLE_SQL)
     
     def _run_migrations(self, cursor: sqlite3.Cursor, from_version: int) -> None:
         """
@@ -126,32 +308,103 @@ class StateStore:
             cursor: Database cursor
             from_version: Current schema version
         """
-        # Future migrations go here
-        # if from_version < 2:
-        #     cursor.execute("ALTER TABLE sync_state ADD COLUMN new_column TEXT")
-        pass
+        if from_version < 4:
+            # v2: sync_state is WITHOUT ROWID; v4: the submission state is
+            # stored as INTEGER 0/1. Both need a table rebuild, done once.
+            # Fresh databases have no table yet and skip straight to v4.
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sync_state'"
+            )
+            if cursor.fetchone():
+                columns = ", ".join(self.COLUMNS)
+                select = columns.replace(
+                    "last_seen_submission_state",
+                    "last_seen_submission_state IN ('submitted', 1)",
+                )
+                cursor.execute("ALTER TABLE sync_state RENAME TO sync_state_old")
+                cursor.execute(self.CREATE_TABLE_SQL)
+                cursor.execute(
+                    f"INSERT INTO sync_state ({columns}) SELECT {select} FROM sync_state_old"
+                )
+                # Drops the old indexes with it; they are recreated partial
+                cursor.execute("DROP TABLE sync_state_old")
+        
+        if from_version < 3:
+            # v3: is_archived alone is covered by idx_archived_submission
+            cursor.execute("DROP INDEX IF EXISTS idx_is_archived")
     
-    @contextmanager
-    def _get_connection(self) -> Iterator[sqlite3.Connection]:
+    def _connect(self) -> sqlite3.Connection:
         """
-        Get a database connection with proper settings.
+        Open the database connection with proper settings.
         
-        Yields:
-            SQLite connection with WAL mode and foreign keys enabled
+        Returns:
+            SQLite connection with CONNECTION_PRAGMAS applied
         """
         conn = sqlite3.connect(
             self.database_path,
             timeout=30.0,
-            isolation_level="DEFERRED",
+            # Autocommit: reads run outside any transaction, and
+            # _write_connection() opens its own
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
         )
         
-        try:
-            # Enable WAL mode for better concurrency
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA foreign_keys=ON")
-            yield conn
-        finally:
-            conn.close()
+        for pragma in self.CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        return conn
+    
+    @contextmanager
+    def _get_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Get the store's database connection for reads.
+        
+        Holds the connection lock for the block, so no write transaction
+        of another thread is open while it runs.
+        
+        Yields:
+            The shared SQLite connection (not closed on exit)
+        """
+        with self._lock:
+            yield self._conn
+    
+    @contextmanager
+    def _write_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Get the database connection for a write transaction.
+        
+        Holds the connection lock and runs the block in BEGIN IMMEDIATE,
+        so the database write lock is taken up front. The transaction commits
+        when the block exits normally and rolls back if it raises.
+        
+        Yields:
+            The shared SQLite connection
+        """
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.execute("COMMIT")
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+    
+    def _cache_rows(self, rows: Iterable[tuple]) -> None:
+        """Store rows (in COLUMNS order) in the get() cache."""
+        with self._row_cache_lock:
+            cache = self._row_cache
+            for row in rows:
+                key = (row[0], row[1])
+                cache[key] = row
+                cache.move_to_end(key)
+            while len(cache) > self.ROW_CACHE_SIZE:
+                cache.popitem(last=False)
     
     def get(self, course_id: int, assignment_id: int) -> Optional[SyncState]:
         """
@@ -164,30 +417,70 @@ class StateStore:
         Returns:
             SyncState if found, None otherwise
         """
+        key = (course_id, assignment_id)
+        with self._row_cache_lock:
+            row = self._row_cache.get(key)
+            if row is not None:
+                self._row_cache.move_to_end(key)
+        
+        if row is None:
+            # Cached while the lock is held, so the row is committed and no
+            # later write can be cached before it
+            with self._get_connection() as conn:
+                row = conn.execute(self.SELECT_BY_KEY_SQL, key).fetchone()
+                if row is None:
+                    return None
+                self._cache_rows((row,))
+        
+        return SyncState.from_row(row)
+    
+    def exists(self, course_id: int, assignment_id: int) -> bool:
+        """
+        Check whether a sync state is stored for an assignment.
+        
+        Unlike get(), no row is read into a SyncState, and the row cache
+        is bypassed, so the answer always reflects the database.
+        
+        Args:
+            course_id: Canvas course ID
+            assignment_id: Canvas assignment ID
+            
+        Returns:
+            True if a record exists, archived or not
+        """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT 
-                    canvas_course_id,
-                    canvas_assignment_id,
-                    outlook_task_id,
-                    last_seen_submission_state,
-                    last_seen_due_date,
-                    last_seen_title,
-                    last_synced_at,
-                    is_archived,
-                    created_at
-                FROM sync_state
-                WHERE canvas_course_id = ? AND canvas_assignment_id = ?
-                """,
-                (course_id, assignment_id),
-            )
+            return conn.execute(
+                self.EXISTS_SQL, (course_id, assignment_id)
+            ).fetchone() is not None
+    
+    def get_many(
+        self, keys: Iterable[tuple[int, int]]
+    ) -> dict[tuple[int, int], SyncState]:
+        """
+        Get sync states for many assignments.
+        
+        Runs one query per GET_MANY_CHUNK_SIZE keys instead of one per key.
+        
+        Args:
+            keys: (course_id, assignment_id) pairs
             
-            row = cursor.fetchone()
-            if row:
-                return SyncState.from_row(row)
-            return None
+        Returns:
+            Mapping of key to SyncState; keys without a stored state are absent
+        """
+        keys = list(dict.fromkeys(keys))
+        chunk_size = self.GET_MANY_CHUNK_SIZE
+        from_row = SyncState.from_row
+        
+        states = {}
+        with self._get_connection() as conn:
+            for start in range(0, len(keys), chunk_size):
+                chunk = keys[start:start + chunk_size]
+                sql = self.SELECT_BY_KEYS_SQL.format(", ".join(["(?, ?)"] * len(chunk)))
+                params = [value for key in chunk for value in key]
+                for row in conn.execute(sql, params):
+                    states[row[0], row[1]] = from_row(row)
+        
+        return states
     
     def get_by_outlook_task_id(self, task_id: str) -> Optional[SyncState]:
         """
@@ -200,33 +493,43 @@ class StateStore:
             SyncState if found, None otherwise
         """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT 
-                    canvas_course_id,
-                    canvas_assignment_id,
-                    outlook_task_id,
-                    last_seen_submission_state,
-                    last_seen_due_date,
-                    last_seen_title,
-                    last_synced_at,
-                    is_archived,
-                    created_at
-                FROM sync_state
-                WHERE outlook_task_id = ?
-                """,
-                (task_id,),
-            )
+            row = conn.execute(self.SELECT_BY_TASK_ID_SQL, (task_id,)).fetchone()
+        
+        return SyncState.from_row(row) if row else None
+    
+    def iter_all(self, include_archived: bool = False) -> Iterator[SyncState]:
+        """
+        Iterate over all sync states without loading them all at once.
+        
+        Prefer this over get_all() when the states are consumed once.
+        States are read in pages of FETCH_BATCH_SIZE, each under the
+        connection lock, so no lock or cursor is held between pages.
+        
+        Args:
+            include_archived: Whether to include archived assignments
             
-            row = cursor.fetchone()
-            if row:
-                return SyncState.from_row(row)
-            return None
+        Yields:
+            SyncState records ordered by course and assignment ID
+        """
+        sql = self.SELECT_PAGE_SQL if include_archived else self.SELECT_ACTIVE_PAGE_SQL
+        page_size = self.FETCH_BATCH_SIZE
+        last_key = (-(2**63), -(2**63))
+        
+        while True:
+            with self._get_connection() as conn:
+                rows = conn.execute(sql, (*last_key, page_size)).fetchall()
+            if not rows:
+                return
+            yield from SyncState.from_rows(rows)
+            if len(rows) < page_size:
+                return
+            last_key = (rows[-1][0], rows[-1][1])
     
     def get_all(self, include_archived: bool = False) -> list[SyncState]:
         """
-        Get all sync states.
+        Get all sync states as a list.
+        
+        Use iter_all() to stream them instead.
         
         Args:
             include_archived: Whether to include archived assignments
@@ -235,120 +538,94 @@ class StateStore:
             List of all SyncState records
         """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            
-            if include_archived:
-                cursor.execute(
-                    """
-                    SELECT 
-                        canvas_course_id,
-                        canvas_assignment_id,
-                        outlook_task_id,
-                        last_seen_submission_state,
-                        last_seen_due_date,
-                        last_seen_title,
-                        last_synced_at,
-                        is_archived,
-                        created_at
-                    FROM sync_state
-                    ORDER BY canvas_course_id, canvas_assignment_id
-                    """
-                )
-            else:
-                cursor.execute(
-                    """
-                    SELECT 
-                        canvas_course_id,
-                        canvas_assignment_id,
-                        outlook_task_id,
-                        last_seen_submission_state,
-                        last_seen_due_date,
-                        last_seen_title,
-                        last_synced_at,
-                        is_archived,
-                        created_at
-                    FROM sync_state
-                    WHERE is_archived = 0
-                    ORDER BY canvas_course_id, canvas_assignment_id
-                    """
-                )
+            rows = conn.execute(
+                self.SELECT_ALL_SQL if include_archived else self.SELECT_ACTIVE_SQL
+            ).fetchall()
+        
+        # A list is wanted anyway, so skip the generator round-trip
+        return SyncState.from_rows(rows)
+    
+    @staticmethod
+    def _stamp(state: SyncState, now: datetime) -> SyncState:
+        """Set last_synced_at (and created_at, if unset) on state in place."""
+        state.last_synced_at = now
+        if state.created_at is None:
+            state.created_at = now
+        return state
+    
+    @staticmethod
+    def _to_row(state: SyncState, synced_at: str) -> tuple:
+        """
+        Convert a stamped state to the UPSERT_SQL parameter tuple.
+        
+        Args:
+            state: State stamped by _stamp
+            synced_at: state.last_synced_at already formatted as ISO 8601
             
-            return [SyncState.from_row(row) for row in cursor.fetchall()]
+        Returns:
+            Parameter tuple in column order
+        """
+        created_at = state.created_at
+        return (
+            state.canvas_course_id,
+            state.canvas_assignment_id,
+            state.outlook_task_id,
+            1 if state.last_seen_submission_state == "submitted" else 0,
+            state.last_seen_due_date,
+            state.last_seen_title,
+            synced_at,
+            1 if state.is_archived else 0,
+            # New records share the sync timestamp
+            synced_at if created_at is state.last_synced_at else created_at.isoformat(),
+        )
     
     def save(self, state: SyncState) -> SyncState:
         """
         Save or update sync state.
         
-        Uses INSERT OR REPLACE for idempotent upsert.
+        Upserts in place (ON CONFLICT DO UPDATE), like save_many. The
+        timestamps are set on the given state itself.
         
         Args:
             state: SyncState to save
             
         Returns:
-            Saved SyncState with updated timestamps
+            The same SyncState, with updated timestamps
         """
-        now = datetime.utcnow()
+        return self.save_many((state,))[0]
+    
+    def save_many(self, states: Iterable[SyncState]) -> list[SyncState]:
+        """
+        Save or update many sync states in one transaction.
         
-        # Set timestamps
-        if state.created_at is None:
-            state = SyncState(
-                canvas_course_id=state.canvas_course_id,
-                canvas_assignment_id=state.canvas_assignment_id,
-                outlook_task_id=state.outlook_task_id,
-                last_seen_submission_state=state.last_seen_submission_state,
-                last_seen_due_date=state.last_seen_due_date,
-                last_seen_title=state.last_seen_title,
-                last_synced_at=now,
-                is_archived=state.is_archived,
-                created_at=now,
-            )
-        else:
-            state = SyncState(
-                canvas_course_id=state.canvas_course_id,
-                canvas_assignment_id=state.canvas_assignment_id,
-                outlook_task_id=state.outlook_task_id,
-                last_seen_submission_state=state.last_seen_submission_state,
-                last_seen_due_date=state.last_seen_due_date,
-                last_seen_title=state.last_seen_title,
-                last_synced_at=now,
-                is_archived=state.is_archived,
-                created_at=state.created_at,
-            )
+        Either all states are written or, on error, none are. The
+        timestamps are set on the given states themselves.
         
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO sync_state (
-                    canvas_course_id,
-                    canvas_assignment_id,
-                    outlook_task_id,
-                    last_seen_submission_state,
-                    last_seen_due_date,
-                    last_seen_title,
-                    last_synced_at,
-                    is_archived,
-                    created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    state.canvas_course_id,
-                    state.canvas_assignment_id,
-                    state.outlook_task_id,
-                    state.last_seen_submission_state,
-                    state.last_seen_due_date,
-                    state.last_seen_title,
-                    state.last_synced_at.isoformat() if state.last_synced_at else None,
-                    1 if state.is_archived else 0,
-                    state.created_at.isoformat() if state.created_at else None,
-                ),
-            )
-            conn.commit()
+        Args:
+            states: SyncStates to save
+            
+        Returns:
+            The saved SyncStates with updated timestamps, in input order
+        """
+        now = datetime.now(timezone.utc)
+        stamp = self._stamp
+        saved = [stamp(state, now) for state in states]
         
-        logger.debug(
-            f"Saved state for assignment {state.canvas_course_id}:{state.canvas_assignment_id}"
-        )
-        return state
+        if not saved:
+            return saved
+        
+        synced_at = now.isoformat()
+        to_row = self._to_row
+        
+        rows = [to_row(state, synced_at) for state in saved]
+        # The cache is updated after COMMIT, before another writer can run
+        with self._lock:
+            with self._write_connection() as conn:
+                conn.executemany(self.UPSERT_SQL, rows)
+            self._cache_rows(rows)
+        
+        logger.debug("Saved state for %d assignments", len(saved))
+        return saved
     
     def archive(self, course_id: int, assignment_id: int) -> bool:
         """
@@ -363,43 +640,99 @@ class StateStore:
         Returns:
             True if record was updated, False if not found
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                UPDATE sync_state
-                SET is_archived = 1, last_synced_at = ?
-                WHERE canvas_course_id = ? AND canvas_assignment_id = ?
-                """,
-                (datetime.utcnow().isoformat(), course_id, assignment_id),
-            )
-            conn.commit()
-            
-            updated = cursor.rowcount > 0
+        with self._lock:
+            with self._write_connection() as conn:
+                updated = conn.execute(
+                    self.ARCHIVE_SQL,
+                    (datetime.now(timezone.utc).isoformat(), course_id, assignment_id),
+                ).rowcount > 0
             
+            with self._row_cache_lock:
+                self._row_cache.pop((course_id, assignment_id), None)
+        
         if updated:
-            logger.info(f"Archived assignment {course_id}:{assignment_id}")
+            logger.info("Archived assignment %s:%s", course_id, assignment_id)
+        
+        return updated
+    
+    def archive_many(self, keys: Iterable[tuple[int, int]]) -> int:
+        """
+        Mark many assignments as archived in one transaction.
+        
+        Does NOT delete the records or Outlook tasks.
+        
+        Args:
+            keys: (course_id, assignment_id) pairs to archive
+            
+        Returns:
+            Number of records updated; keys not found are ignored
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        keys = list(keys)
+        
+        if not keys:
+            return 0
         
+        with self._lock:
+            with self._write_connection() as conn:
+                updated = conn.executemany(
+                    self.ARCHIVE_SQL,
+                    [(now, course_id, assignment_id) for course_id, assignment_id in keys],
+                ).rowcount
+            
+            with self._row_cache_lock:
+                for key in keys:
+                    self._row_cache.pop(key, None)
+        
+        logger.info("Archived %d assignments", updated)
         return updated
     
-    def get_synced_assignment_keys(self) -> set[tuple[int, int]]:
+    def get_synced_assignment_keys(self) -> frozenset[tuple[int, int]]:
         """
         Get all (course_id, assignment_id) pairs that have been synced.
         
         Returns:
-            Set of (course_id, assignment_id) tuples
+            Frozen set of (course_id, assignment_id) tuples
         """
         with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                SELECT canvas_course_id, canvas_assignment_id
-                FROM sync_state
-                WHERE outlook_task_id IS NOT NULL AND is_archived = 0
-                """
+            # Rows are already (course_id, assignment_id) tuples; frozenset()
+            # consumes the cursor directly without an intermediate list
+            return frozenset(conn.execute(self.SELECT_SYNCED_KEYS_SQL))
+    
+    def get_changed_states(
+        self,
+        current: Iterable[tuple[int, int, str, Optional[str], bool]],
+    ) -> list[tuple[int, int, Optional[SyncState]]]:
+        """
+        Find assignments whose stored state differs from their current values.
+        
+        The comparison runs in SQLite against a temporary table, so rows
+        that are unchanged are never converted to SyncState objects.
+        
+        Args:
+            current: (course_id, assignment_id, title, due date as ISO
+                string or None, is_submitted) for each current assignment
+                
+        Returns:
+            (course_id, assignment_id, stored state or None) for every
+            assignment that is unsynced or has a changed title, due date
+            or submission state
+        """
+        with self._write_connection() as conn:
+            conn.execute(self.CREATE_CURRENT_TABLE_SQL)
+            conn.execute("DELETE FROM temp.canvas_current")
+            conn.executemany(
+                "INSERT OR REPLACE INTO temp.canvas_current VALUES (?, ?, ?, ?, ?)",
+                current,
             )
-            
-            return {(row[0], row[1]) for row in cursor.fetchall()}
+            rows = conn.execute(self.SELECT_CHANGED_SQL).fetchall()
+            conn.execute("DELETE FROM temp.canvas_current")
+        
+        from_row = SyncState.from_row
+        return [
+            (row[0], row[1], from_row(row[2:]) if row[2] is not None else None)
+            for row in rows
+        ]
     
     def count(self, include_archived: bool = False) -> int:
         """
@@ -411,15 +744,77 @@ class StateStore:
         Returns:
             Total record count
         """
+        sql = self.COUNT_ALL_SQL if include_archived else self.COUNT_ACTIVE_SQL
         with self._get_connection() as conn:
-            cursor = conn.cursor()
+            return conn.execute(sql).fetchone()[0]
+    
+    def status_summary(self) -> StatusSummary:
+        """
+        Count total, active and submitted records in one query.
+        
+        Returns:
+            StatusSummary with the aggregate counts
+        """
+        with self._get_connection() as conn:
+            total, active, submitted = conn.execute(self.STATUS_SUMMARY_SQL).fetchone()
+        
+        return StatusSummary(total=total, active=active, submitted=submitted)
+    
+    def get_meta(self, key: str) -> Optional[str]:
+        """
+        Get a value from the metadata table.
+        
+        Args:
+            key: Metadata key
             
-            if include_archived:
-                cursor.execute("SELECT COUNT(*) FROM sync_state")
+        Returns:
+            Stored value, or None if the key is not set
+        """
+        with self._get_connection() as conn:
+            row = conn.execute(self.SELECT_META_SQL, (key,)).fetchone()
+        
+        return row[0] if row else None
+    
+    def set_meta(self, key: str, value: Optional[str]) -> None:
+        """
+        Set or remove a value in the metadata table.
+        
+        Args:
+            key: Metadata key
+            value: Value to store, or None to remove the key
+        """
+        with self._write_connection() as conn:
+            if value is None:
+                conn.execute(self.DELETE_META_SQL, (key,))
             else:
-                cursor.execute("SELECT COUNT(*) FROM sync_state WHERE is_archived = 0")
-            
-            return cursor.fetchone()[0]
+                conn.execute(self.UPSERT_META_SQL, (key, value))
+    
+    def get_course_etags(self) -> dict[int, str]:
+        """
+        Get the stored ETag of every course.
+        
+        Returns:
+            Mapping of course ID to ETag
+        """
+        with self._get_connection() as conn:
+            return dict(conn.execute("SELECT canvas_course_id, etag FROM course_etag"))
+    
+    def set_course_etags(self, etags: Mapping[int, Optional[str]]) -> None:
+        """
+        Store or remove course ETags in one transaction.
+        
+        Args:
+            etags: Course ID to ETag, or to None to remove the course's ETag
+        """
+        with self._write_connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO course_etag (canvas_course_id, etag) VALUES (?, ?)",
+                [(course_id, etag) for course_id, etag in etags.items() if etag is not None],
+            )
+            conn.executemany(
+                "DELETE FROM course_etag WHERE canvas_course_id = ?",
+                [(course_id,) for course_id, etag in etags.items() if etag is None],
+            )
     
     def clear(self) -> None:
         """
@@ -427,9 +822,13 @@ class StateStore:
         
         WARNING: This is destructive. Use only for testing or reset.
         """
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM sync_state")
-            conn.commit()
+        with self._lock:
+            with self._write_connection() as conn:
+                conn.execute("DELETE FROM sync_state")
+                # Without state, unchanged courses must be fetched in full again
+                conn.execute("DELETE FROM course_etag")
+            
+            with self._row_cache_lock:
+                self._row_cache.clear()
         
         logger.warning("All sync state cleared")
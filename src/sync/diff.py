@@ -5,41 +5,47 @@ Compares Canvas assignments against stored state to determine
 what actions need to be taken.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from datetime import date
-from enum import Enum, auto
-from typing import Optional
+from enum import IntFlag
+from typing import AbstractSet, Iterable, Optional
 
 from ..canvas.models import Assignment
 from ..storage.models import SyncState
+from ..storage.state_store import StateStore
 
 
-class ChangeType(Enum):
-    """Types of changes detected between Canvas and stored state."""
+class ChangeType(IntFlag):
+    """
+    Types of changes detected between Canvas and stored state.
+    
+    Members are bit flags so one DiffResult holds all of its changes
+    in a single int; NO_CHANGE is the empty set.
+    """
+    
+    # No changes detected
+    NO_CHANGE = 0
     
     # Task does not exist - needs to be created
-    NEW_ASSIGNMENT = auto()
+    NEW_ASSIGNMENT = 1
     
     # Assignment was submitted - mark task completed
-    SUBMITTED = auto()
+    SUBMITTED = 2
     
     # Assignment was unsubmitted - reopen task
-    UNSUBMITTED = auto()
+    UNSUBMITTED = 4
     
     # Due date changed - update task
-    DUE_DATE_CHANGED = auto()
+    DUE_DATE_CHANGED = 8
     
     # Assignment renamed - update task title
-    TITLE_CHANGED = auto()
+    TITLE_CHANGED = 16
     
     # Assignment no longer exists - archive
-    DELETED = auto()
-    
-    # No changes detected
-    NO_CHANGE = auto()
+    DELETED = 32
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DiffResult:
     """
     Result of comparing a Canvas assignment against stored state.
@@ -47,14 +53,14 @@ class DiffResult:
     Attributes:
         assignment: The Canvas assignment being compared
         state: Existing sync state (None for new assignments)
-        changes: List of detected change types
+        changes: Bitmask of detected change types
         new_title: New title if changed
         new_due_date: New due date if changed
         new_submission_state: New submission state if changed
     """
     assignment: Assignment
     state: Optional[SyncState]
-    changes: list[ChangeType] = field(default_factory=list)
+    changes: ChangeType = ChangeType.NO_CHANGE
     new_title: Optional[str] = None
     new_due_date: Optional[date] = None
     new_submission_state: Optional[str] = None
@@ -62,26 +68,28 @@ class DiffResult:
     @property
     def is_new(self) -> bool:
         """Check if this is a new assignment."""
-        return ChangeType.NEW_ASSIGNMENT in self.changes
+        return bool(self.changes & ChangeType.NEW_ASSIGNMENT)
     
     @property
     def needs_update(self) -> bool:
         """Check if any update is needed."""
-        return len(self.changes) > 0 and ChangeType.NO_CHANGE not in self.changes
+        return bool(self.changes)
     
     @property
     def needs_completion_change(self) -> bool:
         """Check if completion status changed."""
-        return (
-            ChangeType.SUBMITTED in self.changes or
-            ChangeType.UNSUBMITTED in self.changes
-        )
+        return bool(self.changes & (ChangeType.SUBMITTED | ChangeType.UNSUBMITTED))
+    
+    @property
+    def change_names(self) -> list[str]:
+        """Names of the detected change types, in flag order."""
+        changes = self.changes
+        return [c.name for c in ChangeType if c and c & changes]
     
     def __repr__(self) -> str:
-        change_names = [c.name for c in self.changes]
         return (
             f"DiffResult(assignment={self.assignment.unique_key}, "
-            f"changes={change_names})"
+            f"changes={self.change_names})"
         )
 
 
@@ -108,69 +116,110 @@ def compute_diff(
     Returns:
         DiffResult with all detected changes
     """
-    result = DiffResult(assignment=assignment, state=state)
+    due_at = assignment.due_at
+    current_submitted = assignment.is_submitted
+    current_title = assignment.display_title
     
     # Case 1: New assignment
     if state is None or state.outlook_task_id is None:
-        result.changes.append(ChangeType.NEW_ASSIGNMENT)
-        result.new_title = assignment.display_title
-        result.new_submission_state = "submitted" if assignment.is_submitted else "not_submitted"
-        
-        if assignment.due_at:
-            result.new_due_date = assignment.due_at.date()
-        
-        return result
+        return DiffResult(
+            assignment=assignment,
+            state=state,
+            changes=ChangeType.NEW_ASSIGNMENT,
+            new_title=current_title,
+            new_due_date=due_at.date() if due_at else None,
+            new_submission_state="submitted" if current_submitted else "not_submitted",
+        )
     
-    # Track all changes
-    changes_detected = False
+    changes = ChangeType.NO_CHANGE
+    new_title = None
+    new_due_date = None
+    new_submission_state = None
     
     # Case 2: Submission state changed
-    current_submitted = assignment.is_submitted
     was_submitted = state.was_submitted
     
     if current_submitted and not was_submitted:
-        result.changes.append(ChangeType.SUBMITTED)
-        result.new_submission_state = "submitted"
-        changes_detected = True
+        changes |= ChangeType.SUBMITTED
+        new_submission_state = "submitted"
     elif not current_submitted and was_submitted:
-        result.changes.append(ChangeType.UNSUBMITTED)
-        result.new_submission_state = "not_submitted"
-        changes_detected = True
+        changes |= ChangeType.UNSUBMITTED
+        new_submission_state = "not_submitted"
     
-    # Case 3: Due date changed
-    current_due = assignment.due_at.date() if assignment.due_at else None
-    stored_due = state.due_date_as_date
-    
-    if current_due != stored_due:
-        result.changes.append(ChangeType.DUE_DATE_CHANGED)
-        result.new_due_date = current_due
-        changes_detected = True
+    # Case 3: Due date changed (both sides are YYYY-MM-DD strings)
+    if assignment.due_date_iso != state.last_seen_due_date:
+        changes |= ChangeType.DUE_DATE_CHANGED
+        new_due_date = due_at.date() if due_at else None
     
     # Case 4: Title changed
-    current_title = assignment.display_title
-    stored_title = state.last_seen_title
+    if current_title != state.last_seen_title:
+        changes |= ChangeType.TITLE_CHANGED
+        new_title = current_title
+    
+    # Case 5: No changes leaves the mask empty (NO_CHANGE)
+    return DiffResult(
+        assignment=assignment,
+        state=state,
+        changes=changes,
+        new_title=new_title,
+        new_due_date=new_due_date,
+        new_submission_state=new_submission_state,
+    )
+
+
+def compute_changes(
+    assignments: Iterable[Assignment],
+    state_store: StateStore,
+) -> list[DiffResult]:
+    """
+    Compute the diffs of all assignments that need an update.
     
-    if current_title != stored_title:
-        result.changes.append(ChangeType.TITLE_CHANGED)
-        result.new_title = current_title
-        changes_detected = True
+    SQLite first narrows the assignments down to those whose stored
+    title, due date or submission state differs (or that were never
+    synced); compute_diff then runs only on those. Unchanged
+    assignments produce no DiffResult.
     
-    # Case 5: No changes
-    if not changes_detected:
-        result.changes.append(ChangeType.NO_CHANGE)
+    Args:
+        assignments: Current Canvas assignments
+        state_store: Store holding the last synced state
+        
+    Returns:
+        DiffResults that need an update, in SQLite key order
+    """
+    by_key = {assignment.unique_key: assignment for assignment in assignments}
+    
+    changed = state_store.get_changed_states(
+        (
+            assignment.course_id,
+            assignment.id,
+            assignment.display_title,
+            assignment.due_date_iso,
+            assignment.is_submitted,
+        )
+        for assignment in by_key.values()
+    )
+    
+    results = []
+    for course_id, assignment_id, state in changed:
+        diff = compute_diff(by_key[course_id, assignment_id], state)
+        if diff.needs_update:
+            results.append(diff)
     
-    return result
+    return results
 
 
 def compute_deleted_assignments(
-    current_assignment_keys: set[tuple[int, int]],
-    synced_assignment_keys: set[tuple[int, int]],
-) -> set[tuple[int, int]]:
+    current_assignment_keys: AbstractSet[tuple[int, int]],
+    synced_assignment_keys: AbstractSet[tuple[int, int]],
+) -> AbstractSet[tuple[int, int]]:
     """
     Find assignments that were synced but no longer exist in Canvas.
     
     These assignments should be archived (NOT deleted).
     
+    Both arguments may be sets or frozensets; the difference is taken
+    in C without copying either input.
+    
     Args:
         current_assignment_keys: (course_id, assignment_id) pairs from Canvas
         synced_assignment_keys: (course_id, assignment_id) pairs from state store
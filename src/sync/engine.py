@@ -6,26 +6,32 @@ Implements idempotent operations with explicit error handling.
 """
 
 import logging
+import random
+import threading
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 from datetime import date
-from typing import Optional
+from typing import AbstractSet, Optional
 
 from ..canvas.client import CanvasClient, CanvasAPIError
-from ..canvas.models import Assignment
+from ..canvas.models import CourseAssignments
 from ..outlook.client import OutlookClient, GraphAPIError
 from ..outlook.models import OutlookTask, TaskStatus, CanvasTaskMetadata
 from ..storage.state_store import StateStore
 from ..storage.models import SyncState
-from .diff import DiffResult, ChangeType, compute_diff, compute_deleted_assignments
+from .diff import DiffResult, ChangeType, compute_changes, compute_deleted_assignments
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncStats:
     """Statistics from a sync run."""
+    # Assignments fetched from courses that changed since their last sync
     total_assignments: int = 0
+    # Courses skipped by ETag; their assignments are not counted above
+    unchanged_courses: int = 0
     created: int = 0
     updated: int = 0
     completed: int = 0
@@ -36,7 +42,8 @@ class SyncStats:
     
     def __str__(self) -> str:
         return (
-            f"Sync complete: {self.total_assignments} assignments, "
+            f"Sync complete: {self.total_assignments} assignments fetched, "
+            f"{self.unchanged_courses} courses unchanged, "
             f"{self.created} created, {self.updated} updated, "
             f"{self.completed} completed, {self.reopened} reopened, "
             f"{self.archived} archived, {self.skipped} skipped, "
@@ -44,7 +51,7 @@ class SyncStats:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncError:
     """Represents an error during sync."""
     assignment_key: tuple[int, int]
@@ -61,7 +68,9 @@ class SyncEngine:
     - Every operation is idempotent
     - Re-running never corrupts state
     - Partial failures don't block other assignments
-    - State is persisted atomically after each operation
+    - Changed assignments are applied in Graph $batch chunks, with
+      up to max_workers chunks in flight
+    - State is persisted in batched transactions as operations complete
     
     Usage:
         engine = SyncEngine(
@@ -75,6 +84,16 @@ class SyncEngine:
         print(stats)
     """
     
+    # State store metadata key for the resolved task list ID
+    TASK_LIST_ID_META_KEY = "task_list_id:{name}"
+    
+    # Graph accepts at most 20 subrequests per $batch round-trip
+    BATCH_SIZE = 20
+    
+    # Completed states written per save_many() transaction. A crash loses
+    # at most this many state rows, whose tasks are then created again.
+    STATE_FLUSH_SIZE = 50
+    
     def __init__(
         self,
         canvas_client: CanvasClient,
@@ -84,6 +103,8 @@ class SyncEngine:
         dry_run: bool = False,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        max_workers: int = 8,
+        max_backoff: float = 60.0,
     ):
         """
         Initialize sync engine.
@@ -96,6 +117,9 @@ class SyncEngine:
             dry_run: If True, don't make any changes
             max_retries: Maximum retries for transient failures
             retry_delay: Delay between retries in seconds
+            max_workers: Maximum batches of assignments applied concurrently
+            max_backoff: Longest wait between retries in seconds, even
+                if the server asks for more
         """
         self.canvas = canvas_client
         self.outlook = outlook_client
@@ -104,8 +128,14 @@ class SyncEngine:
         self.dry_run = dry_run
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_workers = max(1, max_workers)
+        self.max_backoff = max_backoff
         
         self._task_list_id: Optional[str] = None
+        # True while _task_list_id comes from the state store unverified
+        self._task_list_id_cached = False
+        # Serializes re-resolving a stale list ID across worker threads
+        self._task_list_lock = threading.Lock()
         self._errors: list[SyncError] = []
     
     def sync(self) -> SyncStats:
@@ -113,10 +143,11 @@ class SyncEngine:
         Execute full synchronization.
         
         Steps:
-        1. Fetch all active assignments from Canvas
+        1. Fetch active assignments from Canvas, skipping unchanged courses
         2. Get or create Outlook task list
-        3. For each assignment, compute diff and apply changes
+        3. Compute diffs of changed assignments and apply them
         4. Detect deleted assignments and archive them
+        5. Remember the ETags of courses that synced without errors
         
         Returns:
             SyncStats with counts of all operations
@@ -129,216 +160,481 @@ class SyncEngine:
         
         logger.info("Starting sync...")
         
-        # Step 1: Fetch all assignments from Canvas
+        # Step 1: Fetch assignments from Canvas. Courses whose ETag still
+        # matches are unchanged since they last synced cleanly, so they
+        # come back without assignments and are left alone.
         try:
-            assignments = self.canvas.get_all_assignments()
-            stats.total_assignments = len(assignments)
-            logger.info(f"Fetched {len(assignments)} assignments from Canvas")
+            course_results = self.canvas.get_all_course_assignments(
+                self.state_store.get_course_etags()
+            )
         except CanvasAPIError as e:
-            logger.error(f"Failed to fetch Canvas assignments: {e}")
+            logger.error("Failed to fetch Canvas assignments: %s", e)
             raise
         
+        assignments = [
+            assignment
+            for result in course_results if not result.not_modified
+            for assignment in result.assignments
+        ]
+        unchanged_courses = frozenset(
+            result.course.id for result in course_results if result.not_modified
+        )
+        stats.total_assignments = len(assignments)
+        stats.unchanged_courses = len(unchanged_courses)
+        logger.info(
+            "Fetched %d assignments from Canvas (%d courses unchanged)",
+            stats.total_assignments,
+            stats.unchanged_courses,
+        )
+        
         # Step 2: Get or create Outlook task list
+        meta_key = self.TASK_LIST_ID_META_KEY.format(name=self.task_list_name)
+        self._task_list_id = self.state_store.get_meta(meta_key)
+        self._task_list_id_cached = self._task_list_id is not None
+        
+        if self._task_list_id_cached:
+            logger.info("Using cached task list: %s (%s)", self.task_list_name, self._task_list_id)
+        else:
+            self._resolve_task_list()
+        
+        # Step 3: Apply changes; unchanged assignments never leave SQLite
+        current_keys = frozenset(assignment.unique_key for assignment in assignments)
+        diffs = compute_changes(assignments, self.state_store)
+        stats.skipped = len(current_keys) - len(diffs)
+        
+        # Diffs are applied in $batch-sized chunks, several chunks at once.
+        # Stats, errors and pending states are only touched here, on the
+        # calling thread; states are saved in batches as workers finish.
+        pending: list[SyncState] = []
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="sync",
+        )
+        futures = {
+            executor.submit(self._apply_chunk_checked, chunk): chunk
+            for chunk in self._chunk_diffs(diffs)
+        }
+        uncollected = set(futures)
         try:
-            task_list = self.outlook.get_or_create_task_list(self.task_list_name)
-            self._task_list_id = task_list.id
-            logger.info(f"Using task list: {task_list.display_name} ({task_list.id})")
-        except GraphAPIError as e:
-            logger.error(f"Failed to get/create task list: {e}")
+            for future in as_completed(futures):
+                uncollected.discard(future)
+                self._collect_chunk(stats, futures[future], future, pending)
+                
+                if len(pending) >= self.STATE_FLUSH_SIZE:
+                    self.state_store.save_many(pending)
+                    pending.clear()
+        except BaseException:
+            # Queued chunks would change Outlook without their states being
+            # saved; cancel them and keep what the running chunks did
+            executor.shutdown(wait=True, cancel_futures=True)
+            for future in uncollected:
+                if not future.cancelled():
+                    self._collect_chunk(stats, futures[future], future, pending)
+            
+            # Tasks already changed in Outlook must not lose their state
+            if pending:
+                try:
+                    self.state_store.save_many(pending)
+                except Exception as e:
+                    logger.error(
+                        "Failed to save state for %d synced assignments: %s",
+                        len(pending), e,
+                    )
             raise
         
-        # Step 3: Process each assignment
-        current_keys = set()
-        
-        for assignment in assignments:
-            current_keys.add(assignment.unique_key)
-            
-            try:
-                result = self._process_assignment(assignment)
-                self._update_stats(stats, result)
-            except Exception as e:
-                logger.error(
-                    f"Error processing assignment {assignment.unique_key}: {e}",
-                    exc_info=True,
-                )
-                stats.errors += 1
-                self._errors.append(SyncError(
-                    assignment_key=assignment.unique_key,
-                    error_type=type(e).__name__,
-                    message=str(e),
-                ))
+        executor.shutdown()
+        if pending:
+            self.state_store.save_many(pending)
         
         # Step 4: Archive deleted assignments
+        archive_failed = False
         try:
-            archived_count = self._archive_deleted_assignments(current_keys)
+            archived_count = self._archive_deleted_assignments(current_keys, unchanged_courses)
             stats.archived = archived_count
         except Exception as e:
-            logger.error(f"Error archiving deleted assignments: {e}", exc_info=True)
+            logger.error(
+                "Error archiving deleted assignments: %s", e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             stats.errors += 1
+            archive_failed = True
+        
+        # Step 5: Courses with errors (or unarchived deletions) must be
+        # fetched in full next time, so only clean courses keep an ETag
+        if not (self.dry_run or archive_failed):
+            self._save_course_etags(course_results)
         
-        logger.info(str(stats))
+        logger.info("%s", stats)
         
         if self._errors:
-            logger.warning(f"Sync completed with {len(self._errors)} errors")
+            logger.warning("Sync completed with %d errors", len(self._errors))
             for error in self._errors:
-                logger.warning(f"  - {error.assignment_key}: {error.message}")
+                logger.warning("  - %s: %s", error.assignment_key, error.message)
         
         return stats
     
-    def _process_assignment(self, assignment: Assignment) -> DiffResult:
+    def _collect_chunk(
+        self,
+        stats: SyncStats,
+        chunk: list[DiffResult],
+        future: Future,
+        pending: list[SyncState],
+    ) -> None:
         """
-        Process a single assignment.
+        Record the outcome of a finished chunk.
         
-        Computes diff and applies necessary changes.
+        Args:
+            stats: Stats of the current run
+            chunk: Diffs the future applied
+            future: Finished future of _apply_chunk_checked
+            pending: States awaiting save; successful results are appended
+        """
+        try:
+            results = future.result()
+        except Exception as e:
+            # The batch request itself failed, and with it every diff
+            results = [e] * len(chunk)
+        
+        for diff, result in zip(chunk, results):
+            if isinstance(result, Exception):
+                self._record_error(stats, diff, result)
+                continue
+            self._update_stats(stats, diff)
+            if result is not None:
+                pending.append(result)
+    
+    def _resolve_task_list(self) -> None:
+        """
+        Look up or create the task list by name and cache its ID.
+        
+        Raises:
+            GraphAPIError: If the list cannot be found or created
+        """
+        try:
+            task_list = self.outlook.get_or_create_task_list(self.task_list_name)
+        except GraphAPIError as e:
+            logger.error("Failed to get/create task list: %s", e)
+            raise
+        
+        self._task_list_id = task_list.id
+        self._task_list_id_cached = False
+        self.state_store.set_meta(
+            self.TASK_LIST_ID_META_KEY.format(name=self.task_list_name),
+            task_list.id,
+        )
+        logger.info("Using task list: %s (%s)", task_list.display_name, task_list.id)
+    
+    def _chunk_diffs(self, diffs: list[DiffResult]) -> list[list[DiffResult]]:
+        """
+        Split diffs into chunks of at most BATCH_SIZE.
+        
+        New and existing assignments go into separate chunks, so each
+        chunk is applied with a single create or update batch.
         
         Args:
-            assignment: Canvas assignment to process
+            diffs: DiffResults that need an update
             
         Returns:
-            DiffResult describing what was done
+            Chunks in creation-first order
         """
-        logger.debug(f"Processing assignment: {assignment.display_title}")
+        size = self.BATCH_SIZE
+        new = [diff for diff in diffs if diff.is_new]
+        existing = [diff for diff in diffs if not diff.is_new]
+        return [
+            group[start:start + size]
+            for group in (new, existing)
+            for start in range(0, len(group), size)
+        ]
+    
+    def _apply_chunk_checked(
+        self,
+        chunk: list[DiffResult],
+    ) -> list[Optional[SyncState] | Exception]:
+        """
+        Apply a chunk, re-resolving the task list if its cached ID is stale.
         
-        # Get current state
-        state = self.state_store.get(
-            assignment.course_id,
-            assignment.id,
-        )
+        Safe to call from several threads; only the first worker to see
+        the stale ID resolves the list again, the others reuse its result.
+        Diffs that failed with 404 are then applied once more.
         
-        # Compute diff
-        diff = compute_diff(assignment, state)
+        Args:
+            chunk: Diffs from _chunk_diffs()
+            
+        Returns:
+            Per diff, as returned by _apply_chunk
+        """
+        list_id = self._task_list_id
+        was_cached = self._task_list_id_cached
+        
+        results = self._apply_chunk(chunk)
+        
+        # A cached list ID is only checked when Graph rejects it
+        stale = [
+            index for index, result in enumerate(results)
+            if isinstance(result, GraphAPIError) and result.status_code == 404
+        ]
+        if not (was_cached and stale):
+            return results
+        
+        with self._task_list_lock:
+            if self._task_list_id == list_id and self._task_list_id_cached:
+                logger.warning("Cached task list %s not found, resolving again", list_id)
+                self._resolve_task_list()
+        
+        retried = self._apply_chunk([chunk[index] for index in stale])
+        for index, result in zip(stale, retried):
+            results[index] = result
+        return results
+    
+    def _apply_chunk(self, chunk: list[DiffResult]) -> list[Optional[SyncState] | Exception]:
+        """
+        Apply the changes of a chunk of diffs in one Graph batch.
         
-        if not diff.needs_update:
-            logger.debug(f"No changes for {assignment.display_title}")
-            return diff
+        Args:
+            chunk: Diffs from _chunk_diffs(), all new or all existing
+            
+        Returns:
+            Per diff, the new state for the caller to save, None if
+            nothing was changed (dry run), or the error that prevented it
+            
+        Raises:
+            GraphAPIError: If the batch request itself fails
+        """
+        # change_names builds a list, so skip it entirely when INFO is off
+        if logger.isEnabledFor(logging.INFO):
+            for diff in chunk:
+                change_names = diff.change_names
+                logger.info(
+                    "Changes detected for %s: %s", diff.assignment.display_title, change_names
+                )
+                if self.dry_run:
+                    logger.info("DRY RUN: Would apply changes: %s", change_names)
         
-        logger.info(
-            f"Changes detected for {assignment.display_title}: "
-            f"{[c.name for c in diff.changes]}"
-        )
+        if self.dry_run or not chunk:
+            return [None] * len(chunk)
         
-        if self.dry_run:
-            logger.info(f"DRY RUN: Would apply changes: {diff.changes}")
-            return diff
+        if chunk[0].is_new:
+            return self._create_tasks(chunk)
+        return self._update_tasks(chunk)
+    
+    def _create_tasks(self, chunk: list[DiffResult]) -> list[SyncState | Exception]:
+        """
+        Create Outlook tasks for new assignments in one batch.
         
-        # Apply changes
-        if diff.is_new:
-            self._create_task(assignment, diff)
-        else:
-            self._update_task(assignment, diff, state)
+        Args:
+            chunk: Diffs of new assignments
+            
+        Returns:
+            Per diff, the new state (not yet saved) or the error
+        """
+        tasks = [self._build_task(diff) for diff in chunk]
+        
+        # A failed batch may still have created some tasks, so it is only
+        # resent when Graph throttled it without processing it
+        created = self._retry_operation(
+            lambda: self.outlook.create_tasks(self._task_list_id, tasks),
+            f"create {len(tasks)} tasks",
+            throttled_only=True,
+        )
         
-        return diff
+        results: list[SyncState | Exception] = []
+        for diff, task in zip(chunk, created):
+            if isinstance(task, Exception):
+                results.append(task)
+                continue
+            
+            logger.info("Created task: %s", task.id)
+            assignment = diff.assignment
+            due_date = diff.new_due_date
+            # State is saved by sync() with the rest of its batch
+            results.append(SyncState(
+                canvas_course_id=assignment.course_id,
+                canvas_assignment_id=assignment.id,
+                outlook_task_id=task.id,
+                last_seen_submission_state=diff.new_submission_state,
+                last_seen_due_date=due_date.isoformat() if due_date else None,
+                last_seen_title=diff.new_title,
+            ))
+        
+        return results
     
-    def _create_task(self, assignment: Assignment, diff: DiffResult) -> None:
+    @staticmethod
+    def _build_task(diff: DiffResult) -> OutlookTask:
         """
-        Create a new Outlook task for an assignment.
+        Build the Outlook task for a new assignment.
+        
+        Uses the title, due date and submission state compute_diff
+        already derived, rather than recomputing them from the assignment.
         
         Args:
-            assignment: Canvas assignment
-            diff: Computed diff result
+            diff: Diff of a new assignment
+            
+        Returns:
+            Task to create
         """
-        logger.info(f"Creating task for: {assignment.display_title}")
+        assignment = diff.assignment
+        logger.info("Creating task for: %s", diff.new_title)
         
-        # Build task
         metadata = CanvasTaskMetadata(
             canvas_course_id=assignment.course_id,
             canvas_assignment_id=assignment.id,
             canvas_url=assignment.html_url,
         )
         
-        task = OutlookTask(
-            title=assignment.display_title,
+        return OutlookTask(
+            title=diff.new_title,
             body_content=metadata.to_body_content(),
-            due_date=assignment.due_at.date() if assignment.due_at else None,
-            status=TaskStatus.COMPLETED if assignment.is_submitted else TaskStatus.NOT_STARTED,
+            due_date=diff.new_due_date,
+            status=(
+                TaskStatus.COMPLETED
+                if diff.new_submission_state == "submitted"
+                else TaskStatus.NOT_STARTED
+            ),
         )
+    
+    def _update_tasks(self, chunk: list[DiffResult]) -> list[Optional[SyncState] | Exception]:
+        """
+        Update existing Outlook tasks in one batch.
         
-        # Create with retry
-        created_task = self._retry_operation(
-            lambda: self.outlook.create_task(self._task_list_id, task),
-            f"create task {assignment.display_title}",
-        )
+        Only fields that have changed are sent (minimal update).
         
-        # Save state
-        new_state = SyncState(
-            canvas_course_id=assignment.course_id,
-            canvas_assignment_id=assignment.id,
-            outlook_task_id=created_task.id,
-            last_seen_submission_state="submitted" if assignment.is_submitted else "not_submitted",
-            last_seen_due_date=assignment.due_at.date().isoformat() if assignment.due_at else None,
-            last_seen_title=assignment.display_title,
+        Args:
+            chunk: Diffs of already synced assignments
+            
+        Returns:
+            Per diff, the updated state (not yet saved), None if there
+            was nothing to update, or the error
+        """
+        results: list[Optional[SyncState] | Exception] = [None] * len(chunk)
+        
+        # (index in chunk, task ID, field changes)
+        updates = []
+        for index, diff in enumerate(chunk):
+            changes = self._build_updates(diff)
+            if changes:
+                updates.append((index, diff.state.outlook_task_id, changes))
+        
+        if not updates:
+            return results
+        
+        # Apply updates with retry
+        updated = self._retry_operation(
+            lambda: self.outlook.update_tasks(
+                self._task_list_id,
+                [(task_id, changes) for _, task_id, changes in updates],
+            ),
+            f"update {len(updates)} tasks",
         )
         
-        self.state_store.save(new_state)
-        logger.info(f"Created task: {created_task.id}")
+        for (index, task_id, _), task in zip(updates, updated):
+            if isinstance(task, Exception):
+                results[index] = task
+                continue
+            
+            logger.debug("Updated task %s", task_id)
+            results[index] = self._updated_state(chunk[index])
+        
+        return results
     
-    def _update_task(
-        self,
-        assignment: Assignment,
-        diff: DiffResult,
-        state: SyncState,
-    ) -> None:
+    @staticmethod
+    def _build_updates(diff: DiffResult) -> dict:
         """
-        Update an existing Outlook task.
-        
-        Only updates fields that have changed (minimal update).
+        Build the minimal field changes for an existing task.
         
         Args:
-            assignment: Canvas assignment
             diff: Computed diff result
-            state: Current sync state
+            
+        Returns:
+            Field changes as accepted by OutlookClient.update_task()
         """
+        assignment = diff.assignment
         updates = {}
         
-        # Build minimal update payload
         if ChangeType.SUBMITTED in diff.changes:
-            logger.info(f"Marking completed: {assignment.display_title}")
+            logger.info("Marking completed: %s", assignment.display_title)
             updates["status"] = TaskStatus.COMPLETED
         elif ChangeType.UNSUBMITTED in diff.changes:
-            logger.info(f"Reopening: {assignment.display_title}")
+            logger.info("Reopening: %s", assignment.display_title)
             updates["status"] = TaskStatus.NOT_STARTED
         
         if ChangeType.DUE_DATE_CHANGED in diff.changes:
-            logger.info(f"Updating due date: {diff.new_due_date}")
+            logger.info("Updating due date: %s", diff.new_due_date)
             updates["due_date"] = diff.new_due_date
         
         if ChangeType.TITLE_CHANGED in diff.changes:
-            logger.info(f"Updating title: {diff.new_title}")
+            logger.info("Updating title: %s", diff.new_title)
             updates["title"] = diff.new_title
         
-        if not updates:
-            return
+        return updates
+    
+    @staticmethod
+    def _updated_state(diff: DiffResult) -> SyncState:
+        """
+        Build the state of an assignment after its task was updated.
         
-        # Apply update with retry
-        self._retry_operation(
-            lambda: self.outlook.update_task(
-                self._task_list_id,
-                state.outlook_task_id,
-                updates,
-            ),
-            f"update task {assignment.display_title}",
-        )
+        Args:
+            diff: Computed diff result, with the stored state
+            
+        Returns:
+            Updated state (not yet saved)
+        """
+        state = diff.state
+        changes = diff.changes
         
-        # Update state
-        new_state = SyncState(
-            canvas_course_id=assignment.course_id,
-            canvas_assignment_id=assignment.id,
-            outlook_task_id=state.outlook_task_id,
+        # Keys, task ID and created_at carry over; save() stamps last_synced_at
+        return replace(
+            state,
             last_seen_submission_state=diff.new_submission_state or state.last_seen_submission_state,
+            # A removed due date is a change to None, not "unchanged"
             last_seen_due_date=(
-                diff.new_due_date.isoformat() if diff.new_due_date 
+                (diff.new_due_date.isoformat() if diff.new_due_date else None)
+                if ChangeType.DUE_DATE_CHANGED in changes
                 else state.last_seen_due_date
             ),
             last_seen_title=diff.new_title or state.last_seen_title,
-            created_at=state.created_at,
+            is_archived=False,
+        )
+    
+    def _record_error(self, stats: SyncStats, diff: DiffResult, error: Exception) -> None:
+        """Log and count an assignment that could not be applied."""
+        # Tracebacks only at DEBUG; otherwise one line per failed assignment
+        logger.error(
+            "Error processing assignment %s: %s", diff.assignment.unique_key, error,
+            exc_info=error if logger.isEnabledFor(logging.DEBUG) else None,
         )
+        stats.errors += 1
+        self._errors.append(SyncError(
+            assignment_key=diff.assignment.unique_key,
+            error_type=type(error).__name__,
+            message=str(error),
+        ))
+    
+    def _save_course_etags(self, course_results: list[CourseAssignments]) -> None:
+        """
+        Store the ETags of fetched courses whose assignments all synced.
+        
+        Args:
+            course_results: Results of get_all_course_assignments()
+        """
+        failed_courses = {error.assignment_key[0] for error in self._errors}
+        etags = {
+            result.course.id: None if result.course.id in failed_courses else result.etag
+            for result in course_results
+            if not result.not_modified
+        }
+        if not etags:
+            return
         
-        self.state_store.save(new_state)
-        logger.debug(f"Updated state for {assignment.unique_key}")
+        try:
+            self.state_store.set_course_etags(etags)
+        except Exception as e:
+            # Only costs a full fetch of these courses next time
+            logger.warning("Failed to save course ETags: %s", e)
     
     def _archive_deleted_assignments(
         self,
-        current_keys: set[tuple[int, int]],
+        current_keys: AbstractSet[tuple[int, int]],
+        unchanged_courses: AbstractSet[int] = frozenset(),
     ) -> int:
         """
         Archive assignments that no longer exist in Canvas.
@@ -348,33 +644,34 @@ class SyncEngine:
         
         Args:
             current_keys: Set of (course_id, assignment_id) from Canvas
+            unchanged_courses: Courses that were not fetched because their
+                ETag matched; their assignments still exist
             
         Returns:
             Number of assignments archived
         """
         synced_keys = self.state_store.get_synced_assignment_keys()
+        if unchanged_courses:
+            synced_keys = frozenset(
+                key for key in synced_keys if key[0] not in unchanged_courses
+            )
         deleted_keys = compute_deleted_assignments(current_keys, synced_keys)
         
         if not deleted_keys:
             return 0
         
-        logger.info(f"Found {len(deleted_keys)} deleted assignments to archive")
+        logger.info("Found %d deleted assignments to archive", len(deleted_keys))
         
-        archived = 0
-        for course_id, assignment_id in deleted_keys:
-            if self.dry_run:
-                logger.info(f"DRY RUN: Would archive ({course_id}, {assignment_id})")
-                continue
-            
-            if self.state_store.archive(course_id, assignment_id):
-                archived += 1
-                logger.info(f"Archived assignment ({course_id}, {assignment_id})")
+        if self.dry_run:
+            for course_id, assignment_id in deleted_keys:
+                logger.info("DRY RUN: Would archive (%s, %s)", course_id, assignment_id)
+            return 0
         
-        return archived
+        return self.state_store.archive_many(deleted_keys)
     
     def _update_stats(self, stats: SyncStats, diff: DiffResult) -> None:
         """Update stats based on diff result."""
-        if ChangeType.NO_CHANGE in diff.changes:
+        if not diff.changes:
             stats.skipped += 1
         elif ChangeType.NEW_ASSIGNMENT in diff.changes:
             stats.created += 1
@@ -389,13 +686,35 @@ class SyncEngine:
                 ChangeType.TITLE_CHANGED in diff.changes):
                 stats.updated += 1
     
-    def _retry_operation(self, operation, description: str):
+    def _retry_delay(self, error: GraphAPIError | CanvasAPIError, attempt: int) -> float:
+        """
+        Compute how long to wait before retrying after an error.
+        
+        Uses the server's Retry-After hint when there is one. Otherwise
+        backs off exponentially with jitter, so workers that failed
+        together don't retry in lockstep. Never exceeds max_backoff.
+        
+        Args:
+            error: Error from the failed attempt
+            attempt: Zero-based number of the failed attempt
+            
+        Returns:
+            Delay in seconds
+        """
+        delay = error.retry_after
+        if delay is None:
+            delay = self.retry_delay * (2 ** attempt) * random.uniform(0.5, 1.5)
+        return min(delay, self.max_backoff)
+    
+    def _retry_operation(self, operation, description: str, throttled_only: bool = False):
         """
         Execute an operation with retry logic.
         
         Args:
             operation: Callable to execute
             description: Human-readable description for logging
+            throttled_only: Only retry 429 responses, which Graph rejects
+                unprocessed; for operations that must not run twice
             
         Returns:
             Result of operation
@@ -412,18 +731,22 @@ class SyncEngine:
                 last_error = e
                 
                 # Don't retry on auth errors
-                if hasattr(e, "status_code") and e.status_code in (401, 403):
+                if e.status_code in (401, 403):
+                    raise
+                
+                # Anything else may have taken effect before it failed
+                if throttled_only and e.status_code != 429:
                     raise
                 
                 if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2 ** attempt)  # Exponential backoff
+                    delay = self._retry_delay(e, attempt)
                     logger.warning(
-                        f"Retry {attempt + 1}/{self.max_retries} for {description}: {e}. "
-                        f"Waiting {delay}s..."
+                        "Retry %d/%d for %s: %s. Waiting %.1fs...",
+                        attempt + 1, self.max_retries, description, e, delay,
                     )
                     time.sleep(delay)
         
-        logger.error(f"All retries failed for {description}: {last_error}")
+        logger.error("All retries failed for %s: %s", description, last_error)
         raise last_error
     
     @property
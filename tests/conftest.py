@@ -7,7 +7,7 @@ Provides mocks and test data for Canvas/Outlook API testing.
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
 import tempfile
 
 from src.canvas.models import Assignment, Course, Submission
@@ -127,9 +127,11 @@ def temp_db_path() -> Generator[Path, None, None]:
 
 
 @pytest.fixture
-def state_store(temp_db_path: Path) -> StateStore:
+def state_store(temp_db_path: Path) -> Generator[StateStore, None, None]:
     """Create a fresh StateStore with temp database."""
-    return StateStore(temp_db_path)
+    store = StateStore(temp_db_path)
+    yield store
+    store.close()
 
 
 @pytest.fixture
@@ -148,6 +150,22 @@ def sample_sync_state() -> SyncState:
     )
 
 
+@pytest.fixture
+def make_states() -> Callable[..., list[SyncState]]:
+    """Factory for n synced, unsubmitted states in one course."""
+    def _make_states(n: int, course_id: int = 100, prefix: str = "task") -> list[SyncState]:
+        return [
+            SyncState(
+                canvas_course_id=course_id,
+                canvas_assignment_id=200 + i,
+                outlook_task_id=f"{prefix}-{i}",
+                last_seen_submission_state="not_submitted",
+            )
+            for i in range(n)
+        ]
+    return _make_states
+
+
 # ============================================================================
 # API Response Fixtures
 # ============================================================================
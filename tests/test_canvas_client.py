@@ -0,0 +1,305 @@
+"""
+Unit tests for the Canvas API client.
+"""
+
+import json
+import pytest
+import urllib3
+from typing import Optional
+from urllib.parse import parse_qs, urlsplit
+
+from src.canvas.client import CanvasAPIError, CanvasClient
+from src.canvas.models import Course
+
+
+class FakeResponse:
+    """Minimal stand-in for urllib3.response.HTTPResponse."""
+
+    def __init__(
+        self,
+        data,
+        status: int = 200,
+        headers: Optional[dict] = None,
+    ):
+        self.data = json.dumps(data).encode()
+        self.status = status
+        self.reason = "OK" if status < 400 else "Error"
+        self.headers = headers or {}
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def canvas_client() -> CanvasClient:
+    """Create a Canvas client without network access."""
+    client = CanvasClient(
+        base_url="https://canvas.example.com/",
+        access_token="test-token",
+    )
+    yield client
+    client.close()
+
+
+class TestErrorHandling:
+    """Tests for error responses."""
+
+    def test_error_carries_status_code(self, canvas_client: CanvasClient, monkeypatch):
+        """Test API errors expose the status code and error message."""
+        monkeypatch.setattr(
+            canvas_client._pool,
+            "request",
+            lambda method, url, **kwargs: FakeResponse(
+                {"errors": [{"message": "not found"}]}, status=404
+            ),
+        )
+
+        with pytest.raises(CanvasAPIError) as exc_info:
+            canvas_client._make_request("/api/v1/courses/1")
+
+        assert exc_info.value.status_code == 404
+        assert "not found" in str(exc_info.value)
+
+    def test_missing_submission_returns_none(self, canvas_client: CanvasClient, monkeypatch):
+        """Test a 404 submission lookup returns None."""
+        monkeypatch.setattr(
+            canvas_client._pool,
+            "request",
+            lambda method, url, **kwargs: FakeResponse({}, status=404),
+        )
+
+        assert canvas_client.get_submission(course_id=1, assignment_id=2) is None
+
+    def test_rate_limit_retries_then_succeeds(self, canvas_client: CanvasClient, monkeypatch):
+        """Test rate-limited requests wait for Retry-After and retry."""
+        responses = [
+            FakeResponse(
+                {},
+                status=403,
+                headers={"X-Rate-Limit-Remaining": "0", "Retry-After": "2"},
+            ),
+            FakeResponse({"id": 1}),
+        ]
+        sleeps = []
+        monkeypatch.setattr(
+            canvas_client._pool, "request", lambda method, url, **kwargs: responses.pop(0)
+        )
+        monkeypatch.setattr("src.canvas.client.time.sleep", sleeps.append)
+
+        assert canvas_client._make_request("/api/v1/courses/1") == {"id": 1}
+        assert sleeps == [2.0]
+
+    def test_low_rate_limit_budget_pauses(self, canvas_client: CanvasClient, monkeypatch):
+        """Test a nearly spent rate-limit budget slows the next request."""
+        sleeps = []
+        monkeypatch.setattr(
+            canvas_client._pool,
+            "request",
+            lambda method, url, **kwargs: FakeResponse(
+                {"id": 1}, headers={"X-Rate-Limit-Remaining": "25.0"}
+            ),
+        )
+        monkeypatch.setattr("src.canvas.client.time.sleep", sleeps.append)
+
+        canvas_client._make_request("/api/v1/courses/1")
+        assert sleeps == []
+
+        canvas_client._make_request("/api/v1/courses/1")
+        assert sleeps == [0.75]
+
+
+class TestPagination:
+    """Tests for Link header pagination."""
+
+    def test_follows_next_links(self, canvas_client: CanvasClient, monkeypatch):
+        """Test all pages are fetched and params only sent once."""
+        pages = {
+            "https://canvas.example.com/api/v1/courses": FakeResponse(
+                [{"id": 1}, {"id": 2}],
+                headers={
+                    "Link": (
+                        '<https://canvas.example.com/api/v1/courses?page=1>; rel="current",'
+                        '<https://canvas.example.com/api/v1/courses?page=2>; rel="next"'
+                    )
+                },
+            ),
+            "https://canvas.example.com/api/v1/courses?page=2": FakeResponse(
+                [{"id": 3}],
+                headers={
+                    "Link": '<https://canvas.example.com/api/v1/courses?page=1>; rel="first"'
+                },
+            ),
+        }
+        calls = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append(url)
+            return pages[url.split("?a=")[0]]
+
+        monkeypatch.setattr(canvas_client._pool, "request", fake_request)
+
+        items = list(canvas_client._paginate("/api/v1/courses", params={"a": "b"}))
+
+        assert [item["id"] for item in items] == [1, 2, 3]
+        assert calls == [
+            "https://canvas.example.com/api/v1/courses?a=b&per_page=100",
+            "https://canvas.example.com/api/v1/courses?page=2",
+        ]
+
+
+class TestConditionalFetch:
+    """Tests for ETag-based assignment fetching."""
+
+    def test_not_modified_course(self, canvas_client: CanvasClient, monkeypatch):
+        """Test the ETag is sent as If-None-Match and a 304 skips the course."""
+        sent_headers = []
+
+        def fake_request(method, url, headers=None, **kwargs):
+            sent_headers.append(headers)
+            return FakeResponse(None, status=304)
+
+        monkeypatch.setattr(canvas_client._pool, "request", fake_request)
+        course = Course(id=1, name="Course", code="C1", enrollment_state="active")
+
+        stored = json.dumps(["Course", '"v1"'])
+
+        result = canvas_client.get_assignments_if_changed(course, etag=stored)
+
+        assert result.not_modified
+        assert result.etag == stored
+        assert sent_headers[0]["If-None-Match"] == '"v1"'
+        assert sent_headers[0]["Authorization"] == "Bearer test-token"
+
+    def test_renamed_course_fetched_in_full(self, canvas_client: CanvasClient, monkeypatch):
+        """Test an ETag stored under an old course name is not sent."""
+        sent_headers = []
+
+        def fake_request(method, url, headers=None, **kwargs):
+            sent_headers.append(headers)
+            return FakeResponse([{"id": 10, "name": "HW"}], headers={"ETag": '"v1"'})
+
+        monkeypatch.setattr(canvas_client._pool, "request", fake_request)
+        course = Course(id=1, name="Renamed", code="C1", enrollment_state="active")
+
+        result = canvas_client.get_assignments_if_changed(
+            course, etag=json.dumps(["Course", '"v1"'])
+        )
+
+        assert "If-None-Match" not in (sent_headers[0] or {})
+        assert result.assignments[0].display_title == "[Renamed] HW"
+        assert result.etag == json.dumps(["Renamed", '"v1"'])
+
+    def test_single_page_etag_returned(self, canvas_client: CanvasClient, monkeypatch):
+        """Test a single-page response returns its assignments and ETag."""
+        monkeypatch.setattr(
+            canvas_client._pool,
+            "request",
+            lambda method, url, **kwargs: FakeResponse(
+                [{"id": 10, "name": "HW"}], headers={"ETag": '"v2"'}
+            ),
+        )
+        course = Course(id=1, name="Course", code="C1", enrollment_state="active")
+
+        result = canvas_client.get_assignments_if_changed(course)
+
+        assert [assignment.id for assignment in result.assignments] == [10]
+        assert result.etag == json.dumps(["Course", '"v2"'])
+
+
+class TestSubmissions:
+    """Tests for submission fetching."""
+
+    def test_bulk_submissions_one_request_per_course(
+        self, canvas_client: CanvasClient, monkeypatch
+    ):
+        """Test bulk fetch groups assignments by course."""
+        calls = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append(url)
+            params = parse_qs(urlsplit(url).query)
+            return FakeResponse([
+                {"assignment_id": int(aid), "workflow_state": "submitted"}
+                for aid in params["assignment_ids[]"]
+            ])
+
+        monkeypatch.setattr(canvas_client._pool, "request", fake_request)
+
+        result = canvas_client.get_submissions_bulk([(1, 10), (1, 11), (2, 20)])
+
+        assert len(calls) == 2
+        assert set(result) == {(1, 10), (1, 11), (2, 20)}
+        assert result[(1, 11)].is_submitted is True
+
+
+class TestCoursesCache:
+    """Tests for get_active_courses() caching."""
+
+    def test_courses_served_from_cache(self, canvas_client: CanvasClient, monkeypatch):
+        """Test repeated calls reuse the first fetch until invalidated."""
+        calls = []
+
+        def fake_request(method, url, **kwargs):
+            calls.append(url)
+            return FakeResponse([{"id": 1, "name": "Course", "course_code": "C1"}])
+
+        monkeypatch.setattr(canvas_client._pool, "request", fake_request)
+
+        first = canvas_client.get_active_courses()
+        second = canvas_client.get_active_courses()
+        assert first == second
+        assert len(calls) == 1
+
+        canvas_client.invalidate_courses_cache()
+        canvas_client.get_active_courses()
+        assert len(calls) == 2
+
+    def test_auth_error_invalidates_cache(self, canvas_client: CanvasClient, monkeypatch):
+        """Test a 401 drops the cached course list but a 404 keeps it."""
+        monkeypatch.setattr(
+            canvas_client._pool,
+            "request",
+            lambda method, url, **kwargs: FakeResponse(
+                [{"id": 1, "name": "Course", "course_code": "C1"}]
+            ),
+        )
+        canvas_client.get_active_courses()
+        assert canvas_client._courses_cache is not None
+
+        monkeypatch.setattr(
+            canvas_client._pool,
+            "request",
+            lambda method, url, **kwargs: FakeResponse({}, status=404),
+        )
+        with pytest.raises(CanvasAPIError):
+            canvas_client._make_request("/api/v1/courses/1/assignments/2/submissions/self")
+        assert canvas_client._courses_cache is not None
+
+        monkeypatch.setattr(
+            canvas_client._pool,
+            "request",
+            lambda method, url, **kwargs: FakeResponse({}, status=401),
+        )
+        with pytest.raises(CanvasAPIError):
+            canvas_client._make_request("/api/v1/users/self")
+        assert canvas_client._courses_cache is None
+
+
+class TestProxy:
+    """Tests for proxy selection from the environment."""
+
+    @pytest.mark.parametrize(
+        ("no_proxy", "proxied"),
+        [("", True), ("canvas.example.com", False), (".example.com", False)],
+    )
+    def test_https_proxy_honors_no_proxy(self, monkeypatch, no_proxy: str, proxied: bool):
+        """Test HTTPS_PROXY is used unless NO_PROXY excludes the Canvas host."""
+        for name in ("HTTPS_PROXY", "https_proxy", "NO_PROXY", "no_proxy"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("https_proxy", "http://proxy.example.com:3128")
+        monkeypatch.setenv("no_proxy", no_proxy)
+
+        client = CanvasClient(base_url="https://canvas.example.com/", access_token="t")
+
+        assert isinstance(client._pool, urllib3.ProxyManager) is proxied
+        client.close()
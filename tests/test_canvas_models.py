@@ -2,6 +2,7 @@
 Unit tests for Canvas data models.
 """
 
+import dataclasses
 import pytest
 from datetime import datetime, timezone
 
@@ -25,6 +26,11 @@ class TestCourse:
         assert course.name == "Introduction to Computer Science"
         assert course.code == "CS101"
 
+    def test_course_from_api_response_invalid_id(self, canvas_course_response: dict):
+        """Test that API data with an invalid ID is rejected."""
+        with pytest.raises(ValueError, match="positive integer"):
+            Course.from_api_response({**canvas_course_response, "id": 0})
+
     def test_course_invalid_id(self):
         """Test that invalid course ID raises error."""
         with pytest.raises(ValueError, match="positive integer"):
@@ -96,6 +102,16 @@ class TestAssignment:
         expected = "[Introduction to Computer Science] Homework 1: Python Basics"
         assert sample_assignment.display_title == expected
 
+    def test_derived_fields(
+        self, sample_assignment: Assignment, sample_assignment_no_due_date: Assignment
+    ):
+        """Test due_date_iso is set at construction and follows dataclasses.replace."""
+        assert sample_assignment.due_date_iso == "2026-01-20"
+        assert sample_assignment_no_due_date.due_date_iso is None
+        renamed = dataclasses.replace(sample_assignment, name="Renamed", due_at=None)
+        assert renamed.display_title == "[Introduction to Computer Science] Renamed"
+        assert renamed.due_date_iso is None
+
     def test_is_submitted_true(self, sample_assignment: Assignment):
         """Test is_submitted with submitted assignment."""
         assert sample_assignment.is_submitted is True
@@ -134,3 +150,14 @@ class TestAssignment:
         assert assignment.name == "Homework 1: Python Basics"
         assert assignment.due_at is not None
         assert assignment.is_submitted is True
+        assert assignment.display_title == "[CS101] Homework 1: Python Basics"
+        assert assignment.due_date_iso == "2026-01-20"
+
+    def test_from_api_response_parses_utc_due_date(self, canvas_assignment_response: dict):
+        """Test that Canvas "Z" timestamps are parsed as UTC."""
+        assignment = Assignment.from_api_response(
+            data=canvas_assignment_response,
+            course_id=12345,
+            course_name="CS101",
+        )
+        assert assignment.due_at == datetime(2026, 1, 20, 23, 59, 0, tzinfo=timezone.utc)
@@ -0,0 +1,25 @@
+"""
+Unit tests for the shared HTTP helpers.
+"""
+
+import pytest
+
+from src.http_utils import parse_retry_after
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After parsing."""
+
+    @pytest.mark.parametrize("value, expected", [
+        ("3", 3.0),
+        ("1.5", 1.5),
+        ("-2", 0.0),
+        (None, None),
+        ("", None),
+        ("Wed, 21 Oct 2026 07:28:00 GMT", None),
+        ("inf", None),
+        ("nan", None),
+    ])
+    def test_parses_seconds_only(self, value, expected):
+        """Test delays in seconds are parsed and anything else is ignored."""
+        assert parse_retry_after(value) == expected
@@ -0,0 +1,36 @@
+"""
+Guard against modules that define the same top-level symbol twice.
+
+A repeated definition silently shadows the first one, so an edit to the
+earlier copy never runs.
+"""
+
+import ast
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SOURCE_FILES = sorted(
+    path
+    for package in ("src", "config")
+    for path in (PROJECT_ROOT / package).rglob("*.py")
+)
+
+
+@pytest.mark.parametrize(
+    "path",
+    SOURCE_FILES,
+    ids=[str(path.relative_to(PROJECT_ROOT)) for path in SOURCE_FILES],
+)
+def test_top_level_symbols_defined_once(path: Path):
+    """Test each top-level function and class is defined exactly once."""
+    tree = ast.parse(path.read_text(), filename=str(path))
+    names = Counter(
+        node.name
+        for node in tree.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+    )
+    duplicates = sorted(name for name, count in names.items() if count > 1)
+    assert not duplicates, f"{path.name} defines {duplicates} more than once"
@@ -0,0 +1,523 @@
+"""
+Unit tests for the Microsoft Graph client.
+"""
+
+import json
+import pickle
+import pytest
+import urllib3
+
+from src.outlook.client import GraphAPIError, OutlookClient
+from src.outlook.models import OutlookTask, TaskStatus
+
+
+class FakeResponse:
+    """Minimal stand-in for urllib3.response.HTTPResponse."""
+
+    def __init__(self, data, status: int = 200):
+        self.data = json.dumps(data).encode() if data is not None else b""
+        self.status = status
+        self.reason = "OK" if status < 400 else "Error"
+        self.headers = {}
+
+
+@pytest.fixture
+def outlook_client(monkeypatch) -> OutlookClient:
+    """Create an authenticated Outlook client without network access."""
+    # PublicClientApplication performs tenant discovery over the network
+    monkeypatch.setattr(
+        "src.outlook.client.msal.PublicClientApplication",
+        lambda *args, **kwargs: None,
+    )
+    client = OutlookClient(client_id="client-id", tenant_id="common")
+    client._set_token({"access_token": "test-token", "expires_in": 3600})
+    yield client
+    client.close()
+
+
+class TestMakeRequest:
+    """Tests for single Graph requests."""
+
+    def test_error_carries_status_and_code(self, outlook_client: OutlookClient, monkeypatch):
+        """Test Graph error bodies become GraphAPIError details."""
+        monkeypatch.setattr(
+            outlook_client._pool,
+            "urlopen",
+            lambda method, url, **kwargs: FakeResponse(
+                {"error": {"code": "ErrorItemNotFound", "message": "not found"}},
+                status=404,
+            ),
+        )
+
+        with pytest.raises(GraphAPIError) as exc_info:
+            outlook_client._make_request("GET", "/me/todo/lists/missing")
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.error_code == "ErrorItemNotFound"
+
+    def test_next_link_urls_used_as_is(self, outlook_client: OutlookClient, monkeypatch):
+        """Test absolute @odata.nextLink URLs are not prefixed again."""
+        next_link = "https://graph.microsoft.com/v1.0/me/todo/lists/1/tasks?$skip=10"
+        pages = {
+            "https://graph.microsoft.com/v1.0/me/todo/lists/1/tasks": FakeResponse(
+                {"value": [{"id": "a"}], "@odata.nextLink": next_link}
+            ),
+            next_link: FakeResponse({"value": [{"id": "b"}]}),
+        }
+        calls = []
+
+        def fake_urlopen(method, url, **kwargs):
+            calls.append(url)
+            return pages[url.split("?%24top")[0]]
+
+        monkeypatch.setattr(outlook_client._pool, "urlopen", fake_urlopen)
+
+        tasks = outlook_client.get_tasks("1")
+
+        assert [task.id for task in tasks] == ["a", "b"]
+        assert calls[1] == next_link
+
+    def test_get_tasks_requests_large_projected_pages(
+        self, outlook_client: OutlookClient, monkeypatch
+    ):
+        """Test the first page asks for $top and only the fields that are parsed."""
+        calls = []
+
+        def fake_request(method, endpoint, data=None, params=None):
+            calls.append(params)
+            return {"value": []}
+
+        monkeypatch.setattr(outlook_client, "_make_request", fake_request)
+
+        outlook_client.get_tasks("1")
+
+        assert calls[0]["$top"] == OutlookClient.TASKS_MAX_PAGE_SIZE
+        assert calls[0]["$select"].split(",")[:2] == ["id", "title"]
+
+    def test_throttling_left_to_retry_strategy(
+        self, outlook_client: OutlookClient, monkeypatch
+    ):
+        """Test a 429 that outlasts urllib3's retries is raised, not re-sent."""
+        calls = []
+
+        def fake_urlopen(method, url, **kwargs):
+            calls.append(url)
+            return FakeResponse({"error": {"code": "TooManyRequests"}}, status=429)
+
+        monkeypatch.setattr(outlook_client._pool, "urlopen", fake_urlopen)
+
+        with pytest.raises(GraphAPIError) as exc_info:
+            outlook_client._make_request("GET", "/me/todo/lists")
+
+        assert exc_info.value.status_code == 429
+        assert len(calls) == 1
+        assert outlook_client._pool.connection_pool_kw["retries"].respect_retry_after_header
+
+    def test_posts_not_retried_by_urllib3(self, outlook_client: OutlookClient):
+        """Test creates and batches are not resent after an ambiguous failure."""
+        retries = outlook_client._pool.connection_pool_kw["retries"]
+
+        assert not retries.is_retry("POST", 503, has_retry_after=True)
+        assert retries.is_retry("PATCH", 503)
+
+    def test_non_json_error_body(self, outlook_client: OutlookClient, monkeypatch):
+        """Test a gateway error page still raises with the status code."""
+        response = FakeResponse(None, status=502)
+        response.data = b"<html>Bad Gateway</html>"
+        monkeypatch.setattr(
+            outlook_client._pool, "urlopen", lambda method, url, **kwargs: response
+        )
+
+        with pytest.raises(GraphAPIError) as exc_info:
+            outlook_client._make_request("GET", "/me/todo/lists")
+
+        assert exc_info.value.status_code == 502
+        assert exc_info.value.error_code is None
+
+    def test_error_survives_pickling(self):
+        """Test error details are kept when pickled."""
+        error = pickle.loads(pickle.dumps(GraphAPIError("gone", 404, "ErrorItemNotFound", 5.0)))
+
+        assert str(error) == "gone"
+        assert (error.status_code, error.error_code) == (404, "ErrorItemNotFound")
+        assert error.retry_after == 5.0
+
+    def test_no_content_returns_none(self, outlook_client: OutlookClient, monkeypatch):
+        """Test 204 responses return None."""
+        monkeypatch.setattr(
+            outlook_client._pool,
+            "urlopen",
+            lambda method, url, **kwargs: FakeResponse(None, status=204),
+        )
+
+        assert outlook_client._make_request("DELETE", "/me/todo/lists/1") is None
+
+
+class TestAuthentication:
+    """Tests for access token handling."""
+
+    def test_headers_reused_until_expiry(self, outlook_client: OutlookClient):
+        """Test the same header dict is returned while the token is valid."""
+        headers = outlook_client._get_headers()
+        assert headers["Authorization"] == "Bearer test-token"
+        assert outlook_client._get_headers() is headers
+
+    def test_refreshes_before_expiry(self, outlook_client: OutlookClient, monkeypatch):
+        """Test an expiring token is refreshed before the request is sent."""
+        monkeypatch.setattr(
+            outlook_client,
+            "authenticate",
+            lambda: outlook_client._set_token({"access_token": "new-token"}),
+        )
+        outlook_client._token_expiry = 0.0
+
+        assert outlook_client._get_headers()["Authorization"] == "Bearer new-token"
+
+    def test_rejected_token_refreshed_once(
+        self, outlook_client: OutlookClient, monkeypatch
+    ):
+        """Test a 401 forces one refresh and a single retry."""
+        refreshes = []
+        sent_tokens = []
+
+        def fake_authenticate(force_refresh=False):
+            refreshes.append(force_refresh)
+            outlook_client._set_token({"access_token": "new-token"})
+
+        def fake_urlopen(method, url, body=None, headers=None):
+            sent_tokens.append(headers["Authorization"])
+            return FakeResponse({"error": {"code": "InvalidAuthenticationToken"}}, 401)
+
+        monkeypatch.setattr(outlook_client, "authenticate", fake_authenticate)
+        monkeypatch.setattr(outlook_client._pool, "urlopen", fake_urlopen)
+
+        with pytest.raises(GraphAPIError) as exc_info:
+            outlook_client._make_request("GET", "/me/todo/lists")
+
+        assert exc_info.value.status_code == 401
+        assert refreshes == [True]
+        assert sent_tokens == ["Bearer test-token", "Bearer new-token"]
+
+    def test_replaced_token_not_refreshed_again(
+        self, outlook_client: OutlookClient, monkeypatch
+    ):
+        """Test a 401 for a token another thread replaced reuses the new one."""
+        stale_headers = outlook_client._get_headers()
+        outlook_client._set_token({"access_token": "new-token"})
+        monkeypatch.setattr(
+            outlook_client,
+            "authenticate",
+            lambda force_refresh=False: pytest.fail("token refreshed twice"),
+        )
+
+        outlook_client._refresh_rejected_token(stale_headers)
+
+        assert outlook_client._get_headers()["Authorization"] == "Bearer new-token"
+
+
+class TestTaskLists:
+    """Tests for task list lookup."""
+
+    def test_find_task_list_filters_server_side(
+        self, outlook_client: OutlookClient, monkeypatch
+    ):
+        """Test the name is sent as an escaped $filter."""
+        calls = []
+
+        def fake_request(method, endpoint, data=None, params=None):
+            calls.append(params)
+            return {"value": [{"id": "list-1", "displayName": "Bob's List"}]}
+
+        monkeypatch.setattr(outlook_client, "_make_request", fake_request)
+
+        task_list = outlook_client.find_task_list_by_name("Bob's List")
+
+        assert task_list.id == "list-1"
+        assert calls == [{"$filter": "displayName eq 'Bob''s List'", "$top": 1}]
+
+    def test_get_or_create_creates_on_miss(self, outlook_client: OutlookClient, monkeypatch):
+        """Test a missing list is created."""
+        monkeypatch.setattr(
+            outlook_client,
+            "_make_request",
+            lambda method, endpoint, data=None, params=None: (
+                {"value": []} if method == "GET" else {"id": "new", "displayName": "X"}
+            ),
+        )
+
+        assert outlook_client.get_or_create_task_list("X").id == "new"
+
+
+class TestBatch:
+    """Tests for JSON batching."""
+
+    def test_chunks_and_preserves_order(self, outlook_client: OutlookClient, monkeypatch):
+        """Test subrequests are sent 20 at a time and mapped back in order."""
+        batches = []
+
+        def fake_request(method, endpoint, data=None, params=None):
+            batches.append(data["requests"])
+            return {"responses": [
+                {"id": sub["id"], "status": 200, "body": {"url": sub["url"]}}
+                for sub in reversed(data["requests"])
+            ]}
+
+        monkeypatch.setattr(outlook_client, "_make_request", fake_request)
+
+        urls = [f"/me/todo/lists/{i}" for i in range(25)]
+        responses = outlook_client.batch([{"method": "GET", "url": url} for url in urls])
+
+        assert [len(batch) for batch in batches] == [20, 5]
+        assert [response["body"]["url"] for response in responses] == urls
+
+    def test_dedupes_identical_reads(self, outlook_client: OutlookClient, monkeypatch):
+        """Test identical GETs are sent once but identical writes are all sent."""
+        batches = []
+
+        def fake_request(method, endpoint, data=None, params=None):
+            batches.append(data["requests"])
+            return {"responses": [
+                {"id": sub["id"], "status": 201, "body": {"id": f"t{sub['id']}"}}
+                for sub in data["requests"]
+            ]}
+
+        monkeypatch.setattr(outlook_client, "_make_request", fake_request)
+
+        read = {"method": "GET", "url": "/me/todo/lists/1"}
+        create = {"method": "POST", "url": "/me/todo/lists/1/tasks", "body": {"title": "a"}}
+        responses = outlook_client.batch([read, dict(read), create, dict(create)])
+
+        assert [sub["method"] for sub in batches[0]] == ["GET", "POST", "POST"]
+        assert batches[0][1]["headers"]["Content-Type"] == "application/json"
+        assert [response["body"]["id"] for response in responses] == ["t0", "t0", "t1", "t2"]
+
+    def test_retries_throttled_subrequests(self, outlook_client: OutlookClient, monkeypatch):
+        """Test 429 subrequests are resent after Retry-After."""
+        batches = []
+        sleeps = []
+
+        def fake_request(method, endpoint, data=None, params=None):
+            batches.append([sub["id"] for sub in data["requests"]])
+            if len(batches) == 1:
+                return {"responses": [
+                    {"id": "0", "status": 200, "body": {}},
+                    {"id": "1", "status": 429, "headers": {"Retry-After": "3"}},
+                ]}
+            return {"responses": [{"id": "1", "status": 200, "body": {}}]}
+
+        monkeypatch.setattr(outlook_client, "_make_request", fake_request)
+        monkeypatch.setattr("src.outlook.client.time.sleep", sleeps.append)
+
+        responses = outlook_client.batch([
+            {"method": "GET", "url": "/a"},
+            {"method": "GET", "url": "/b"},
+        ])
+
+        assert batches == [["0", "1"], ["1"]]
+        assert sleeps == [3.0]
+        assert [response["status"] for response in responses] == [200, 200]
+
+    def test_http_date_retry_after_falls_back(
+        self, outlook_client: OutlookClient, monkeypatch
+    ):
+        """Test a Retry-After given as an HTTP date waits one second instead of failing."""
+        sleeps = []
+        calls = []
+
+        def fake_request(method, endpoint, data=None, params=None):
+            calls.append(1)
+            status = 429 if len(calls) == 1 else 200
+            return {"responses": [{
+                "id": "0",
+                "status": status,
+                "headers": {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"},
+            }]}
+
+        monkeypatch.setattr(outlook_client, "_make_request", fake_request)
+        monkeypatch.setattr("src.outlook.client.time.sleep", sleeps.append)
+
+        responses = outlook_client.batch([{"method": "GET", "url": "/a"}])
+
+        assert sleeps == [1.0]
+        assert responses[0]["status"] == 200
+
+    def test_throttled_503_retried_with_capped_wait(
+        self, outlook_client: OutlookClient, monkeypatch
+    ):
+        """Test a 503 with Retry-After is resent like a 429, never sleeping past the cap."""
+        sleeps = []
+        calls = []
+
+        def fake_request(method, endpoint, data=None, params=None):
+            calls.append(1)
+            if len(calls) == 1:
+                return {"responses": [
+                    {"id": "0", "status": 503, "headers": {"Retry-After": "86400"}},
+                    {"id": "1", "status": 503},
+                ]}
+            return {"responses": [{"id": "0", "status": 200, "body": {}}]}
+
+        monkeypatch.setattr(outlook_client, "_make_request", fake_request)
+        monkeypatch.setattr("src.outlook.client.time.sleep", sleeps.append)
+
+        responses = outlook_client.batch([
+            {"method": "GET", "url": "/a"},
+            {"method": "GET", "url": "/b"},
+        ])
+
+        assert sleeps == [OutlookClient.BATCH_MAX_RETRY_AFTER]
+        assert [response["status"] for response in responses] == [200, 503]
+
+    def test_missing_subrequest_reported_as_error(
+        self, outlook_client: OutlookClient, monkeypatch
+    ):
+        """Test a subrequest absent from the reply gets an error response."""
+        monkeypatch.setattr(
+            outlook_client,
+            "_make_request",
+            lambda method, endpoint, data=None, params=None: {
+                "responses": [{"id": "0", "status": 200, "body": {}}]
+            },
+        )
+
+        responses = outlook_client.batch([
+            {"method": "GET", "url": "/a"},
+            {"method": "GET", "url": "/b"},
+        ])
+
+        assert [response["status"] for response in responses] == [200, 502]
+        assert responses[1]["body"]["error"]["code"] == "MissingBatchResponse"
+
+    def test_empty_reply_raises(self, outlook_client: OutlookClient, monkeypatch):
+        """Test a batch reply without a body raises GraphAPIError."""
+        monkeypatch.setattr(
+            outlook_client,
+            "_make_request",
+            lambda method, endpoint, data=None, params=None: None,
+        )
+
+        with pytest.raises(GraphAPIError):
+            outlook_client.batch([{"method": "GET", "url": "/a"}])
+
+
+class TestBulkTasks:
+    """Tests for batched task operations."""
+
+    def test_create_tasks_reports_per_task_results(
+        self, outlook_client: OutlookClient, monkeypatch
+    ):
+        """Test each created task or error is returned in input order."""
+        def fake_batch(subrequests):
+            assert all(sub["method"] == "POST" for sub in subrequests)
+            return [
+                {"id": "0", "status": 201, "body": {"id": "task-1", "title": "A"}},
+                {
+                    "id": "1",
+                    "status": 400,
+                    "body": {"error": {"code": "BadRequest", "message": "bad"}},
+                },
+            ]
+
+        monkeypatch.setattr(outlook_client, "batch", fake_batch)
+
+        results = outlook_client.create_tasks(
+            "list-1", [OutlookTask(title="A"), OutlookTask(title="B")]
+        )
+
+        assert results[0].id == "task-1"
+        assert isinstance(results[1], GraphAPIError)
+        assert results[1].error_code == "BadRequest"
+
+    def test_update_tasks_sends_minimal_payloads(
+        self, outlook_client: OutlookClient, monkeypatch
+    ):
+        """Test updates are sent as PATCH subrequests with changed fields only."""
+        sent = []
+
+        def fake_batch(subrequests):
+            sent.extend(subrequests)
+            return [
+                {"id": str(i), "status": 200, "body": {"id": sub["url"].rsplit("/", 1)[1]}}
+                for i, sub in enumerate(subrequests)
+            ]
+
+        monkeypatch.setattr(outlook_client, "batch", fake_batch)
+
+        results = outlook_client.update_tasks("list-1", [
+            ("task-1", {"status": TaskStatus.COMPLETED}),
+            ("task-2", {"title": "New title"}),
+        ])
+
+        assert [task.id for task in results] == ["task-1", "task-2"]
+        assert sent[0]["url"] == "/me/todo/lists/list-1/tasks/task-1"
+        assert sent[0]["body"] == {"status": "completed"}
+        assert sent[1]["body"] == {"title": "New title"}
+
+
+class TestParallel:
+    """Tests for concurrent Graph calls."""
+
+    def test_get_tasks_parallel_fetches_pages_by_offset(
+        self, outlook_client: OutlookClient, monkeypatch
+    ):
+        """Test remaining pages are requested by $skip and merged in order."""
+        monkeypatch.setattr(outlook_client, "TASKS_PAGE_SIZE", 2)
+        calls = []
+
+        def fake_request(method, endpoint, data=None, params=None):
+            calls.append(params)
+            skip = params.get("$skip", 0)
+            page = {"value": [{"id": str(i)} for i in range(skip, min(skip + 2, 5))]}
+            if "$count" in params:
+                page["@odata.count"] = 5
+            return page
+
+        monkeypatch.setattr(outlook_client, "_make_request", fake_request)
+
+        tasks = outlook_client.get_tasks_parallel("list-1")
+
+        assert [task.id for task in tasks] == ["0", "1", "2", "3", "4"]
+        assert sorted(p.get("$skip", 0) for p in calls) == [0, 2, 4]
+
+    def test_map_tasks_preserves_order(self, outlook_client: OutlookClient):
+        """Test map_tasks calls fn(list_id, item) and keeps input order."""
+        results = outlook_client.map_tasks(
+            "list-1", ["a", "b", "c"], lambda list_id, item: f"{list_id}/{item}"
+        )
+        assert results == ["list-1/a", "list-1/b", "list-1/c"]
+
+
+class TestTokenCache:
+    """Tests for the shared MSAL token cache."""
+
+    def test_cache_shared_per_path(self, tmp_path):
+        """Test clients for the same cache file share one cache object."""
+        from src.outlook.client import _get_token_cache
+
+        path = tmp_path / "token_cache.json"
+        assert _get_token_cache(path) is _get_token_cache(path)
+        assert _get_token_cache(path) is not _get_token_cache(tmp_path / "other.json")
+
+
+class TestProxy:
+    """Tests for proxy selection from the environment."""
+
+    @pytest.mark.parametrize(
+        ("no_proxy", "proxied"),
+        [("", True), ("graph.microsoft.com", False), (".microsoft.com", False)],
+    )
+    def test_https_proxy_honors_no_proxy(self, monkeypatch, no_proxy: str, proxied: bool):
+        """Test HTTPS_PROXY is used unless NO_PROXY excludes the Graph host."""
+        for name in ("HTTPS_PROXY", "https_proxy", "NO_PROXY", "no_proxy"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("https_proxy", "http://proxy.example.com:3128")
+        monkeypatch.setenv("no_proxy", no_proxy)
+        monkeypatch.setattr(
+            "src.outlook.client.msal.PublicClientApplication",
+            lambda *args, **kwargs: None,
+        )
+
+        client = OutlookClient(client_id="client-id", tenant_id="common")
+
+        assert isinstance(client._pool, urllib3.ProxyManager) is proxied
+        client.close()
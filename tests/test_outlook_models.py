@@ -0,0 +1,66 @@
+"""
+Unit tests for Outlook data models.
+"""
+
+from datetime import date, timezone
+
+from src.outlook.models import CanvasTaskMetadata, OutlookTask, TaskStatus
+
+
+class TestCanvasTaskMetadata:
+    """Tests for task body metadata."""
+
+    def test_round_trip(self):
+        """Test metadata written to a body can be parsed back."""
+        metadata = CanvasTaskMetadata(
+            canvas_course_id=12345,
+            canvas_assignment_id=67890,
+            canvas_url="https://canvas.example.com/courses/12345/assignments/67890",
+        )
+
+        assert CanvasTaskMetadata.from_body_content(metadata.to_body_content()) == metadata
+
+    def test_tolerates_crlf_and_field_order(self):
+        """Test Windows line endings and reordered lines still parse."""
+        content = "URL: https://x.test/a\r\nAssignment ID: 2\r\nCourse ID: 1\r\n"
+
+        metadata = CanvasTaskMetadata.from_body_content(content)
+
+        assert metadata == CanvasTaskMetadata(1, 2, "https://x.test/a")
+
+    def test_missing_or_invalid_ids_return_none(self):
+        """Test bodies without usable IDs are not treated as synced tasks."""
+        assert CanvasTaskMetadata.from_body_content("Just a note") is None
+        assert CanvasTaskMetadata.from_body_content("Course ID: x\nAssignment ID: 2") is None
+        assert CanvasTaskMetadata.from_body_content("Course ID: 1") is None
+
+
+class TestOutlookTaskFromApiResponse:
+    """Tests for parsing Graph task responses."""
+
+    def test_parses_graph_timestamps(self):
+        """Test Z suffixes, dateTimeTimeZone objects and date-only values parse."""
+        task = OutlookTask.from_api_response({
+            "id": "task-1",
+            "dueDateTime": {"dateTime": "2024-01-15T00:00:00", "timeZone": "UTC"},
+            "createdDateTime": "2024-01-01T10:00:00Z",
+            "completedDateTime": {"dateTime": "2024-01-14", "timeZone": "UTC"},
+        })
+
+        assert task.due_date == date(2024, 1, 15)
+        assert task.created_datetime.tzinfo == timezone.utc
+        assert task.completed_datetime.date() == date(2024, 1, 14)
+        assert task.last_modified_datetime is None
+
+    def test_update_payload_only_changed_fields(self):
+        """Test update payloads map field names and ignore unknown keys."""
+        payload = OutlookTask.to_update_payload({
+            "status": TaskStatus.COMPLETED,
+            "due_date": None,
+            "unknown": 1,
+        })
+
+        assert payload == {"status": "completed", "dueDateTime": None}
+        assert OutlookTask.to_update_payload({"status": "inProgress"}) == {
+            "status": "inProgress"
+        }
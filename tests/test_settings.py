@@ -0,0 +1,110 @@
+"""
+Unit tests for configuration loading.
+"""
+
+import os
+import pytest
+from pathlib import Path
+
+from config.settings import (
+    ConfigurationError,
+    _ENV_FILE_CACHE,
+    _ENV_VARS,
+    _load_env_file,
+    _parse_env_file,
+    get_settings,
+)
+
+
+@pytest.fixture
+def clean_env(monkeypatch: pytest.MonkeyPatch):
+    """Isolate os.environ and remove all settings variables from it."""
+    monkeypatch.setattr(os, "environ", os.environ.copy())
+    for name in _ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+@pytest.fixture
+def env_file(tmp_path: Path) -> Path:
+    """Create a minimal valid .env file."""
+    path = tmp_path / ".env"
+    path.write_text(
+        "# Canvas\n"
+        "CANVAS_BASE_URL=https://canvas.example.com/\n"
+        "export CANVAS_ACCESS_TOKEN='secret-token'\n"
+        "\n"
+        'MICROSOFT_CLIENT_ID="client-id"\n'
+        "MICROSOFT_TENANT_ID=common  # inline comment\n"
+    )
+    return path
+
+
+class TestParseEnvFile:
+    """Tests for the .env parser."""
+
+    def test_parses_values(self, env_file: Path):
+        """Test quotes, export prefix and comments are handled."""
+        values = _parse_env_file(env_file)
+        assert values == {
+            "CANVAS_BASE_URL": "https://canvas.example.com/",
+            "CANVAS_ACCESS_TOKEN": "secret-token",
+            "MICROSOFT_CLIENT_ID": "client-id",
+            "MICROSOFT_TENANT_ID": "common",
+        }
+
+
+class TestLoadEnvFile:
+    """Tests for loading .env files into the environment."""
+
+    def test_parsed_file_is_cached(self, clean_env, env_file: Path):
+        """Test the parsed file is cached by path and mtime."""
+        _load_env_file(env_file)
+        mtime_ns, values = _ENV_FILE_CACHE[str(env_file)]
+        assert mtime_ns == env_file.stat().st_mtime_ns
+        assert values["MICROSOFT_CLIENT_ID"] == "client-id"
+
+    def test_reparses_when_file_changes(self, clean_env, env_file: Path):
+        """Test a modified file is parsed again."""
+        _load_env_file(env_file)
+        env_file.write_text("MICROSOFT_CLIENT_ID=other-id\n")
+        os.utime(env_file, ns=(0, env_file.stat().st_mtime_ns + 1_000_000_000))
+        del os.environ["MICROSOFT_CLIENT_ID"]
+
+        _load_env_file(env_file)
+        assert os.environ["MICROSOFT_CLIENT_ID"] == "other-id"
+
+    def test_missing_file_is_ignored(self, clean_env, tmp_path: Path):
+        """Test a missing .env file is not an error."""
+        _load_env_file(tmp_path / "missing.env")
+        assert "CANVAS_BASE_URL" not in os.environ
+
+
+class TestLoadSettings:
+    """Tests for load_settings / get_settings."""
+
+    def test_loads_from_env_file(self, clean_env, env_file: Path):
+        """Test settings are populated from the .env file."""
+        settings = get_settings(env_file)
+        assert settings.canvas.base_url == "https://canvas.example.com"
+        assert settings.canvas.access_token == "secret-token"
+        assert settings.microsoft.tenant_id == "common"
+
+    def test_environment_takes_precedence(
+        self, clean_env, env_file: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test existing environment variables are not overwritten."""
+        monkeypatch.setenv("MICROSOFT_TENANT_ID", "my-tenant")
+        settings = get_settings(env_file)
+        assert settings.microsoft.tenant_id == "my-tenant"
+
+    def test_result_is_cached(self, clean_env, env_file: Path):
+        """Test repeated calls return the same instance."""
+        assert get_settings(env_file) is get_settings(env_file)
+
+    def test_missing_config_raises(self, clean_env, tmp_path: Path):
+        """Test missing required values raise ConfigurationError."""
+        with pytest.raises(ConfigurationError):
+            get_settings(tmp_path / "missing.env")
@@ -3,6 +3,8 @@ Unit tests for SQLite state store.
 """
 
 import pytest
+import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -39,14 +41,56 @@ class TestStateStore:
 
     def test_save_updates_synced_at(self, state_store: StateStore, sample_sync_state: SyncState):
         """Test that save updates last_synced_at."""
-        before = datetime.utcnow()
+        before = datetime.now(timezone.utc)
         saved = state_store.save(sample_sync_state)
-        after = datetime.utcnow()
+        after = datetime.now(timezone.utc)
         
         assert saved.last_synced_at is not None
         # Allow 1 second tolerance
         assert before <= saved.last_synced_at <= after
 
+    def test_exists(self, state_store: StateStore, sample_sync_state: SyncState):
+        """Test exists reports stored records, including archived ones."""
+        key = sample_sync_state.unique_key
+        assert state_store.exists(*key) is False
+
+        state_store.save(sample_sync_state)
+        state_store.archive(*key)
+
+        assert state_store.exists(*key) is True
+        assert state_store.exists(99999, 99999) is False
+
+    def test_exists_bypasses_row_cache(
+        self, state_store: StateStore, sample_sync_state: SyncState, temp_db_path: Path
+    ):
+        """Test exists sees a delete made through another connection after get() cached the row."""
+        state_store.save(sample_sync_state)
+        key = sample_sync_state.unique_key
+        assert state_store.get(*key) is not None
+
+        other = sqlite3.connect(temp_db_path)
+        with other:
+            other.execute("DELETE FROM sync_state")
+        other.close()
+
+        assert state_store.exists(*key) is False
+
+    def test_get_many(self, state_store: StateStore, make_states, monkeypatch):
+        """Test get_many fetches each chunk of keys with a single statement."""
+        state_store.save_many(make_states(100))
+        monkeypatch.setattr(StateStore, "GET_MANY_CHUNK_SIZE", 60)
+        statements = []
+        state_store._conn.set_trace_callback(statements.append)
+
+        keys = [(100, 200 + i) for i in range(100)] + [(100, 999)]
+        states = state_store.get_many(keys)
+
+        state_store._conn.set_trace_callback(None)
+        assert len(statements) == 2
+        assert len(states) == 100
+        assert states[100, 250].outlook_task_id == "task-50"
+        assert state_store.get_many([]) == {}
+
     def test_get_by_outlook_task_id(self, state_store: StateStore, sample_sync_state: SyncState):
         """Test retrieving state by Outlook task ID."""
         state_store.save(sample_sync_state)
@@ -61,21 +105,56 @@ class TestStateStore:
         result = state_store.get_all()
         assert result == []
 
-    def test_get_all_returns_all(self, state_store: StateStore):
+    def test_get_all_returns_all(self, state_store: StateStore, make_states):
         """Test get_all returns all non-archived states."""
-        # Create multiple states
-        for i in range(3):
-            state = SyncState(
-                canvas_course_id=100,
-                canvas_assignment_id=200 + i,
-                outlook_task_id=f"task-{i}",
-                last_seen_submission_state="not_submitted",
-            )
-            state_store.save(state)
+        state_store.save_many(make_states(3))
         
         result = state_store.get_all()
         assert len(result) == 3
 
+    def test_iter_all_is_lazy(self, state_store: StateStore):
+        """Test iter_all yields states one at a time in key order."""
+        for i in (2, 0, 1):
+            state_store.save(SyncState(canvas_course_id=100, canvas_assignment_id=200 + i))
+        
+        states = state_store.iter_all()
+        assert next(states).canvas_assignment_id == 200
+        assert [s.canvas_assignment_id for s in states] == [201, 202]
+
+    def test_iter_all_pages_skip_archived(
+        self, state_store: StateStore, make_states, monkeypatch
+    ):
+        """Test iter_all pages through keys and leaves out archived states."""
+        monkeypatch.setattr(StateStore, "FETCH_BATCH_SIZE", 2)
+        state_store.save_many(make_states(5))
+        state_store.archive(100, 202)
+
+        assert [s.canvas_assignment_id for s in state_store.iter_all()] == [200, 201, 203, 204]
+        assert len(list(state_store.iter_all(include_archived=True))) == 5
+
+    def test_reads_wait_for_open_write_transaction(self, state_store: StateStore):
+        """Test a read on another thread never sees an uncommitted write."""
+        inserted = threading.Event()
+        counts = []
+
+        def read():
+            inserted.wait()
+            counts.append(state_store.count())
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        with pytest.raises(RuntimeError):
+            with state_store._write_connection() as conn:
+                conn.execute(
+                    "INSERT INTO sync_state (canvas_course_id, canvas_assignment_id) VALUES (1, 1)"
+                )
+                inserted.set()
+                reader.join(timeout=0.2)
+                raise RuntimeError("roll back")
+        reader.join()
+
+        assert counts == [0]
+
     def test_archive_marks_as_archived(self, state_store: StateStore, sample_sync_state: SyncState):
         """Test archiving an assignment."""
         state_store.save(sample_sync_state)
@@ -101,17 +180,22 @@ class TestStateStore:
         result = state_store.archive(course_id=99999, assignment_id=99999)
         assert result is False
 
-    def test_get_synced_assignment_keys(self, state_store: StateStore):
+    def test_archive_many(self, state_store: StateStore):
+        """Test archive_many updates existing keys in one call and skips unknown ones."""
+        state_store.save_many(
+            SyncState(canvas_course_id=1, canvas_assignment_id=i, outlook_task_id=f"t{i}")
+            for i in range(3)
+        )
+        state_store.get(1, 0)  # cached row must not hide the update
+
+        assert state_store.archive_many([(1, 0), (1, 1), (9, 9)]) == 2
+        assert state_store.get(1, 0).is_archived
+        assert state_store.get_synced_assignment_keys() == {(1, 2)}
+        assert state_store.archive_many([]) == 0
+
+    def test_get_synced_assignment_keys(self, state_store: StateStore, make_states):
         """Test getting synced assignment keys."""
-        # Save some states
-        for i in range(3):
-            state = SyncState(
-                canvas_course_id=100,
-                canvas_assignment_id=200 + i,
-                outlook_task_id=f"task-{i}",
-                last_seen_submission_state="not_submitted",
-            )
-            state_store.save(state)
+        state_store.save_many(make_states(3))
         
         keys = state_store.get_synced_assignment_keys()
         
@@ -138,6 +222,31 @@ class TestStateStore:
         assert state_store.count(include_archived=False) == 0
         assert state_store.count(include_archived=True) == 1
 
+    def test_status_summary(self, state_store: StateStore):
+        """Test aggregate counts for the status display."""
+        for assignment_id, submission_state in [
+            (201, "submitted"),
+            (202, "not_submitted"),
+            (203, "submitted"),
+        ]:
+            state_store.save(SyncState(
+                canvas_course_id=100,
+                canvas_assignment_id=assignment_id,
+                outlook_task_id=f"task-{assignment_id}",
+                last_seen_submission_state=submission_state,
+            ))
+        state_store.archive(course_id=100, assignment_id=203)
+        
+        summary = state_store.status_summary()
+        
+        assert (summary.total, summary.active, summary.archived) == (3, 2, 1)
+        assert (summary.submitted, summary.pending) == (1, 1)
+
+    def test_status_summary_empty(self, state_store: StateStore):
+        """Test summary of an empty store is all zeros."""
+        summary = state_store.status_summary()
+        assert (summary.total, summary.active, summary.submitted) == (0, 0, 0)
+
     def test_clear(self, state_store: StateStore, sample_sync_state: SyncState):
         """Test clearing all state."""
         state_store.save(sample_sync_state)
@@ -171,3 +280,178 @@ class TestStateStore:
         # Should have updated value
         retrieved = state_store.get(course_id=100, assignment_id=200)
         assert retrieved.last_seen_submission_state == "submitted"
+
+    def test_meta_round_trip(self, state_store: StateStore):
+        """Test metadata values can be set, read back and removed."""
+        assert state_store.get_meta("task_list_id:Canvas") is None
+
+        state_store.set_meta("task_list_id:Canvas", "list-1")
+        assert state_store.get_meta("task_list_id:Canvas") == "list-1"
+
+        state_store.set_meta("task_list_id:Canvas", None)
+        assert state_store.get_meta("task_list_id:Canvas") is None
+
+    def test_connection_opened_once(self, state_store: StateStore, sample_sync_state: SyncState):
+        """Test every operation reuses the store's single connection."""
+        conn = state_store._conn
+
+        state_store.save(sample_sync_state)
+        state_store.get(sample_sync_state.canvas_course_id, sample_sync_state.canvas_assignment_id)
+        state_store.count()
+
+        assert state_store._conn is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_pragmas_applied(self, state_store: StateStore):
+        """Test connection tuning is applied once at open."""
+        conn = state_store._conn
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 30000
+        assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+
+    def test_invalid_synchronous_mode_rejected(self, temp_db_path: Path):
+        """Test an unknown synchronous mode is not interpolated into SQL."""
+        with pytest.raises(ValueError):
+            StateStore(temp_db_path, synchronous="NORMAL; DROP TABLE sync_state")
+
+    def test_save_many(self, state_store: StateStore, sample_sync_state: SyncState):
+        """Test many states are saved in one call with shared timestamps."""
+        state_store.save(sample_sync_state)
+        states = [
+            SyncState(canvas_course_id=1, canvas_assignment_id=i, outlook_task_id=f"t{i}")
+            for i in range(3)
+        ] + [sample_sync_state]
+
+        saved = state_store.save_many(states)
+
+        assert state_store.count() == 4
+        assert len({state.last_synced_at for state in saved}) == 1
+        assert saved[-1].created_at == sample_sync_state.created_at
+        assert state_store.get(1, 2).outlook_task_id == "t2"
+
+    def test_save_many_is_atomic(self, state_store: StateStore):
+        """Test a failing row rolls back the whole batch."""
+        states = [
+            SyncState(canvas_course_id=1, canvas_assignment_id=1),
+            SyncState(canvas_course_id=None, canvas_assignment_id=2),  # NOT NULL
+        ]
+
+        with pytest.raises(sqlite3.IntegrityError):
+            state_store.save_many(states)
+
+        assert state_store.count() == 0
+        assert not state_store._conn.in_transaction
+
+    def test_reads_run_outside_transactions(
+        self, state_store: StateStore, sample_sync_state: SyncState
+    ):
+        """Test the connection autocommits and writes leave no open transaction."""
+        state_store.save(sample_sync_state)
+        assert not state_store._conn.in_transaction
+
+        state_store.get_all()
+        state_store.count()
+        assert state_store._conn.isolation_level is None
+        assert not state_store._conn.in_transaction
+
+    def test_migrates_v1_database(self, temp_db_path: Path):
+        """Test a v1 database is rebuilt as WITHOUT ROWID with its rows converted."""
+        conn = sqlite3.connect(temp_db_path)
+        conn.executescript("""
+            CREATE TABLE _metadata (key TEXT PRIMARY KEY, value TEXT);
+            INSERT INTO _metadata VALUES ('schema_version', '1');
+            CREATE TABLE sync_state (
+                canvas_course_id INTEGER NOT NULL,
+                canvas_assignment_id INTEGER NOT NULL,
+                outlook_task_id TEXT,
+                last_seen_submission_state TEXT DEFAULT 'not_submitted',
+                last_seen_due_date TEXT,
+                last_seen_title TEXT,
+                last_synced_at TEXT,
+                is_archived INTEGER DEFAULT 0,
+                created_at TEXT,
+                PRIMARY KEY (canvas_course_id, canvas_assignment_id)
+            );
+            CREATE INDEX idx_outlook_task_id ON sync_state(outlook_task_id);
+            CREATE INDEX idx_is_archived ON sync_state(is_archived);
+            INSERT INTO sync_state (canvas_course_id, canvas_assignment_id, outlook_task_id)
+            VALUES (1, 2, 'task-1');
+            INSERT INTO sync_state (
+                canvas_course_id, canvas_assignment_id, last_seen_submission_state
+            )
+            VALUES (1, 3, 'submitted');
+        """)
+        conn.close()
+
+        store = StateStore(temp_db_path)
+        try:
+            assert store.get(1, 2).outlook_task_id == "task-1"
+            assert store.get(1, 2).last_seen_submission_state == "not_submitted"
+            assert store.get(1, 3).last_seen_submission_state == "submitted"
+            assert store.status_summary().submitted == 1
+            assert store.get_meta("schema_version") == str(StateStore.SCHEMA_VERSION)
+            table_sql, = store._conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'sync_state'"
+            ).fetchone()
+            index_sql, = store._conn.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'idx_outlook_task_id'"
+            ).fetchone()
+            assert table_sql.rstrip().endswith("WITHOUT ROWID")
+            assert "WHERE outlook_task_id IS NOT NULL" in index_sql
+            assert store._conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'idx_is_archived'"
+            ).fetchone() is None
+        finally:
+            store.close()
+
+    def test_get_changed_states(self, state_store: StateStore):
+        """Test only unsynced or changed assignments are returned."""
+        state_store.save_many([
+            SyncState(1, 1, "t1", "submitted", "2026-01-20", "Same"),
+            SyncState(1, 2, "t2", "not_submitted", "2026-01-20", "Old title"),
+            SyncState(1, 3, "t3", "not_submitted", None, "Due"),
+            SyncState(1, 4, None, "not_submitted", None, "Unsynced"),
+        ])
+
+        changed = state_store.get_changed_states([
+            (1, 1, "Same", "2026-01-20", True),
+            (1, 2, "New title", "2026-01-20", False),
+            (1, 3, "Due", "2026-02-01", False),
+            (1, 4, "Unsynced", None, False),
+            (1, 5, "New", None, False),
+        ])
+
+        assert [(course, assignment) for course, assignment, _ in changed] == [
+            (1, 2), (1, 3), (1, 4), (1, 5),
+        ]
+        assert changed[0][2].last_seen_title == "Old title"
+        assert changed[3][2] is None
+        # The temp table is emptied again
+        assert state_store.get_changed_states([]) == []
+
+    def test_get_served_from_row_cache(self, state_store: StateStore, sample_sync_state: SyncState):
+        """Test saved rows are read back without SQL and stay independent."""
+        state_store.save(sample_sync_state)
+        key = sample_sync_state.unique_key
+        statements = []
+        state_store._conn.set_trace_callback(statements.append)
+
+        first = state_store.get(*key)
+        first.last_seen_title = "mutated"
+        second = state_store.get(*key)
+
+        assert statements == []
+        assert second.last_seen_title == sample_sync_state.last_seen_title
+
+        state_store.archive(*key)
+        assert state_store.get(*key).is_archived is True
+
+    def test_json_bytes_round_trip(self, sample_sync_state: SyncState):
+        """Test JSON export restores an equal state."""
+        sample_sync_state.last_synced_at = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        sample_sync_state.is_archived = True
+
+        data = sample_sync_state.to_json_bytes()
+
+        assert isinstance(data, bytes)
+        assert SyncState.from_json_bytes(data) == sample_sync_state
@@ -15,25 +15,37 @@ class TestChangeType:
 
     def test_no_change_is_falsy(self):
         """Test NO_CHANGE evaluates appropriately."""
-        assert ChangeType.NO_CHANGE.value == "no_change"
+        assert not ChangeType.NO_CHANGE
 
     def test_create_exists(self):
-        """Test CREATE change type."""
-        assert ChangeType.CREATE.value == "create"
+        """Test the create (new assignment) change type."""
+        assert ChangeType.NEW_ASSIGNMENT == 1
 
 
 class TestDiffResult:
     """Tests for DiffResult dataclass."""
 
-    def test_requires_action_for_create(self):
-        """Test that CREATE requires action."""
-        diff = DiffResult(change_type=ChangeType.CREATE)
-        assert diff.requires_action is True
+    def test_requires_action_for_create(self, sample_assignment: Assignment):
+        """Test that a new assignment requires action."""
+        diff = DiffResult(sample_assignment, None, changes=ChangeType.NEW_ASSIGNMENT)
+        assert diff.needs_update is True
+        assert diff.is_new is True
 
-    def test_no_action_for_no_change(self):
+    def test_no_action_for_no_change(self, sample_assignment: Assignment):
         """Test that NO_CHANGE doesn't require action."""
-        diff = DiffResult(change_type=ChangeType.NO_CHANGE)
-        assert diff.requires_action is False
+        diff = DiffResult(sample_assignment, None)
+        assert diff.changes == ChangeType.NO_CHANGE
+        assert diff.needs_update is False
+
+    def test_changes_combine(self, sample_assignment: Assignment):
+        """Test several changes are held in one mask."""
+        diff = DiffResult(
+            sample_assignment,
+            None,
+            changes=ChangeType.SUBMITTED | ChangeType.TITLE_CHANGED,
+        )
+        assert diff.needs_completion_change is True
+        assert diff.change_names == ["SUBMITTED", "TITLE_CHANGED"]
 
 
 class TestComputeDiff:
@@ -61,10 +73,13 @@ class TestComputeDiff:
 
     def test_new_assignment_returns_create(self, base_assignment: Assignment):
         """Test that new assignment returns CREATE diff."""
-        diff = compute_diff(assignment=base_assignment, stored_state=None)
+        diff = compute_diff(assignment=base_assignment, state=None)
         
-        assert diff.change_type == ChangeType.CREATE
-        assert diff.requires_action is True
+        assert diff.changes == ChangeType.NEW_ASSIGNMENT
+        assert diff.needs_update is True
+        assert diff.new_title == "[CS101] Test Assignment"
+        assert diff.new_due_date == date(2026, 1, 20)
+        assert diff.new_submission_state == "not_submitted"
 
     def test_no_change_when_identical(self, base_assignment: Assignment):
         """Test NO_CHANGE when assignment matches stored state."""
@@ -77,10 +92,10 @@ class TestComputeDiff:
             last_seen_title="[CS101] Test Assignment",
         )
         
-        diff = compute_diff(assignment=base_assignment, stored_state=stored)
+        diff = compute_diff(assignment=base_assignment, state=stored)
         
-        assert diff.change_type == ChangeType.NO_CHANGE
-        assert diff.requires_action is False
+        assert diff.changes == ChangeType.NO_CHANGE
+        assert diff.needs_update is False
 
     def test_submission_change_detected(self, base_assignment: Assignment):
         """Test submission state change detection."""
@@ -111,11 +126,11 @@ class TestComputeDiff:
             last_seen_title="[CS101] Test Assignment",
         )
         
-        diff = compute_diff(assignment=submitted_assignment, stored_state=stored)
+        diff = compute_diff(assignment=submitted_assignment, state=stored)
         
-        assert diff.change_type == ChangeType.COMPLETE
-        assert diff.requires_action is True
-        assert diff.submission_changed is True
+        assert diff.changes == ChangeType.SUBMITTED
+        assert diff.needs_completion_change is True
+        assert diff.new_submission_state == "submitted"
 
     def test_due_date_change_detected(self, base_assignment: Assignment):
         """Test due date change detection."""
@@ -128,10 +143,10 @@ class TestComputeDiff:
             last_seen_title="[CS101] Test Assignment",
         )
         
-        diff = compute_diff(assignment=base_assignment, stored_state=stored)
+        diff = compute_diff(assignment=base_assignment, state=stored)
         
-        assert diff.change_type == ChangeType.UPDATE
-        assert diff.due_date_changed is True
+        assert diff.changes == ChangeType.DUE_DATE_CHANGED
+        assert diff.new_due_date == date(2026, 1, 20)
 
     def test_title_change_detected(self, base_assignment: Assignment):
         """Test title change detection."""
@@ -144,10 +159,10 @@ class TestComputeDiff:
             last_seen_title="[CS101] Old Title",  # Different title
         )
         
-        diff = compute_diff(assignment=base_assignment, stored_state=stored)
+        diff = compute_diff(assignment=base_assignment, state=stored)
         
-        assert diff.change_type == ChangeType.UPDATE
-        assert diff.title_changed is True
+        assert diff.changes == ChangeType.TITLE_CHANGED
+        assert diff.new_title == "[CS101] Test Assignment"
 
     def test_reopen_when_unsubmitted_again(self):
         """Test REOPEN when submission removed."""
@@ -177,7 +192,8 @@ class TestComputeDiff:
             last_seen_title="[CS101] Test Assignment",
         )
         
-        diff = compute_diff(assignment=assignment, stored_state=stored)
+        diff = compute_diff(assignment=assignment, state=stored)
         
-        assert diff.change_type == ChangeType.REOPEN
-        assert diff.requires_action is True
+        assert diff.changes == ChangeType.UNSUBMITTED
+        assert diff.needs_completion_change is True
+        assert diff.new_submission_state == "not_submitted"
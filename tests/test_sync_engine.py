@@ -0,0 +1,334 @@
+"""
+Unit tests for the sync engine.
+"""
+
+import dataclasses
+
+import pytest
+
+from src.canvas.models import Assignment, Course, CourseAssignments
+from src.outlook.client import GraphAPIError
+from src.outlook.models import OutlookTask, TaskList
+from src.storage.state_store import StateStore
+from src.sync.engine import SyncEngine
+
+
+class FakeCanvas:
+    """Canvas client returning fixed assignments, all tagged with one ETag."""
+
+    def __init__(self, assignments: list[Assignment], etag: str = None):
+        self.assignments = assignments
+        self.etag = etag
+
+    def get_all_course_assignments(self, etags=None) -> list[CourseAssignments]:
+        etags = etags or {}
+        by_course = {}
+        for assignment in self.assignments:
+            by_course.setdefault(assignment.course_id, []).append(assignment)
+
+        results = []
+        for course_id, assignments in by_course.items():
+            course = Course(id=course_id, name="Course", code="C1", enrollment_state="active")
+            if self.etag and etags.get(course_id) == self.etag:
+                results.append(CourseAssignments(course, None, self.etag))
+            else:
+                results.append(CourseAssignments(course, assignments, self.etag))
+        return results
+
+
+class FakeOutlook:
+    """Outlook client recording list lookups and batched task creation."""
+
+    def __init__(self, list_id: str = "list-1"):
+        self.list_id = list_id
+        self.lookups = 0
+        self.created = []
+        self.batches = []
+        self.updated = []
+
+    def get_or_create_task_list(self, name: str) -> TaskList:
+        self.lookups += 1
+        return TaskList(id=self.list_id, display_name=name)
+
+    def create_tasks(self, list_id: str, tasks: list[OutlookTask]) -> list:
+        self.batches.append(len(tasks))
+        if list_id != self.list_id:
+            return [GraphAPIError("list not found", status_code=404) for _ in tasks]
+        results = []
+        for task in tasks:
+            self.created.append((list_id, task.title))
+            results.append(OutlookTask(title=task.title, id=f"task-{len(self.created)}"))
+        return results
+
+    def update_tasks(self, list_id: str, updates: list[tuple[str, dict]]) -> list:
+        self.updated.extend(updates)
+        return [OutlookTask(title="", id=task_id) for task_id, _ in updates]
+
+
+@pytest.fixture
+def make_engine(state_store: StateStore):
+    """Build a SyncEngine around fake clients and a real state store."""
+    def factory(assignments, outlook: FakeOutlook) -> SyncEngine:
+        if not isinstance(assignments, FakeCanvas):
+            assignments = FakeCanvas(assignments)
+        return SyncEngine(
+            canvas_client=assignments,
+            outlook_client=outlook,
+            state_store=state_store,
+            retry_delay=0,
+        )
+    return factory
+
+
+class TestTaskListResolution:
+    """Tests for resolving the Outlook task list."""
+
+    def test_list_id_reused_across_runs(self, make_engine, state_store: StateStore):
+        """Test the resolved list ID is stored and later runs skip the lookup."""
+        outlook = FakeOutlook()
+
+        make_engine([], outlook).sync()
+        make_engine([], outlook).sync()
+
+        assert outlook.lookups == 1
+        assert state_store.get_meta("task_list_id:Canvas Assignments") == "list-1"
+
+    def test_stale_list_id_resolved_again(
+        self, make_engine, state_store: StateStore, sample_assignment: Assignment
+    ):
+        """Test a 404 on a cached list ID re-resolves the list and retries."""
+        state_store.set_meta("task_list_id:Canvas Assignments", "deleted-list")
+        outlook = FakeOutlook(list_id="list-2")
+
+        stats = make_engine([sample_assignment], outlook).sync()
+
+        assert stats.created == 1
+        assert stats.errors == 0
+        assert outlook.lookups == 1
+        assert outlook.created[0][0] == "list-2"
+        assert state_store.get_meta("task_list_id:Canvas Assignments") == "list-2"
+
+
+    def test_stale_list_id_resolved_once_across_workers(
+        self, make_engine, state_store: StateStore, sample_assignment: Assignment
+    ):
+        """Test concurrent 404s on a cached list ID trigger a single lookup."""
+        state_store.set_meta("task_list_id:Canvas Assignments", "deleted-list")
+        outlook = FakeOutlook(list_id="list-2")
+        assignments = [
+            dataclasses.replace(sample_assignment, id=sample_assignment.id + i)
+            for i in range(20)
+        ]
+
+        stats = make_engine(assignments, outlook).sync()
+
+        assert (stats.created, stats.errors) == (20, 0)
+        assert outlook.lookups == 1
+        assert outlook.batches == [20, 20]
+        assert {list_id for list_id, _ in outlook.created} == {"list-2"}
+
+
+class TestSync:
+    """Tests for a full sync run."""
+
+    def test_unchanged_assignments_skipped(
+        self, make_engine, sample_assignment: Assignment
+    ):
+        """Test a second run with no Canvas changes touches nothing."""
+        outlook = FakeOutlook()
+        make_engine([sample_assignment], outlook).sync()
+
+        stats = make_engine([sample_assignment], outlook).sync()
+
+        assert len(outlook.created) == 1
+        assert (stats.created, stats.skipped, stats.errors) == (0, 1, 0)
+
+    def test_states_saved_in_batches(
+        self, make_engine, state_store: StateStore, sample_assignment: Assignment, monkeypatch
+    ):
+        """Test created states are written with save_many, including a partial batch."""
+        monkeypatch.setattr(SyncEngine, "BATCH_SIZE", 1)
+        monkeypatch.setattr(SyncEngine, "STATE_FLUSH_SIZE", 2)
+        batches = []
+        save_many = state_store.save_many
+
+        def recording_save_many(states):
+            batches.append(len(states))
+            return save_many(states)
+
+        monkeypatch.setattr(state_store, "save_many", recording_save_many)
+        assignments = [
+            dataclasses.replace(sample_assignment, id=sample_assignment.id + i)
+            for i in range(5)
+        ]
+
+        make_engine(assignments, FakeOutlook()).sync()
+
+        assert batches == [2, 2, 1]
+        assert len(state_store.get_synced_assignment_keys()) == 5
+
+    def test_failed_state_save_keeps_created_tasks(
+        self, make_engine, state_store: StateStore, sample_assignment: Assignment, monkeypatch
+    ):
+        """Test a failing flush stops queued chunks and later saves every created task."""
+        monkeypatch.setattr(SyncEngine, "BATCH_SIZE", 1)
+        monkeypatch.setattr(SyncEngine, "STATE_FLUSH_SIZE", 1)
+        save_many = state_store.save_many
+        calls = []
+
+        def flaky_save_many(states):
+            calls.append(len(states))
+            if len(calls) == 1:
+                raise RuntimeError("disk full")
+            return save_many(states)
+
+        monkeypatch.setattr(state_store, "save_many", flaky_save_many)
+        outlook = FakeOutlook()
+        assignments = [
+            dataclasses.replace(sample_assignment, id=sample_assignment.id + i)
+            for i in range(50)
+        ]
+
+        with pytest.raises(RuntimeError):
+            make_engine(assignments, outlook).sync()
+
+        assert len(calls) == 2
+        assert len(state_store.get_synced_assignment_keys()) == len(outlook.created)
+
+    def test_creates_sent_in_graph_batches(
+        self, make_engine, sample_assignment: Assignment
+    ):
+        """Test new assignments are created 20 per batch call."""
+        outlook = FakeOutlook()
+        assignments = [
+            dataclasses.replace(sample_assignment, id=sample_assignment.id + i)
+            for i in range(45)
+        ]
+
+        stats = make_engine(assignments, outlook).sync()
+
+        assert sorted(outlook.batches) == [5, 20, 20]
+        assert (stats.created, stats.errors) == (45, 0)
+
+    def test_changed_title_updates_task(
+        self, make_engine, state_store: StateStore, sample_assignment: Assignment
+    ):
+        """Test a renamed assignment sends only the new title and saves it."""
+        outlook = FakeOutlook()
+        make_engine([sample_assignment], outlook).sync()
+        renamed = dataclasses.replace(sample_assignment, name="Homework 1 (revised)")
+
+        stats = make_engine([renamed], outlook).sync()
+
+        assert stats.updated == 1
+        assert outlook.updated == [("task-1", {"title": renamed.display_title})]
+        assert state_store.get(*renamed.unique_key).last_seen_title == renamed.display_title
+
+    def test_removed_assignment_archived(
+        self, make_engine, state_store: StateStore, sample_assignment: Assignment
+    ):
+        """Test an assignment missing from Canvas is archived, not left active."""
+        other = dataclasses.replace(sample_assignment, id=sample_assignment.id + 1)
+        outlook = FakeOutlook()
+        make_engine([sample_assignment, other], outlook).sync()
+
+        stats = make_engine([sample_assignment], outlook).sync()
+
+        assert stats.archived == 1
+        assert state_store.get(*other.unique_key).is_archived
+        assert state_store.get_synced_assignment_keys() == {sample_assignment.unique_key}
+
+    def test_removed_due_date_saved(
+        self, make_engine, state_store: StateStore, sample_assignment: Assignment
+    ):
+        """Test clearing a due date is stored, so the next run sees no change."""
+        outlook = FakeOutlook()
+        make_engine([sample_assignment], outlook).sync()
+        undated = dataclasses.replace(sample_assignment, due_at=None)
+
+        make_engine([undated], outlook).sync()
+        stats = make_engine([undated], outlook).sync()
+
+        assert outlook.updated == [("task-1", {"due_date": None})]
+        assert state_store.get(*undated.unique_key).last_seen_due_date is None
+        assert (stats.updated, stats.skipped) == (0, 1)
+
+
+class FailingOutlook(FakeOutlook):
+    """Outlook client whose task creation always fails."""
+
+    def create_tasks(self, list_id: str, tasks: list[OutlookTask]) -> list:
+        return [GraphAPIError("server error", status_code=500) for _ in tasks]
+
+
+class TestCourseETags:
+    """Tests for skipping unchanged courses by ETag."""
+
+    def test_unchanged_course_skipped(
+        self, make_engine, state_store: StateStore, sample_assignment: Assignment
+    ):
+        """Test a matching ETag skips the course without archiving its assignments."""
+        canvas = FakeCanvas([sample_assignment], etag='"v1"')
+        outlook = FakeOutlook()
+        make_engine(canvas, outlook).sync()
+        assert state_store.get_course_etags() == {sample_assignment.course_id: '"v1"'}
+
+        stats = make_engine(canvas, outlook).sync()
+
+        assert (stats.total_assignments, stats.created, stats.archived) == (0, 0, 0)
+        assert stats.unchanged_courses == 1
+        assert sample_assignment.unique_key in state_store.get_synced_assignment_keys()
+
+    def test_course_with_errors_keeps_no_etag(
+        self, make_engine, state_store: StateStore, sample_assignment: Assignment
+    ):
+        """Test a course whose assignments failed is fetched in full next time."""
+        canvas = FakeCanvas([sample_assignment], etag='"v1"')
+
+        stats = make_engine(canvas, FailingOutlook()).sync()
+
+        assert stats.errors == 1
+        assert state_store.get_course_etags() == {}
+
+
+class TestRetry:
+    """Tests for retry backoff."""
+
+    def test_retry_after_honored_and_capped(self, make_engine):
+        """Test a Retry-After hint replaces the backoff but not past max_backoff."""
+        engine = make_engine([], FakeOutlook())
+        engine.max_backoff = 30.0
+
+        assert engine._retry_delay(GraphAPIError("busy", 503, retry_after=7.0), 0) == 7.0
+        assert engine._retry_delay(GraphAPIError("busy", 429, retry_after=120.0), 0) == 30.0
+
+    def test_backoff_is_jittered(self, make_engine):
+        """Test the exponential backoff varies within half to one and a half times."""
+        engine = make_engine([], FakeOutlook())
+        engine.retry_delay = 1.0
+
+        delays = {engine._retry_delay(GraphAPIError("error", 500), 2) for _ in range(20)}
+
+        assert all(2.0 <= delay <= 6.0 for delay in delays)
+        assert len(delays) > 1
+
+    @pytest.mark.parametrize("status, batches", [(500, 1), (None, 1), (429, 2)])
+    def test_create_batch_resent_only_when_throttled(
+        self, make_engine, sample_assignment: Assignment, status, batches
+    ):
+        """Test a failed create batch is resent only if Graph rejected it unprocessed."""
+        outlook = FakeOutlook()
+        create_tasks = outlook.create_tasks
+
+        def flaky_create_tasks(list_id, tasks):
+            if not outlook.batches:
+                outlook.batches.append(len(tasks))
+                raise GraphAPIError("batch failed", status_code=status)
+            return create_tasks(list_id, tasks)
+
+        outlook.create_tasks = flaky_create_tasks
+
+        stats = make_engine([sample_assignment], outlook).sync()
+
+        assert len(outlook.batches) == batches
+        assert stats.created == (1 if status == 429 else 0)